@@ -0,0 +1,49 @@
+"""Runs many API calls concurrently on a bounded thread pool and returns the results in input order."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.config import TestData
+
+
+class BatchResult:
+    """Outcome of one call of a batch: its value or the exception it raised, and how long it took."""
+
+    def __init__(self, index, item, value=None, error=None, elapsed=0.0):
+        self.index = index
+        self.item = item
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        outcome = f"error={self.error!r}" if self.error else "ok"
+        return f"BatchResult(index={self.index}, {outcome}, elapsed={self.elapsed:.3f}s)"
+
+
+def run_batch(call, items, max_concurrency=None):
+    """
+    Calls call(item) for every item with at most max_concurrency calls in flight.
+    One failing call does not stop the others; its exception is kept on its BatchResult.
+
+    Returns:
+        list[BatchResult]: One result per item, in the order of items.
+    """
+    items = list(items)
+    if not items:
+        return []
+    workers = min(max_concurrency or TestData.API_BATCH_CONCURRENCY, len(items))
+
+    def timed(index, item):
+        start = time.perf_counter()
+        try:
+            return BatchResult(index, item, value=call(item), elapsed=time.perf_counter() - start)
+        except Exception as e:
+            return BatchResult(index, item, error=e, elapsed=time.perf_counter() - start)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-batch") as executor:
+        futures = [executor.submit(timed, index, item) for index, item in enumerate(items)]
+        return [future.result() for future in futures]
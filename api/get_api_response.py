@@ -1,12 +1,36 @@
+from contextlib import closing
+
 import requests
-from requests.exceptions import RequestException, Timeout, HTTPError
+from requests.exceptions import RequestException
 from config.config import TestData
+from api.batch import run_batch
+from api.http_client import get_client
+from api.json_stream import find_in_container, stream_values
+from api.response_cache import get_response_cache
 
 
 class GetApiData:
-    def get_data(self, end_point,container, key):
+    def __init__(self, cache=None):
+        """
+        Args:
+            cache (bool | ResponseCache): True to serve get_data from the session-wide response cache,
+                or a ResponseCache of its own; by default every call goes to the server.
+        """
+        self.cache = get_response_cache() if cache is True else cache or None
+
+    def get_data(self, end_point,container, key, stream=False):
+        """
+        Returns the key of the first item of the response's container (or container[key] for an object).
+        With stream=True the body is parsed as it arrives and the download stops at the first match.
+        """
         try:
-            response = requests.get(TestData.BASE_URL +end_point)
+            if self.cache is not None:
+                return self.cache.lookup(get_client(), TestData.BASE_URL + end_point, container, key)
+            if stream:
+                with closing(get_client().get(TestData.BASE_URL + end_point, stream=True)) as response:
+                    assert response.status_code == 200
+                    return find_in_container(response.iter_content(TestData.API_STREAM_CHUNK_SIZE), container, key)
+            response = get_client().get(TestData.BASE_URL +end_point)
             assert response.status_code == 200
 
             data = response.json() # convert response to json
@@ -34,7 +58,7 @@ class GetApiData:
             headers (dict): Optional request headers.
             params (dict): Optional query parameters.
             timeout (int): Request timeout in seconds (default 10).
-            retries (int): Number of retry attempts for failed requests.
+            retries (int): Attempts for connection errors, timeouts and 429/5xx responses, with backoff.
 
         Returns:
             dict: JSON response data if successful.
@@ -42,19 +66,59 @@ class GetApiData:
         Raises:
             AssertionError: If the request fails after retries.
         """
-        for attempt in range(1, retries + 1):
-            try:
-                response = requests.get(url, headers=headers, params=params, timeout=timeout)
-                response.raise_for_status()  # Raises HTTPError for 4xx/5xx status codes
+        try:
+            # pooled keep-alive connection; retries back off exponentially inside the client
+            response = get_client().get(url, headers=headers, params=params, timeout=timeout, retries=retries)
+            response.raise_for_status()  # Raises HTTPError for 4xx/5xx status codes
+
+            print(f"✅ GET request successful: {response.status_code}")
+            return response.json()
+
+        except RequestException as e:
+            print(f"❌ Request error: {e}")
+
+        raise AssertionError(f"❌ GET request failed after {retries} attempts for URL: {url}")
+
+    @staticmethod
+    def get_many(urls, headers=None, params=None, timeout=10, retries=3, max_concurrency=None):
+        """
+        Runs execute_get_request for every URL concurrently (at most max_concurrency at a time,
+        TestData.API_BATCH_CONCURRENCY by default).
 
-                print(f"✅ GET request successful on attempt {attempt}: {response.status_code}")
-                return response.json()
+        Returns:
+            list[BatchResult]: In the order of urls; .value is the JSON body, .error the failure if any,
+            .elapsed the time that request took.
+        """
+        return run_batch(lambda url: GetApiData.execute_get_request(url, headers=headers, params=params,
+                                                                    timeout=timeout, retries=retries),
+                         urls, max_concurrency)
 
-            except (Timeout, HTTPError) as e:
-                print(f"⚠️ Attempt {attempt} failed: {e}")
+    @staticmethod
+    def stream_values(url, path, headers=None, params=None, timeout=10):
+        """
+        Yields the values at path ("data[*].email", "support.url", ...) while the response is still downloading.
+        Stop iterating early and the rest of the body is never read.
+        """
+        with closing(get_client().get(url, headers=headers, params=params, timeout=timeout, stream=True)) as response:
+            response.raise_for_status()
+            yield from stream_values(response.iter_content(TestData.API_STREAM_CHUNK_SIZE), path)
 
-            except RequestException as e:
-                print(f"❌ Request error on attempt {attempt}: {e}")
-                break  # Exit loop for network-related issues
+    @staticmethod
+    def paginate(url, path, params=None, page_param="page", start_page=1, max_pages=None, headers=None, timeout=10):
+        """
+        Follows ?page=1, 2, ... and yields the values at path of every page, one page in flight at a time,
+        until a page has none (or max_pages were read).
 
-        raise AssertionError(f"❌ GET request failed after {retries} attempts for URL: {url}")
\ No newline at end of file
+        Example:
+            emails = GetApiData.paginate(TestData.API_BASE_URL + "/api/users", "data[*].email")
+        """
+        page = start_page
+        while max_pages is None or page < start_page + max_pages:
+            found = False
+            for value in GetApiData.stream_values(url, path, headers=headers,
+                                                  params={**(params or {}), page_param: page}, timeout=timeout):
+                found = True
+                yield value
+            if not found:
+                return
+            page += 1
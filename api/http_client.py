@@ -0,0 +1,208 @@
+"""
+Shared HTTP client for the api helpers: pooled keep-alive connections, retries with exponential backoff
+and jitter, and a per-host circuit breaker so a struggling backend is not hammered.
+"""
+import contextlib
+import math
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
+
+from config.config import TestData
+from utils.timing import timings
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class CircuitOpenError(RequestException):
+    """Raised instead of sending a request while the circuit for that host is open."""
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures and rejects calls for reset_timeout seconds,
+    then lets a single trial request through (half-open) before closing again.
+    """
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.reset_timeout else "open"
+
+    def allow(self):
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class HttpClient:
+    """
+    A requests.Session with a sized connection pool, shared by every api helper through get_client().
+
+    Args:
+        pool_connections (int): Number of hosts whose connections are pooled.
+        pool_maxsize (int): Keep-alive connections kept per host.
+        retries (int): Attempts for idempotent requests (POST/PATCH are sent once unless retries is given).
+        backoff_base (float): First backoff in seconds, doubled per attempt, with full jitter.
+        backoff_max (float): Upper bound of a single backoff.
+        circuit_breaker (bool): False never opens a circuit, e.g. for a load run that must see every error.
+    """
+
+    def __init__(self, pool_connections=None, pool_maxsize=None, retries=None, backoff_base=None,
+                 backoff_max=None, failure_threshold=None, reset_timeout=None, circuit_breaker=True):
+        self.retries = _attempts(retries if retries is not None else TestData.API_RETRIES)
+        self.backoff_base = backoff_base if backoff_base is not None else TestData.API_BACKOFF_BASE
+        self.backoff_max = backoff_max if backoff_max is not None else TestData.API_BACKOFF_MAX
+        self.failure_threshold = failure_threshold or TestData.API_CIRCUIT_FAILURE_THRESHOLD
+        if not circuit_breaker:
+            self.failure_threshold = math.inf  # consecutive failures never open a circuit
+        self.reset_timeout = reset_timeout if reset_timeout is not None else TestData.API_CIRCUIT_RESET_SECONDS
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections or TestData.API_POOL_CONNECTIONS,
+                              pool_maxsize=pool_maxsize or TestData.API_POOL_MAXSIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._breakers = {}
+        self._breakers_lock = threading.Lock()
+
+    def request(self, method, url, retries=None, timeout=None, **kwargs):
+        """
+        Sends a request, retrying connection errors, timeouts and 429/5xx responses with backoff.
+
+        Returns:
+            Response: The last response; a retryable status that never recovered is returned as is,
+            so callers keep using raise_for_status().
+
+        Raises:
+            ValueError: If retries is below 1 (it counts attempts, the first one included).
+            CircuitOpenError: If the host's circuit is open.
+            RequestException: If every attempt failed without a response.
+        """
+        method = method.upper()
+        if retries is None:
+            retries = self.retries if method in IDEMPOTENT_METHODS else 1
+        retries = _attempts(retries)
+        breaker = self.breaker_for(url)
+        last_error = None
+        for attempt in range(1, retries + 1):
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {urlsplit(url).netloc}; not sending {method} {url}")
+            retry_after = None
+            try:
+                response = self.session.request(method, url, timeout=timeout or TestData.API_TIMEOUT, **kwargs)
+            except (ConnectionError, Timeout) as e:
+                breaker.record_failure()
+                last_error = e
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                if attempt == retries:
+                    return response
+                last_error = HTTPError(f"{response.status_code} for {url}", response=response)
+                retry_after = response.headers.get("Retry-After")
+                response.close()  # hands the connection back to the pool, even for stream=True
+            if attempt < retries:
+                print(f"⚠️ Attempt {attempt} of {method} {url} failed: {last_error}")
+                delay = self.backoff(attempt, retry_after)
+                with timings.waiting(f"retry backoff {method} {url}", mode="local"):
+                    time.sleep(delay)
+        raise last_error
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def backoff(self, attempt, retry_after=None):
+        """Full-jitter exponential backoff; a numeric Retry-After header from the server wins."""
+        if retry_after is not None and str(retry_after).isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def breaker_for(self, url):
+        host = urlsplit(url).netloc
+        with self._breakers_lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._breakers[host]
+
+    def close(self):
+        self.session.close()
+
+
+def _attempts(retries):
+    if retries < 1:
+        raise ValueError(f"retries counts attempts and must be at least 1, got {retries}")
+    return retries
+
+
+_client = None
+_client_lock = threading.Lock()
+_thread_client = threading.local()
+
+
+def get_client():
+    """The HttpClient used by every api helper: the one of using_client() on this thread, else the session-wide one."""
+    client = getattr(_thread_client, "client", None)
+    if client is not None:
+        return client
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+
+@contextlib.contextmanager
+def using_client(client):
+    """Sends the api helpers' requests on this thread through client instead of the session-wide one."""
+    previous = getattr(_thread_client, "client", None)
+    _thread_client.client = client
+    try:
+        yield client
+    finally:
+        _thread_client.client = previous
+
+
+def close_client():
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -0,0 +1,235 @@
+"""
+Incremental JSON extraction: walks a response body chunk by chunk and stops at the first match, so only
+the value being returned (one list item at most) is ever held in memory.
+
+Paths are dotted keys with list indexes or * wildcards: "data.0.email", "data[*].email", "support.url".
+"""
+import codecs
+import json
+import re
+
+WHITESPACE = " \t\n\r"
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# everything up to the next bracket (whole strings included), then the bracket, or the start of a string
+# cut off by the chunk boundary
+_SKIP_TOKEN = re.compile(r'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*([{}\[\]]|")', re.DOTALL)
+_NUMBER_START = "-0123456789"
+_NUMBER_CHARS = re.compile(r"[-+0-9.eE]*")
+
+
+class _Reader:
+    """A cursor over JSON text arriving in chunks (str or UTF-8 bytes); consumed text is dropped as it goes."""
+
+    def __init__(self, chunks, compact_at=65536):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._compact_at = compact_at
+        self.buffer = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def _fill(self):
+        """Appends the next chunk; False once the body is exhausted."""
+        if self.exhausted:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self.exhausted = True
+            self.buffer += self._utf8.decode(b"", final=True)
+            return False
+        self.buffer += self._utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+        return True
+
+    def _compact(self):
+        if self.pos >= self._compact_at:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+
+    def peek(self):
+        """The next non-whitespace character, or "" at the end of the body."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            self._compact()
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON body, found {found or 'end of body'!r}")
+        self.pos += 1
+
+    def read_string(self):
+        start = self._skip_string()
+        return json.loads(self.buffer[start:self.pos])
+
+    def _skip_string(self):
+        """Moves past the string at the cursor and returns where it started."""
+        self.expect('"')
+        start = self.pos - 1
+        while True:
+            match = _STRING_BODY.match(self.buffer, self.pos)
+            if match:
+                self.pos = match.end()
+                return start
+            if not self._fill():
+                raise ValueError("Unterminated string in JSON body")
+
+    def read_value(self):
+        """Decodes the next complete value (a scalar, or a whole object/list)."""
+        first = self.peek()
+        if first and first in _NUMBER_START:
+            # "1." or "2e" decode as a shorter number: only decode once a delimiter (or the end) follows it
+            while _NUMBER_CHARS.match(self.buffer, self.pos).end() == len(self.buffer) and self._fill():
+                pass
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill_to(2 * (len(self.buffer) - self.pos)):
+                    raise
+                continue
+            self.pos = end
+            return value
+
+    def _fill_to(self, size):
+        """Reads until size characters are pending, so a large value is not re-decoded once per chunk."""
+        if not self._fill():
+            return False
+        while len(self.buffer) - self.pos < size and self._fill():
+            pass
+        return True
+
+    def skip_value(self):
+        """Steps over the next value without decoding it."""
+        first = self.peek()
+        if first == '"':
+            self._skip_string()
+        elif first in "{[":
+            depth = 0
+            while True:
+                match = _SKIP_TOKEN.match(self.buffer, self.pos)
+                if match is None or match.group(1) == '"':
+                    self.pos = len(self.buffer) if match is None else match.start(1)
+                    self._compact()
+                    if not self._fill():
+                        raise ValueError("Unexpected end of JSON body")
+                    continue
+                self.pos = match.end()
+                token = match.group(1)
+                if token in "{[":
+                    depth += 1
+                elif token in "}]":
+                    depth -= 1
+                    if depth == 0:
+                        return
+        else:
+            self.read_value()
+
+    def members(self):
+        """Yields the keys of the object at the cursor; the caller reads or skips each value before resuming."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            name = self.read_string()
+            self.expect(":")
+            yield name
+            self._compact()
+            if self._end_of("}"):
+                return
+
+    def elements(self):
+        """Yields the indexes of the list at the cursor; the caller reads or skips each item before resuming."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            self._compact()
+            if self._end_of("]"):
+                return
+
+    def _end_of(self, closing):
+        char = self.peek()
+        self.pos += 1
+        if char == ",":
+            return False
+        if char == closing:
+            return True
+        raise ValueError(f"Expected ',' or {closing!r} in JSON body, found {char or 'end of body'!r}")
+
+
+def parse_path(path):
+    """ "data[*].email" / "$.data.*.email" -> ["data", "*", "email"] """
+    path = path[1:] if path.startswith("$") else path
+    return [segment for segment in path.replace("[", ".").replace("]", "").split(".") if segment]
+
+
+def stream_values(chunks, path):
+    """Yields every value matching path, in document order, reading no further than needed for the next one."""
+    reader = _Reader(chunks)
+    yield from _walk(reader, parse_path(path) if isinstance(path, str) else list(path))
+
+
+def first_value(chunks, path, default=None):
+    """The first value matching path; the rest of the body is never read."""
+    return next(stream_values(chunks, path), default)
+
+
+def find_in_container(chunks, container, key):
+    """
+    Streaming equivalent of GetApiData.get_data's lookup: the key of the first item of body[container] holding it
+    when the container is a list, or body[container][key] when it is an object.
+    """
+    reader = _Reader(chunks)
+    if reader.peek() != "{":
+        return None
+    for name in reader.members():
+        if name != container:
+            reader.skip_value()
+            continue
+        section = reader.peek()
+        if section == "[":
+            for _ in reader.elements():
+                item = reader.read_value()  # one item in memory at a time
+                if isinstance(item, dict) and key in item:
+                    return item[key]
+        elif section == "{":
+            for item_key in reader.members():
+                if item_key == key:
+                    return reader.read_value()
+                reader.skip_value()
+        return None
+    return None
+
+
+def _walk(reader, segments):
+    if not segments:
+        yield reader.read_value()
+        return
+    segment, rest = segments[0], segments[1:]
+    container = reader.peek()
+    if container == "{":
+        for name in reader.members():
+            if segment in ("*", name):
+                yield from _walk(reader, rest)
+            else:
+                reader.skip_value()
+    elif container == "[":
+        for index in reader.elements():
+            if segment in ("*", str(index)):
+                yield from _walk(reader, rest)
+            else:
+                reader.skip_value()
+    else:
+        reader.skip_value()
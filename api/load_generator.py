@@ -0,0 +1,295 @@
+"""
+Load mode for the api helpers: replays a scenario of GetApiData / PostData calls at a target rate or
+concurrency for a fixed duration and reports throughput, error rate and latency percentiles.
+
+Example:
+    scenario = Scenario("users").get("list users", TestData.API_BASE_URL + "/api/users") \\
+                                .post("create user", "/api/users", {"name": "morpheus"})
+    report = LoadRunner().run(scenario, duration=30, rate=20)
+    report.save_json("results/load/users.json")
+    report.assert_within(p99_ms=800, max_error_rate=0.01, baseline="baselines/users.json")
+
+From the command line (exit code 1 when a threshold is exceeded):
+    python -m api.load_generator tests.scenarios:USERS --duration 30 --rate 20 --json results/load/users.json
+"""
+import argparse
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.config import TestData
+from api.http_client import HttpClient, get_client, using_client
+from api.post_request import PostData
+from utils.timing import timings
+
+
+class Step:
+    """One named call of a scenario; call() raises on failure."""
+
+    def __init__(self, name, call):
+        self.name = name
+        self.call = call
+
+
+class Scenario:
+    """An ordered list of steps, each worker (or each tick at a fixed rate) runs the next one in turn."""
+
+    def __init__(self, name, steps=None):
+        self.name = name
+        self.steps = list(steps or [])
+
+    def get(self, name, url, headers=None, params=None, timeout=10):
+        """
+        Adds the GET GetApiData.execute_get_request sends, without its per-request print; it is sent once,
+        retries would hide the latency.
+        """
+        def call():
+            response = get_client().get(url, headers=headers, params=params, timeout=timeout, retries=1)
+            response.raise_for_status()
+            return response.json()
+
+        self.steps.append(Step(name, call))
+        return self
+
+    def post(self, name, endpoint, payload=None, headers=None, timeout=10):
+        """Adds a PostData step against TestData.API_BASE_URL + endpoint."""
+        self.steps.append(Step(name, lambda: PostData._post(endpoint, payload, headers, timeout)))
+        return self
+
+    def add(self, name, call):
+        self.steps.append(Step(name, call))
+        return self
+
+
+class LatencyStats:
+    """Latencies (seconds) and error count of one step, or of the whole run."""
+
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+        self.error_samples = []
+
+    def add(self, seconds, error=None):
+        self.latencies.append(seconds)
+        if error is not None:
+            self.errors += 1
+            if len(self.error_samples) < 5:
+                self.error_samples.append(repr(error))
+
+    def percentile(self, percent):
+        return _percentile(sorted(self.latencies), percent)
+
+    def histogram(self):
+        """Request counts per TestData.LOAD_HISTOGRAM_MS bucket ("<=10ms", ..., ">5000ms")."""
+        buckets = {f"<={bound}ms": 0 for bound in TestData.LOAD_HISTOGRAM_MS}
+        buckets[f">{TestData.LOAD_HISTOGRAM_MS[-1]}ms"] = 0
+        for seconds in self.latencies:
+            milliseconds = seconds * 1000
+            bound = next((bound for bound in TestData.LOAD_HISTOGRAM_MS if milliseconds <= bound), None)
+            buckets[f"<={bound}ms" if bound is not None else f">{TestData.LOAD_HISTOGRAM_MS[-1]}ms"] += 1
+        return buckets
+
+    def to_dict(self, elapsed):
+        ordered = sorted(self.latencies)
+        count = len(ordered)
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "throughput_rps": round(count / elapsed, 2) if elapsed else 0.0,
+            "p50_ms": _ms(_percentile(ordered, 50)),
+            "p90_ms": _ms(_percentile(ordered, 90)),
+            "p99_ms": _ms(_percentile(ordered, 99)),
+            "max_ms": _ms(ordered[-1] if ordered else 0.0),
+            "histogram": self.histogram(),
+            "error_samples": self.error_samples,
+        }
+
+
+class LoadReport:
+    def __init__(self, scenario, mode, target, duration, elapsed, overall, steps):
+        self.scenario = scenario
+        self.mode = mode
+        self.target = target
+        self.duration = duration
+        self.elapsed = elapsed
+        self.overall = overall
+        self.steps = steps
+
+    def to_dict(self):
+        return {
+            "scenario": self.scenario,
+            "mode": self.mode,
+            "target": self.target,
+            "duration": self.duration,
+            "elapsed": round(self.elapsed, 3),
+            "overall": self.overall.to_dict(self.elapsed),
+            "steps": {name: stats.to_dict(self.elapsed) for name, stats in self.steps.items()},
+        }
+
+    def save_json(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as json_file:
+            json.dump(self.to_dict(), json_file, indent=2)
+        return path
+
+    def describe(self):
+        overall = self.to_dict()["overall"]
+        return (f"{self.scenario} ({self.mode} {self.target}, {self.elapsed:.1f}s): {overall['requests']} requests, "
+                f"{overall['throughput_rps']} req/s, {overall['error_rate']:.1%} errors, "
+                f"p50 {overall['p50_ms']}ms / p90 {overall['p90_ms']}ms / p99 {overall['p99_ms']}ms / "
+                f"max {overall['max_ms']}ms")
+
+    def violations(self, p99_ms=None, max_error_rate=None, baseline=None, tolerance=None):
+        """
+        Lists the thresholds this run exceeds: an absolute p99 or error rate, and/or a p99 / throughput
+        regression of more than tolerance (TestData.LOAD_REGRESSION_TOLERANCE) against a baseline JSON export.
+        """
+        overall = self.to_dict()["overall"]
+        found = []
+        if p99_ms is not None and overall["p99_ms"] > p99_ms:
+            found.append(f"p99 {overall['p99_ms']}ms exceeds {p99_ms}ms")
+        if max_error_rate is not None and overall["error_rate"] > max_error_rate:
+            found.append(f"error rate {overall['error_rate']:.2%} exceeds {max_error_rate:.2%}")
+        if baseline is not None:
+            if isinstance(baseline, str):
+                with open(baseline, 'r') as json_file:
+                    baseline = json.load(json_file)
+            tolerance = TestData.LOAD_REGRESSION_TOLERANCE if tolerance is None else tolerance
+            base = baseline["overall"]
+            if base["p99_ms"] and overall["p99_ms"] > base["p99_ms"] * (1 + tolerance):
+                found.append(f"p99 regressed from {base['p99_ms']}ms to {overall['p99_ms']}ms")
+            if base["throughput_rps"] and overall["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+                found.append(f"throughput regressed from {base['throughput_rps']} to "
+                             f"{overall['throughput_rps']} req/s")
+        return found
+
+    def assert_within(self, p99_ms=None, max_error_rate=None, baseline=None, tolerance=None):
+        found = self.violations(p99_ms, max_error_rate, baseline, tolerance)
+        assert not found, f"❌ Load run {self.scenario} over threshold: " + "; ".join(found)
+
+
+class LoadRunner:
+    """
+    Runs a Scenario for a fixed duration, either
+
+    * at a fixed concurrency: that many workers each send the next step as soon as the previous one returns, or
+    * at a fixed rate (requests per second): steps are started on schedule whatever the response times, and
+      latency is measured from the scheduled start, so a slow backend is not hidden by a backed-up client.
+
+    The steps are sent through a client of the run's own (see api.http_client.using_client), with a
+    connection per worker and no circuit breaker: every error is measured instead of short-circuited, and
+    the session-wide client's breaker and pool are left to the tests.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or TestData.LOAD_MAX_WORKERS
+
+    def run(self, scenario, duration, rate=None, concurrency=None):
+        if (rate is None) == (concurrency is None):
+            raise ValueError("Pass either rate or concurrency")
+        if not scenario.steps:
+            raise ValueError(f"Scenario {scenario.name} has no steps")
+        overall = LatencyStats()
+        steps = {step.name: LatencyStats() for step in scenario.steps}
+        lock = threading.Lock()
+        client = HttpClient(pool_maxsize=concurrency or self.max_workers, retries=1, circuit_breaker=False)
+
+        def send(step, scheduled):
+            error = None
+            try:
+                with using_client(client):
+                    step.call()
+            except Exception as e:
+                error = e
+            elapsed = time.perf_counter() - scheduled
+            with lock:
+                overall.add(elapsed, error)
+                steps[step.name].add(elapsed, error)
+
+        start = time.perf_counter()
+        try:
+            with timings.measure("load", scenario.name):
+                if rate is not None:
+                    self._run_at_rate(scenario, send, start, duration, rate)
+                else:
+                    self._run_at_concurrency(scenario, send, start, duration, concurrency)
+        finally:
+            client.close()
+        elapsed = time.perf_counter() - start
+        mode, target = ("rate", f"{rate}/s") if rate is not None else ("concurrency", concurrency)
+        return LoadReport(scenario.name, mode, target, duration, elapsed, overall, steps)
+
+    def _run_at_rate(self, scenario, send, start, duration, rate):
+        interval = 1.0 / rate
+        pacer = threading.Event()  # pacing, not a fixed sleep: keep it out of the sleep budget
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="load") as executor:
+            tick = 0
+            while True:
+                scheduled = start + tick * interval
+                if scheduled - start >= duration:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    pacer.wait(delay)
+                executor.submit(send, scenario.steps[tick % len(scenario.steps)], scheduled)
+                tick += 1
+
+    def _run_at_concurrency(self, scenario, send, start, duration, concurrency):
+        deadline = start + duration
+
+        def worker(offset):
+            index = offset
+            while time.perf_counter() < deadline:
+                send(scenario.steps[index % len(scenario.steps)], time.perf_counter())
+                index += 1
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="load") as executor:
+            for offset in range(concurrency):
+                executor.submit(worker, offset)
+
+
+def _percentile(ordered, percent):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * percent // 100))  # ceil without float rounding
+    return ordered[int(rank) - 1]
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay an api scenario under load")
+    parser.add_argument("scenario", help="module:attribute of a Scenario, e.g. tests.scenarios:USERS")
+    parser.add_argument("--duration", type=float, default=10)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--rate", type=float, help="requests per second")
+    target.add_argument("--concurrency", type=int, help="parallel workers")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--p99_ms", type=float)
+    parser.add_argument("--max_error_rate", type=float)
+    parser.add_argument("--baseline", help="JSON export of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, help="allowed regression against the baseline (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    module_name, _, attribute = args.scenario.partition(":")
+    scenario = getattr(importlib.import_module(module_name), attribute)
+    report = LoadRunner().run(scenario, args.duration, rate=args.rate, concurrency=args.concurrency)
+    print(report.describe())
+    if args.json:
+        print(f"report written to {report.save_json(args.json)}")
+    found = report.violations(args.p99_ms, args.max_error_rate, args.baseline, args.tolerance)
+    for violation in found:
+        print(f"❌ {violation}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
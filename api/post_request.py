@@ -1,11 +1,14 @@
 import requests
 
+from api.batch import run_batch
+from api.http_client import get_client
+from api.response_cache import peek_response_cache
 from config.config import TestData
 
 
 class PostData:
     @staticmethod
-    def post_request(endpoint):
+    def post_request(endpoint, payload=None, headers=None, timeout=10):
         """
         Performs a POST request and handles response effectively.
 
@@ -18,22 +21,39 @@ class PostData:
         Returns:
             dict | None: JSON response if successful, otherwise None.
         """
-        headers = {
-            "Authorization":"Bearer <your-token",
-            "Content-Type": "application/json"
-        }
-        payload = {
-
-        }
-
-        timeout = 10
-        url = TestData.API_BASE_URL
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=timeout)
-            response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-            return response.json()  # Return JSON response
+            return PostData._post(endpoint, payload, headers, timeout)
         except requests.exceptions.RequestException as e:
             print(f"Error during POST request: {e}")
             return None
 
+    @staticmethod
+    def post_many(endpoint, payloads, headers=None, timeout=10, max_concurrency=None):
+        """
+        Posts every payload to the endpoint concurrently (at most max_concurrency at a time,
+        TestData.API_BATCH_CONCURRENCY by default), e.g. to create hundreds of records for data setup.
 
+        Returns:
+            list[BatchResult]: In the order of payloads; .value is the JSON response, .error the failure if any,
+            .elapsed the time that request took.
+        """
+        return run_batch(lambda payload: PostData._post(endpoint, payload, headers, timeout), payloads,
+                         max_concurrency)
+
+    @staticmethod
+    def _post(endpoint, payload, headers, timeout):
+        headers = headers or {
+            "Authorization":"Bearer <your-token",
+            "Content-Type": "application/json"
+        }
+        payload = payload if payload is not None else {}
+
+        url = TestData.API_BASE_URL + endpoint
+        response = get_client().post(url, json=payload, headers=headers, timeout=timeout)
+        response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+        cache = peek_response_cache()
+        if cache is not None:
+            # cached GETs of this resource may now be out of date; GetApiData.get_data caches them under BASE_URL
+            for base_url in {TestData.API_BASE_URL, TestData.BASE_URL}:
+                cache.invalidate_prefix(base_url + endpoint)
+        return response.json()  # Return JSON response
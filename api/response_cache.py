@@ -0,0 +1,288 @@
+"""
+Opt-in cache for GET responses: an in-memory LRU in front of an on-disk store, with TTLs and
+ETag/Last-Modified revalidation, so reference data is downloaded and parsed once per run.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+from config.config import TestData
+
+VARY_HEADERS = ("Authorization", "Cookie", "Accept", "Accept-Language")  # requests differing in these are kept apart
+
+
+class CacheEntry:
+    def __init__(self, url, body, etag=None, last_modified=None, expires_at=0.0):
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        self.lookups = {}  # (container, key) -> value, dropped whenever the body changes
+
+    @property
+    def fresh(self):
+        return time.time() < self.expires_at
+
+    @property
+    def revalidatable(self):
+        return bool(self.etag or self.last_modified)
+
+    def to_dict(self):
+        return {"url": self.url, "body": self.body, "etag": self.etag,
+                "last_modified": self.last_modified, "expires_at": self.expires_at}
+
+
+class ResponseCache:
+    """
+    Caches parsed JSON bodies by URL, query parameters and the request headers in VARY_HEADERS, so a response
+    fetched with one user's credentials is never served to another.
+
+    A fresh entry is served from memory (or disk, then promoted to memory) without a request.
+    A stale entry with an ETag or Last-Modified is revalidated with a conditional GET; a 304 only
+    extends its TTL. A Cache-Control max-age from the server overrides the default TTL and
+    no-store responses are never cached.
+
+    Args:
+        max_entries (int): Entries kept in memory before the least recently used one is evicted.
+        ttl (float): Seconds an entry is served without revalidation.
+        cache_dir (str | None): Folder of the on-disk store; None keeps the cache in memory only.
+    """
+
+    def __init__(self, max_entries=None, ttl=None, cache_dir=None):
+        self.max_entries = max_entries or TestData.API_CACHE_MAX_ENTRIES
+        self.ttl = ttl if ttl is not None else TestData.API_CACHE_TTL_SECONDS
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._entries = OrderedDict()
+        self._disk_urls = {}  # cache key -> URL of every file in cache_dir, so invalidation never parses the store
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+
+    def get_json(self, client, url, headers=None, params=None, timeout=None):
+        """
+        Returns the JSON body of url, from the cache when it is fresh.
+
+        Raises:
+            HTTPError: If the server answers with a 4xx/5xx status (nothing is cached then).
+        """
+        return self._entry(client, url, headers, params, timeout).body
+
+    def lookup(self, client, url, container, key, headers=None, params=None, timeout=None):
+        """
+        Returns body[container][key] the way GetApiData.get_data reads it (first list item holding key,
+        or the key of a dict section). Repeated lookups of a fresh entry are a dictionary lookup.
+        """
+        entry = self._entry(client, url, headers, params, timeout)
+        lookup_key = (container, key)
+        if lookup_key not in entry.lookups:
+            entry.lookups[lookup_key] = _extract(entry.body, container, key)
+        return entry.lookups[lookup_key]
+
+    def invalidate(self, url, params=None, headers=None):
+        """Drops the entry of one URL (and query parameters and headers) from memory and disk."""
+        cache_key = _cache_key(url, params, headers)
+        with self._lock:
+            self._entries.pop(cache_key, None)
+        self._remove_file(cache_key)
+
+    def invalidate_prefix(self, prefix):
+        """
+        Drops every entry whose URL starts with prefix, for every set of headers, e.g. after a POST to that
+        resource. Only files written by another process since the last call are opened to learn their URL.
+        """
+        with self._lock:
+            stale = {cache_key for cache_key, entry in self._entries.items() if entry.url.startswith(prefix)}
+            for cache_key in stale:
+                del self._entries[cache_key]
+        if self.cache_dir:
+            self._index_disk()
+            with self._lock:
+                stale.update(cache_key for cache_key, url in self._disk_urls.items() if url.startswith(prefix))
+        for cache_key in stale:
+            self._remove_file(cache_key)
+
+    def clear(self):
+        """Empties the memory and disk stores; statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._disk_urls.clear()
+        if self.cache_dir:
+            for file_name in os.listdir(self.cache_dir):
+                if file_name.endswith(".json"):
+                    os.remove(os.path.join(self.cache_dir, file_name))
+
+    def stats(self):
+        requests_served = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "hit_rate": round(self.hits / requests_served, 3) if requests_served else 0.0,
+        }
+
+    def describe(self):
+        stats = self.stats()
+        return (f"{stats['hits']} hits ({stats['disk_hits']} from disk, {stats['revalidated']} revalidated), "
+                f"{stats['misses']} misses, hit rate {stats['hit_rate']:.0%}, {stats['entries']} entries in memory")
+
+    def _entry(self, client, url, headers, params, timeout):
+        cache_key = _cache_key(url, params, headers)
+        entry = self._get(cache_key)
+        if entry is not None and entry.fresh:
+            self._count("hits")
+            return entry
+
+        request_headers = dict(headers or {})
+        if entry is not None and entry.revalidatable:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+        response = client.get(url, headers=request_headers, params=params, timeout=timeout)
+
+        if response.status_code == 304 and entry is not None:
+            entry.expires_at = time.time() + self._ttl_for(response)
+            self._put(cache_key, entry)
+            self._count("hits", "revalidated")
+            return entry
+
+        response.raise_for_status()
+        self._count("misses")
+        entry = CacheEntry(url, response.json(), etag=response.headers.get("ETag"),
+                           last_modified=response.headers.get("Last-Modified"),
+                           expires_at=time.time() + self._ttl_for(response))
+        if "no-store" not in response.headers.get("Cache-Control", ""):
+            self._put(cache_key, entry)
+        return entry
+
+    def _get(self, cache_key):
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+                return entry
+        if not self.cache_dir:
+            return None
+        entry = self._read_file(self._file_path(cache_key))
+        if entry is not None:
+            with self._lock:
+                self._disk_urls[cache_key] = entry.url
+            if entry.fresh:
+                self._count("disk_hits")
+            self._remember(cache_key, entry)
+        return entry
+
+    def _put(self, cache_key, entry):
+        self._remember(cache_key, entry)
+        if self.cache_dir:
+            path = self._file_path(cache_key)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w') as cache_file:
+                json.dump(entry.to_dict(), cache_file)
+            os.replace(temp_path, path)  # atomic, so parallel workers never read half a file
+            with self._lock:
+                self._disk_urls[cache_key] = entry.url
+
+    def _remember(self, cache_key, entry):
+        with self._lock:
+            self._entries[cache_key] = entry
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _ttl_for(self, response):
+        for directive in response.headers.get("Cache-Control", "").split(","):
+            name, _, value = directive.strip().partition("=")
+            if name == "max-age" and value.isdigit():
+                return int(value)
+        return self.ttl
+
+    def _count(self, *counters):
+        with self._lock:
+            for counter in counters:
+                setattr(self, counter, getattr(self, counter) + 1)
+
+    def _file_path(self, cache_key):
+        return os.path.join(self.cache_dir, f"{cache_key}.json")
+
+    def _index_disk(self):
+        """Adds the files other processes wrote to the URL index and forgets the ones they removed."""
+        on_disk = {name[:-len(".json")] for name in os.listdir(self.cache_dir) if name.endswith(".json")}
+        with self._lock:
+            for cache_key in set(self._disk_urls) - on_disk:
+                del self._disk_urls[cache_key]
+            unknown = on_disk - set(self._disk_urls)
+        for cache_key in unknown:
+            entry = self._read_file(self._file_path(cache_key))
+            if entry is not None:
+                with self._lock:
+                    self._disk_urls[cache_key] = entry.url
+
+    def _remove_file(self, cache_key):
+        if self.cache_dir:
+            with self._lock:
+                self._disk_urls.pop(cache_key, None)
+            try:
+                os.remove(self._file_path(cache_key))
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _read_file(path):
+        try:
+            with open(path, 'r') as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(data["url"], data["body"], data.get("etag"), data.get("last_modified"),
+                          data.get("expires_at", 0.0))
+
+
+def _cache_key(url, params=None, headers=None):
+    full_url = f"{url}?{urlencode(sorted(params.items()), doseq=True)}" if params else url
+    names = {name.lower(): value for name, value in (headers or {}).items()}
+    varying = [f"{name}: {names[name.lower()]}" for name in VARY_HEADERS if name.lower() in names]
+    return hashlib.sha256("\n".join([full_url, *varying]).encode("utf-8")).hexdigest()
+
+
+def _extract(body, container, key):
+    section = body.get(container, []) if isinstance(body, dict) else []
+    if isinstance(section, list):
+        for item in section:
+            if key in item:
+                return item[key]
+    elif isinstance(section, dict):
+        return section.get(key)
+    return None
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """The session-wide ResponseCache used by GetApiData(cache=True)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(cache_dir=TestData.API_CACHE_DIR if TestData.API_CACHE_DISK else None)
+        return _cache
+
+
+def peek_response_cache():
+    """The session-wide cache if anything has used it, otherwise None (for reporting)."""
+    return _cache
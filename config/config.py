@@ -12,22 +12,56 @@ class TestData:
     ROOT_PATH = str(Path(__file__).parent.parent)
     INI_CONFIGS_PATH = os.path.join(ROOT_DIR, "ini_configs")
     DATA_FILES_PATH = os.path.join(ROOT_DIR, "data")
+    # data files compiled to memory-mapped Arrow tables at session start (utils/data_compiler.py, needs pyarrow)
+    DATA_CACHE_ENABLED = os.getenv("DATA_CACHE", "true").lower() in ("1", "true", "yes")
+    DATA_CACHE_DIR = os.path.join(ROOT_DIR, "results", "data_cache")
 
-    DRIVER_PATH = os.path.join(BASE_DIRECTORY, 'drivers')
+    DRIVER_PATH = os.path.join(ROOT_DIR, 'drivers')
+    DRIVER_MANIFEST = "manifest.json"
+    DRIVER_OFFLINE = os.getenv("DRIVER_OFFLINE", "false").lower() in ("1", "true", "yes")
     DOWNLOAD_FOLDER = os.path.join(BASE_DIRECTORY, 'results', 'media', 'download')
 
+    # API client (api/http_client.py)
+    API_TIMEOUT = 10
+    API_POOL_CONNECTIONS = 10
+    API_POOL_MAXSIZE = 20
+    API_RETRIES = 3
+    API_BACKOFF_BASE = 0.5
+    API_BACKOFF_MAX = 10
+    API_CIRCUIT_FAILURE_THRESHOLD = 5
+    API_CIRCUIT_RESET_SECONDS = 30
+    API_BATCH_CONCURRENCY = 16  # keep at or below API_POOL_MAXSIZE so every worker gets a pooled connection
+    # GET response cache, opt-in with GetApiData(cache=True) (api/response_cache.py)
+    API_CACHE_MAX_ENTRIES = 256
+    API_CACHE_TTL_SECONDS = 300
+    API_CACHE_DISK = True
+    API_CACHE_DIR = os.path.join(ROOT_DIR, "results", "api_cache")
+    API_STREAM_CHUNK_SIZE = 65536  # bytes read at a time by the streaming JSON extraction (api/json_stream.py)
+    # Load mode (api/load_generator.py)
+    LOAD_MAX_WORKERS = 64
+    LOAD_HISTOGRAM_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+    LOAD_REGRESSION_TOLERANCE = 0.2
+
     # Reporting
 
     REPORT_TITLE = "Test Automation Report"
     REPORT_FOLDER = os.path.join(BASE_DIRECTORY, '../results', 'reports')
     INDIVIDUAL_REPORT = False
+    # "html": one pytest-html report.html; "stream": results.jsonl, junit.xml and a paged index.html written
+    # as tests finish (utils/report_stream.py), for runs too large for a single page. Also --report_mode.
+    REPORT_MODE = os.getenv("REPORT_MODE", "html")
+    REPORT_PAGE_SIZE = 500  # tests per page file of the streamed viewer
+    REPORT_SELF_CONTAINED = False  # inline CSS/JS into report.html; screenshots are linked either way
     LOG_FOLDER = os.path.join(BASE_DIRECTORY, '../results', 'logs')
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_QUEUE_SIZE = 10000  # records buffered for the log writer thread before new ones are dropped
 
     # Excel
     AUTOMATION_USER_AGENET: str = ""
     DATA_PATH: Path = Path(Path(__file__).absolute().parent.parent, "data")
     CHROME_DOWNLOAD_DIRECTORY: Path = DATA_PATH / "downloads"
     DIFF_TOLERANCE_PERCENT: float = 0.01
+    EXCEL_CACHE_SIZE = 32  # parsed sheets kept by utils/excel_parser.py, keyed on path and modification time
     ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
 
     # DRIVER
@@ -35,6 +69,51 @@ class TestData:
     HEADLESS = False
     ACTION_DELAY = 2
     DOWNLOAD_WAIT_TIME = 60
+    DRIVER_POOL_SIZE = 1
+    IMPLICIT_WAIT = 10
+    # "poll": WebDriverWait polling over the wire, "observer": in-page MutationObserver waits (utils/dom_wait.py)
+    WAIT_MODE = os.getenv("WAIT_MODE", "poll")
+    # fixed sleeps above this many seconds per test are listed in the report
+    SLEEP_BUDGET_SECONDS = 1.0
+    # time every WebDriver command and BasePage helper (also --command_timing); see utils/command_timing.py
+    COMMAND_TIMING = os.getenv("COMMAND_TIMING", "false").lower() in ("1", "true", "yes")
+    COMMAND_TIMING_TOP_N = 10
+    # Chromium network capture from the CDP events in the performance log (utils/network_capture.py)
+    NETWORK_CAPTURE = os.getenv("NETWORK_CAPTURE", "true").lower() in ("1", "true", "yes")
+    NETWORK_CAPTURE_MAX_ENTRIES = 2000  # finished requests kept per driver; failing tests get them as a HAR
+    # Resource blocking (utils/resource_blocking.py): URL patterns for CDP Network.setBlockedURLs, chosen per
+    # test with @pytest.mark.resource_profile("name") or for the run with --resource_profile
+    BLOCK_TRACKING = ["*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+                      "*googlesyndication.com*", "*connect.facebook.net*", "*hotjar.com*", "*clarity.ms*",
+                      "*nr-data.net*", "*segment.io*"]
+    BLOCK_FONTS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"]
+    BLOCK_MEDIA = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.mp4", "*.webm", "*.mp3"]
+    RESOURCE_PROFILES = {
+        "full-fidelity": [],
+        "no-tracking": BLOCK_TRACKING,
+        "functional-minimal": BLOCK_TRACKING + BLOCK_FONTS + BLOCK_MEDIA,
+    }
+    RESOURCE_PROFILE = os.getenv("RESOURCE_PROFILE", "full-fidelity")
+    # transfer sizes learned from unblocked loads, kept between runs to estimate what blocking saves
+    RESOURCE_SIZES_FILE = os.path.join(BASE_DIRECTORY, '../results', 'resource_sizes.json')
+    # "normal" waits for the load event, "eager" for DOMContentLoaded, "none" returns right away (also
+    # --page_load_strategy); the explicit waits of BasePage cover the rest
+    PAGE_LOAD_STRATEGY = os.getenv("PAGE_LOAD_STRATEGY", "normal")
+
+    # Startup budget (python -m utils.startup_benchmark)
+    STARTUP_MODULES = ["conftest", "pages.base_page", "api.get_api_response", "api.post_request"]
+    # loaded only by the helpers that need them, never at import time
+    LAZY_MODULES = ["pandas", "pyautogui", "pytz", "bs4", "psycopg2", "pywinauto", "webdriver_manager", "xlrd",
+                    "openpyxl", "pyarrow"]
+    IMPORT_BUDGET_SECONDS = 2.0
+    COLLECT_BUDGET_SECONDS = 10.0
+
+    # Failure screenshots (utils/screenshots.py): CDP capture, written on a background thread pool
+    SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "jpeg")  # "jpeg", "webp" or "png"
+    SCREENSHOT_QUALITY = 70
+    SCREENSHOT_CLIP_SELECTOR = None  # CSS selector to capture only that element, e.g. "main"
+    SCREENSHOT_MAX_TOTAL_MB = 50  # per process; later failures get no screenshot
+    SCREENSHOT_WORKERS = 2
 
     # Error handling
     ALLURE_RESULTS_PATH = os.path.join(ROOT_DIR, "allure-results")
@@ -49,5 +128,15 @@ class TestData:
     PASSWORD = "<pwd>"
     PORT = 3422
     DB_NAME = "<database_name>"
+    DB_POOL_MIN_CONNECTIONS = 1
+    DB_POOL_MAX_CONNECTIONS = 5
+    DB_POOL_WAIT_TIMEOUT = 30  # seconds to wait for a free pooled connection before giving up
+    DB_STREAM_BATCH_SIZE = 2000
+    DB_CHECK_WORKERS = 4
+    DB_CHECK_TIMEOUT = 60
+    # "postgres", or "sqlite" to seed test data into a local stand-in database file
+    DB_ENGINE = os.getenv("DB_ENGINE", "postgres")
+    SQLITE_PATH = os.getenv("SQLITE_PATH", os.path.join(ROOT_DIR, "results", "test_data.sqlite"))
 
-    EMPLOYEE = """select name, city, phone, address, salary, company from employee where employee_ID= '"""
+    # pass the id as a parameter: db.execute_query(TestData.EMPLOYEE, (employee_id,))
+    EMPLOYEE = """select name, city, phone, address, salary, company from employee where employee_ID = %s"""
@@ -1,6 +1,7 @@
 import logging
 import os
-import time
+import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -8,13 +9,30 @@ import pytest
 from py.xml import html
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.ie.service import Service as IeService
 from selenium.webdriver import DesiredCapabilities
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import IEDriverManager
 
+from api.http_client import close_client
+from api.load_generator import LoadRunner
+from api.response_cache import peek_response_cache
 from config.config import TestData
 from pages.login_page import LoginPage
+from utils.command_timing import SessionCommandStats, breakdown, breakdown_html, instrument_driver
+from utils.data_compiler import binary_cache
+from utils.data_reader import data_provider, load_data_rows, parametrize_from_marker, unload_data_rows
+from utils.data_seeder import DataSeeder
+from utils.db_checks import DbCheckRunner
+from utils.db_connection import DatabaseHelper
+from utils.driver_pool import DriverPool
+from utils.driver_resolver import DriverResolver
+from utils.logger import log_pipeline
+from utils.network_capture import network_capture
+from utils.report_stream import StreamingReport
+from utils.resource_blocking import BlockingStats, navigation_savings, resource_blocker, savings_html, size_book
+from utils.screenshots import ScreenshotWriter
+from utils.timing import timings
+from utils.worker_artifacts import MASTER, WorkerArtifacts, clear_worker_folders, get_worker_id, merge_worker_logs
 from dotenv import load_dotenv
 
 load_dotenv()  # Load environment variables from .env file
@@ -26,19 +44,35 @@ URL = TestData.BASE_URL
 def pytest_addoption(parser):
     """ This function adds an argument to choose the browser """
     parser.addoption("--browser_name", action="store", default="chrome")
-
-
-@pytest.fixture(scope="class")
-def setup(request):  # Added 'request' parameter for fixture
-    """ Here we are doing setup for browser and the URL """
-    global driver
-    browser_name = request.config.getoption("browser_name")
+    parser.addoption("--driver_pool_size", action="store", type=int, default=TestData.DRIVER_POOL_SIZE,
+                     help="number of warm browser sessions kept for the whole test session")
+    parser.addoption("--command_timing", action="store_true", default=TestData.COMMAND_TIMING,
+                     help="time every WebDriver command and BasePage helper and report the breakdown per test")
+    parser.addoption("--report_mode", action="store", default=TestData.REPORT_MODE, choices=("html", "stream"),
+                     help="html: single pytest-html report; stream: JSONL, JUnit XML and a paged HTML view "
+                          "written as tests finish")
+    parser.addoption("--resource_profile", action="store", default=TestData.RESOURCE_PROFILE,
+                     choices=tuple(TestData.RESOURCE_PROFILES),
+                     help="resource-blocking profile of tests without a resource_profile marker")
+    parser.addoption("--page_load_strategy", action="store", default=TestData.PAGE_LOAD_STRATEGY,
+                     choices=("normal", "eager", "none"), help="when driver.get() returns")
+
+
+def pytest_generate_tests(metafunc):
+    """ Parametrizes data_driven tests from the shared, session-cached test data files """
+    marker = metafunc.definition.get_closest_marker("data_driven")
+    if marker is not None:
+        parametrize_from_marker(metafunc, marker)
+
+
+def create_driver(browser_name, driver_path, download_dir):
+    """ Launches and configures a new browser session with an already resolved driver binary """
     capabilities = DesiredCapabilities.CHROME.copy()
     capabilities['goog:loggingPrefs'] = {'browser': 'ALL'}
     if browser_name == "chrome":
         chrome_options = webdriver.ChromeOptions()
         chrome_options.add_experimental_option("prefs", {
-            "download.default_directory": TestData.DOWNLOAD_FOLDER,
+            "download.default_directory": download_dir,
             "download.prompt_for_download": False,
             "download.directory_upgrade": True,
             "safebrowsing.enabled": True,
@@ -48,25 +82,76 @@ def setup(request):  # Added 'request' parameter for fixture
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
         chrome_options.add_argument('--disable-gpu')
+        chrome_options.page_load_strategy = TestData.PAGE_LOAD_STRATEGY
+        if TestData.NETWORK_CAPTURE:
+            # ChromeDriver records the CDP Network.* events, drained by utils/network_capture.py
+            chrome_options.set_capability('goog:loggingPrefs', {'browser': 'ALL', 'performance': 'ALL'})
+            chrome_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
         if TestData.HEADLESS:
             chrome_options.add_argument('--headless')
 
-        services = Service(ChromeDriverManager().install())
+        services = Service(driver_path)
         driver = webdriver.Chrome(service=services, options=chrome_options)
 
     elif browser_name == "firefox":
-        service = Service(GeckoDriverManager().install())
-        driver = webdriver.Firefox(service=service)
+        service = FirefoxService(driver_path)
+        firefox_options = webdriver.FirefoxOptions()
+        firefox_options.page_load_strategy = TestData.PAGE_LOAD_STRATEGY
+        driver = webdriver.Firefox(service=service, options=firefox_options)
 
     elif browser_name == "IE":
-        service = Service(IEDriverManager().install())
+        service = IeService(driver_path)
         driver = webdriver.Ie(service=service)
-    # tear down
-    driver.implicitly_wait(10)
+    else:
+        raise ValueError(f"Unsupported browser: {browser_name}")
+    # implicit waits would stack on top of every explicit wait; observer waits never need them
+    driver.implicitly_wait(0 if TestData.WAIT_MODE == "observer" else TestData.IMPLICIT_WAIT)
     driver.maximize_window()
+    if TestData.COMMAND_TIMING:
+        instrument_driver(driver)
+    if TestData.NETWORK_CAPTURE and browser_name == "chrome":
+        network_capture(driver)
+    return driver
+
+
+driver = None
+driver_pool_in_use = None
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """ Keeps warm browser sessions for the whole session and quits them at the end """
+    global driver_pool_in_use
+    browser_name = request.config.getoption("browser_name")
+    driver_path = DriverResolver().resolve(browser_name)  # once per session, shared by every launch
+    download_dir = TestData.DOWNLOAD_FOLDER  # per-worker folder when running under xdist
+    pool = DriverPool(lambda: create_driver(browser_name, driver_path, download_dir),
+                      request.config.getoption("driver_pool_size"))
+    driver_pool_in_use = pool
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="class")
+def setup(driver_pool):
+    """ Hands out a browser from the pool and resets it (cookies, storage, tabs) when the class is done """
+    global driver
+    driver = driver_pool.acquire()
+    if getattr(driver, 'network_capture', None) is not None:
+        driver.network_capture.clear()  # requests of the previous class that used this pooled browser
     yield driver
-    time.sleep(1)
-    driver.quit()
+    driver_pool.release(driver)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def resource_profile(request):
+    """ Applies the test's resource-blocking profile (marker, else --resource_profile) before its pages load """
+    if "setup" not in request.fixturenames:
+        return None  # no browser for this test
+    marker = request.node.get_closest_marker("resource_profile")
+    profile = marker.args[0] if marker else request.config.getoption("resource_profile")
+    request.node.resource_profile = resource_blocker(request.getfixturevalue("setup")).apply(profile)
+    return profile
 
 
 @pytest.fixture(scope="function")
@@ -75,7 +160,73 @@ def login_page(setup):  # Injecting the driver into the login_page fixture
     return LoginPage(driver, URL, USERNAME, PASSWORD)  # Pass LOGIN_URL to LoginPage
 
 
+@contextmanager
+def _seed_connection():
+    """ A pooled PostgreSQL connection, or a SQLite stand-in when TestData.DB_ENGINE is "sqlite" """
+    if TestData.DB_ENGINE == "sqlite":
+        connection = sqlite3.connect(TestData.SQLITE_PATH)
+        try:
+            yield connection
+        finally:
+            connection.close()
+    else:
+        helper = DatabaseHelper(TestData.HOST, TestData.USER_NAME, TestData.PASSWORD, TestData.DB_NAME, TestData.PORT)
+        with helper.pooled_connection() as connection:
+            yield connection
+
+
+@pytest.fixture(scope="function")
+def db_seed(request):
+    """ Seeds test data inside a savepoint and rolls all of it back at teardown """
+    with _seed_connection() as connection:
+        seeder = DataSeeder(connection).begin()
+        try:
+            yield seeder
+        finally:
+            seeder.rollback()
+            stats = seeder.stats()
+            timings.record("db", "seed", stats["seed_seconds"], rows=stats["rows_seeded"])
+            timings.record("db", "cleanup", stats["cleanup_seconds"])
+            request.node.user_properties.extend(
+                [("db_seed_seconds", stats["seed_seconds"]), ("db_cleanup_seconds", stats["cleanup_seconds"]),
+                 ("db_rows_seeded", stats["rows_seeded"])])
+            logging.info(f"{request.node.nodeid}: seeded {stats['rows_seeded']} row(s) in {stats['seed_seconds']}s, "
+                         f"rolled back in {stats['cleanup_seconds']}s")
+
+
+@pytest.fixture(scope="function")
+def db_checks():
+    """ Background database checks for the test; anything still running is cancelled at teardown """
+    runner = DbCheckRunner(DatabaseHelper(TestData.HOST, TestData.USER_NAME, TestData.PASSWORD, TestData.DB_NAME,
+                                          TestData.PORT))
+    yield runner
+    runner.cancel_all()
+
+
+@pytest.fixture(scope="function")
+def api_load(request):
+    """
+    Runs api load scenarios: api_load(scenario, duration, rate=... or concurrency=...) returns the LoadReport.
+    Each report is exported as JSON and listed in the HTML report and terminal summary.
+    """
+    runner = LoadRunner()
+
+    def run(scenario, duration, rate=None, concurrency=None):
+        report = runner.run(scenario, duration, rate=rate, concurrency=concurrency)
+        json_path = report.save_json(artifacts.root / "load" / f"{scenario.name}.json")
+        request.node.user_properties.append(("load_report", (report.describe(), str(json_path))))
+        logging.info(f"{request.node.nodeid}: {report.describe()}")
+        return report
+
+    return run
+
+
 reports_dir = ''
+artifacts = None
+worker_ids = set()  # xdist workers started by this run
+screenshot_writer = None
+streaming_report = None
+data_cache_summary = None
 
 
 def create_report_folder():
@@ -95,22 +246,65 @@ def create_report_folder():
 @pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """ Updates the default configurations of pytest """
+    global reports_dir, artifacts, data_cache_summary, screenshot_writer, streaming_report
 
-    create_report_folder()
-
-    # Log file configuration
-    log_file = Path(reports_dir) / "logs" / "test_log.log"
-    log_file.parent.mkdir(parents=True, exist_ok=True)  # Ensure the 'logs' folder is created
-    logging.basicConfig(
-        filename=log_file,
-        level=logging.ERROR,  # Captures only errors and critical failures
-        format="%(asctime)s [%(levelname)s] %(message)s - [%(filename)s:%(lineno)d]",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-
+    worker_id = get_worker_id(config)
+    if worker_id == MASTER:
+        create_report_folder()
+        clear_worker_folders(reports_dir)  # a reused report folder still holds the workers of the last run
+    else:
+        # xdist workers write into the folder the controller created, never a timestamp of their own
+        reports_dir = Path(config.workerinput["reports_dir"])
+
+    artifacts = WorkerArtifacts(reports_dir, worker_id, TestData.DOWNLOAD_FOLDER).create()
+    TestData.DOWNLOAD_FOLDER = str(artifacts.download_dir)
+    screenshot_writer = ScreenshotWriter(artifacts.screenshot_dir)
+
+    # JSON-lines log written by a background thread; every record carries the test nodeid and worker id
+    log_pipeline.start(artifacts.log_file, worker_id=worker_id)
+
+    timings.track_sleeps()
+    TestData.COMMAND_TIMING = config.getoption("command_timing")
+    TestData.PAGE_LOAD_STRATEGY = config.getoption("page_load_strategy")
+    size_book.load(TestData.RESOURCE_SIZES_FILE)  # sizes of resources a blocking profile never downloads
+
+    if worker_id == MASTER and TestData.DATA_CACHE_ENABLED:
+        # compiled before xdist starts its workers, which then only memory-map the tables
+        data_cache_summary = binary_cache.compile()
+
+    if config.getoption("report_mode") == "stream":
+        # only the controller writes the streamed report; xdist forwards every worker's reports to it
+        if worker_id == MASTER:
+            streaming_report = StreamingReport(reports_dir).open()
+        return
     report = reports_dir / "report.html"
     config.option.htmlpath = report
-    config.option.self_contained_html = True
+    config.option.self_contained_html = TestData.REPORT_SELF_CONTAINED
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """ Hands the controller's report folder to every xdist worker """
+    node.workerinput["reports_dir"] = str(reports_dir)
+    worker_ids.add(node.workerinput["workerid"])
+
+
+def pytest_sessionfinish(session):
+    """ Closes the database and HTTP pools and merges the per-worker logs into the controller log """
+    DatabaseHelper.close_all_pools()
+    close_client()
+    if screenshot_writer is not None:
+        screenshot_writer.close()  # every linked screenshot is on disk before the report is written
+    if streaming_report is not None:
+        streaming_report.close()
+    timings.untrack_sleeps()
+    if size_book.learned:
+        size_book.save(TestData.RESOURCE_SIZES_FILE)
+    log_pipeline.stop()
+    if artifacts is not None and artifacts.worker_id == MASTER:
+        merge_worker_logs(reports_dir, artifacts.log_file, worker_ids)
+        if command_stats.tests:
+            command_stats.save_json(reports_dir / "command_timings.json")
 
 
 def pytest_html_report_title(report):
@@ -122,22 +316,105 @@ def pytest_html_results_summary(prefix, summary, postfix):
     """ Adds user-defined text at the top of the HTML report """
     user_defined_text = html.p("Custom Report: This execution is for testing API automation results.")
     prefix.extend([user_defined_text])
+    if driver_pool_in_use is not None:
+        prefix.extend([html.p(f"WebDriver pool: {driver_pool_in_use.describe()}")])
+    if sleep_budget_violations:
+        prefix.extend([html.p(f"Sleep budget ({TestData.SLEEP_BUDGET_SECONDS}s per test) exceeded by "
+                              f"{len(sleep_budget_violations)} test(s): "
+                              + ", ".join(nodeid for nodeid, _ in sleep_budget_violations))])
+    if command_stats.tests:
+        top = command_stats.top()
+        prefix.extend([html.p(f"Slowest {len(top)} commands / helpers over the session "
+                              f"(all tests: command_timings.json):"),
+                       html.table(html.tr(html.th("Category"), html.th("Command / helper"), html.th("Calls"),
+                                          html.th("Total (s)"), html.th("Max (s)")),
+                                  [html.tr(html.td(row["category"]), html.td(row["name"]), html.td(row["count"]),
+                                           html.td(f"{row['seconds']:.3f}"), html.td(f"{row['max_seconds']:.3f}"))
+                                   for row in top])])
+    for description, json_path in load_reports:
+        json_link = html.a("JSON", href=artifacts.relative_to_report(json_path))
+        prefix.extend([html.p(f"API load: {description} ", json_link)])
+    for line in blocking_stats.describe():
+        prefix.extend([html.p(f"Resource profile {line}")])
+    if data_provider.loads:
+        prefix.extend([html.p(f"Test data: {data_provider.describe()}")])
+    response_cache = peek_response_cache()
+    if response_cache is not None:
+        prefix.extend([html.p(f"API response cache: {response_cache.describe()}")])
 
 
 def pytest_html_results_table_header(cells):
     """ Adds two columns (Description and time) to the report table """
     cells.insert(2, html.th('Description'))
     cells.insert(3, html.th('Time', class_='sortable time', col='time'))
+    cells.insert(4, html.th('Sleep / Wait (s)'))
     cells.pop()
 
 
 def pytest_html_results_table_row(report, cells):
     """ Adds row two column values to the row """
     cells.insert(2, html.td(report.description))
-    cells.insert(3, html.td(datetime.now(), class_='col-time'))
+    cells.insert(3, html.td(_start_time(report), class_='col-time'))
+    sleep_seconds, wait_seconds = _sleep_and_wait_seconds(report)
+    cells.insert(4, html.td(f"{sleep_seconds:.2f} / {wait_seconds:.2f}"))
     cells.pop()
 
 
+def _start_time(report):
+    """ When the test phase really started, as measured by pytest (not when the report is rendered) """
+    start = getattr(report, 'start', None)
+    return datetime.fromtimestamp(start).isoformat(sep=' ', timespec='milliseconds') if start else ''
+
+
+def _sleep_and_wait_seconds(report):
+    totals = getattr(report, 'timings', {})
+    return (totals.get('sleep', {}).get('seconds', 0.0),
+            totals.get('wait', {}).get('seconds', 0.0))
+
+
+sleep_budget_violations = []
+load_reports = []
+command_stats = SessionCommandStats()
+blocking_stats = BlockingStats()
+session_sleep_seconds = 0.0
+session_wait_seconds = 0.0
+
+
+def pytest_runtest_logreport(report):
+    """ Adds up sleeping vs waiting per test (on the controller too) and checks the sleep budget """
+    global session_sleep_seconds, session_wait_seconds
+    if streaming_report is not None:
+        streaming_report.add(report)
+    if report.when != 'teardown':
+        return
+    load_reports.extend(value for name, value in report.user_properties if name == "load_report")
+    if getattr(report, 'command_timings', None):
+        command_stats.add(report.nodeid, report.command_timings)
+    if getattr(report, 'resource_savings', None) is not None:
+        blocking_stats.add(report.resource_profile, report.resource_savings)
+    sleep_seconds, wait_seconds = _sleep_and_wait_seconds(report)
+    session_sleep_seconds += sleep_seconds
+    session_wait_seconds += wait_seconds
+    if sleep_seconds > TestData.SLEEP_BUDGET_SECONDS:
+        sleep_budget_violations.append((report.nodeid, sleep_seconds))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """ Starts a fresh set of timing records (waits, sleeps, ...) for the test and tags its log records """
+    timings.start_test(item.nodeid)
+    log_pipeline.set_test(item.nodeid)
+    capture = getattr(driver, 'network_capture', None)
+    item.network_mark = capture.mark() if capture is not None else None
+    item.data_rows = load_data_rows(item)  # data_driven records are copied out of the cache only now
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_teardown(item):
+    """ Drops the test's copies of its data_driven records once its fixtures are torn down """
+    unload_data_rows(item, getattr(item, 'data_rows', None))
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
@@ -148,30 +425,109 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
     report.description = str(item.function.__doc__)
+    report.timings = timings.totals()
     extra = getattr(report, 'extra', [])
+    sleeps = [record for record in timings.records if record['category'] == 'sleep']
+    if report.when == 'call' and sum(record['seconds'] for record in sleeps) > TestData.SLEEP_BUDGET_SECONDS:
+        sleep_sites = "".join(f"<li>{record['name']}: {record['seconds']:.2f}s</li>" for record in sleeps)
+        extra.append(pytest_html.extras.html(f"<div>Fixed sleeps over budget:<ul>{sleep_sites}</ul></div>"))
     if report.when == "call" and report.failed:
         logging.error(f"Test Failed: {item.name} - {call.excinfo}")
     if report.when == 'call' or report.when == "setup":
         xfail = hasattr(report, 'wasxfail')
         if (report.skipped and xfail) or (report.failed and not xfail):
-            file_name = report.nodeid.replace("::", "_") + ".png"
-            _capture_screenshot(file_name)
-            if file_name:
+            file_name = report.nodeid.replace("::", "_").replace("/", "_")
+            screenshot = _capture_screenshot(file_name)
+            if screenshot:
+                report.screenshot = artifacts.relative_to_report(screenshot)
                 screenshot_html = '<div><img src="%s" alt="screenshot" style="width:304px;height:228px;" ' \
-                                  'onclick="window.open(this.src)" align="right"/></div>' % file_name
+                                  'onclick="window.open(this.src)" align="right"/></div>' \
+                                  % report.screenshot
                 extra.append(pytest_html.extras.html(screenshot_html))
+            har = _save_har(file_name, getattr(item, 'network_mark', None))
+            if har:
+                report.har = artifacts.relative_to_report(har)
+                extra.append(pytest_html.extras.url(report.har, name="Network (HAR)"))
         report.extra = extra
+    if report.when == 'teardown' and getattr(item, 'resource_profile', None):
+        capture = getattr(driver, 'network_capture', None)
+        if capture is not None and capture.enabled:
+            report.resource_profile = item.resource_profile
+            report.resource_savings = navigation_savings(capture.query(since=getattr(item, 'network_mark', None)))
+            if pytest_html and any(row["blocked"] for row in report.resource_savings):
+                extra.append(pytest_html.extras.html(
+                    f"<div>Resource profile {item.resource_profile}:{savings_html(report.resource_savings)}</div>"))
+                report.extra = extra
+    if report.when == 'teardown' and TestData.COMMAND_TIMING:
+        # setup, call and teardown together: the records are only reset when the next test starts
+        report.command_timings = breakdown(timings.records)
+        if pytest_html and report.command_timings:
+            extra.append(pytest_html.extras.html(
+                f"<div>Time breakdown:{breakdown_html(report.command_timings, TestData.COMMAND_TIMING_TOP_N)}</div>"))
+            report.extra = extra
 
 
 def _capture_screenshot(name):
-    """Saves the captured screenshot to the report directory."""
-    global reports_dir
-    reports_dir = str(Path(reports_dir).resolve())
+    """Queues a screenshot for this worker's screenshot folder and returns the path it will be written to."""
+    if driver is None:
+        return None
+    return screenshot_writer.capture(driver, name)
 
-    if not os.path.exists(reports_dir + '/tests'):
-        os.makedirs(reports_dir + '/tests')
 
+def _save_har(name, since):
+    """Writes the requests made since the test started (the whole class for a new browser) as a HAR file."""
+    capture = getattr(driver, 'network_capture', None)
+    if capture is None or not capture.enabled:
+        return None
     try:
-        driver.get_screenshot_as_file(reports_dir + '/' + name)
+        return capture.save_har(artifacts.root / "har" / f"{name}.har", since=since)
     except Exception as e:
-        print(f"Error capturing screenshot: {e}")
+        logging.error(f"Could not save network capture for {name}: {e}")
+        return None
+
+
+def pytest_terminal_summary(terminalreporter):
+    """ Reports how many browser launches the driver pool saved and how long the resets took """
+    if driver_pool_in_use is not None:
+        terminalreporter.write_sep("-", "WebDriver pool")
+        terminalreporter.write_line(driver_pool_in_use.describe())
+    terminalreporter.write_sep("-", "Sleeping vs waiting")
+    terminalreporter.write_line(f"fixed sleeps: {session_sleep_seconds:.2f}s, "
+                                f"condition waits: {session_wait_seconds:.2f}s")
+    for nodeid, sleep_seconds in sleep_budget_violations:
+        terminalreporter.write_line(f"over sleep budget ({TestData.SLEEP_BUDGET_SECONDS}s): {nodeid} "
+                                    f"slept {sleep_seconds:.2f}s")
+    if streaming_report is not None:
+        terminalreporter.write_sep("-", "Streamed report")
+        terminalreporter.write_line(streaming_report.describe())
+    if screenshot_writer is not None and (screenshot_writer.saved or screenshot_writer.skipped_over_cap):
+        terminalreporter.write_sep("-", "Screenshots")
+        terminalreporter.write_line(screenshot_writer.describe())
+    if command_stats.tests:
+        terminalreporter.write_sep("-", f"Slowest commands / helpers (top {TestData.COMMAND_TIMING_TOP_N})")
+        for row in command_stats.top():
+            terminalreporter.write_line(f"{row['seconds']:8.3f}s {row['count']:6d}x  {row['category']:8s} "
+                                        f"{row['name']}")
+    if blocking_stats.profiles:
+        terminalreporter.write_sep("-", "Resource blocking")
+        for line in blocking_stats.describe():
+            terminalreporter.write_line(line)
+    if load_reports:
+        terminalreporter.write_sep("-", "API load")
+        for description, json_path in load_reports:
+            terminalreporter.write_line(f"{description} -> {json_path}")
+    if data_provider.loads or data_cache_summary:
+        terminalreporter.write_sep("-", "Test data")
+        if data_cache_summary:
+            terminalreporter.write_line(f"compiled cache: {len(data_cache_summary['compiled'])} compiled, "
+                                        f"{len(data_cache_summary['unchanged'])} unchanged "
+                                        f"in {data_cache_summary['seconds']}s")
+            for source, reason in data_cache_summary["skipped"].items():
+                terminalreporter.write_line(f"not compiled {source}: {reason}")
+        terminalreporter.write_line(data_provider.describe())
+        for file_name, seconds in sorted(data_provider.loads.items(), key=lambda item: -item[1]):
+            terminalreporter.write_line(f"{file_name}: {seconds:.3f}s")
+    response_cache = peek_response_cache()
+    if response_cache is not None:
+        terminalreporter.write_sep("-", "API response cache")
+        terminalreporter.write_line(response_cache.describe())
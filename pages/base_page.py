@@ -1,14 +1,8 @@
 """The BasePage class contains common Selenium actions."""
-import json
 import logging
 import os
-import time
 from datetime import datetime
 
-import pandas as pd
-import pyautogui
-import pytz
-from bs4 import BeautifulSoup
 from selenium.common import ElementNotVisibleException, StaleElementReferenceException, TimeoutException, \
     NoSuchElementException
 from selenium.webdriver import ActionChains, Keys
@@ -20,26 +14,78 @@ from selenium.webdriver.support import expected_conditions as EC
 from utils.window_dialog import window as WD
 
 from config.config import TestData
+from utils.command_timing import timed_helpers
+from utils.conditions import wait_for_download
 from utils.db_connection import DatabaseHelper
+from utils.dom_wait import DomWait
 from utils.enums import WaitType
-
-
+from utils.grid_helper import TABLE_SCRIPT, compare_grid, format_mismatches, table_to_dataframe
+from utils.network_capture import network_capture
+from utils.timing import timings
+
+# WebDriverWait conditions used when the wait mode is "poll"
+POLL_CONDITIONS = {
+    "presence": lambda locator, text: EC.presence_of_element_located(locator),
+    "visibility": lambda locator, text: EC.visibility_of_element_located(locator),
+    "invisibility": lambda locator, text: EC.invisibility_of_element_located(locator),
+    "clickable": lambda locator, text: EC.element_to_be_clickable(locator),
+    "text": lambda locator, text: EC.text_to_be_present_in_element(locator, text),
+    "ready": lambda locator, text: lambda driver: driver.execute_script("return document.readyState") == "complete",
+    "interactive":
+        lambda locator, text: lambda driver: driver.execute_script("return document.readyState") != "loading",
+}
+# document state open_url waits for, per page-load strategy: the load event, DOMContentLoaded, or nothing
+READY_CONDITIONS = {"normal": "ready", "eager": "interactive", "none": None}
+
+
+class TimedWait(WebDriverWait):
+    """WebDriverWait whose blocked time is recorded as a condition wait (its polling is never a fixed sleep)."""
+
+    def until(self, method, message=""):
+        if timings.in_wait:  # already timed by _wait_for or an explicit timings.waiting block
+            return super().until(method, message)
+        with timings.waiting(_condition_name(method), mode="poll"):
+            return super().until(method, message)
+
+    def until_not(self, method, message=""):
+        if timings.in_wait:
+            return super().until_not(method, message)
+        with timings.waiting(f"not {_condition_name(method)}", mode="poll"):
+            return super().until_not(method, message)
+
+
+def _condition_name(method):
+    """presence_of_element_located, element_to_be_clickable, ... for the expected_conditions closures"""
+    return getattr(method, "__qualname__", type(method).__name__).split(".<locals>")[0]
+
+
+@timed_helpers
 class BasePage:
     def __init__(self, driver):
         self.driver = driver
-        self._wait = WebDriverWait(self.driver, WaitType.WEB_DRIVER_WAIT.value)
-        self._short_wait = WebDriverWait(self.driver, WaitType.SHORT.value)
-        self._long_wait = WebDriverWait(self.driver, WaitType.LONG.value)
-        self._fluent_wait = WebDriverWait(self.driver, WaitType.FLUENT.value, poll_frequency=1,
-                                          ignored_exceptions=[ElementNotVisibleException])
-        self.db = DatabaseHelper(TestData.HOST, TestData.USER_NAME, TestData.PASSWORD, TestData.DB_NAME, TestData.PORT)
+        self._wait = TimedWait(self.driver, WaitType.WEB_DRIVER_WAIT.value)
+        self._short_wait = TimedWait(self.driver, WaitType.SHORT.value)
+        self._long_wait = TimedWait(self.driver, WaitType.LONG.value)
+        self._fluent_wait = TimedWait(self.driver, WaitType.FLUENT.value, poll_frequency=1,
+                                      ignored_exceptions=[ElementNotVisibleException])
+        self.wait_mode = TestData.WAIT_MODE
+        self._dom_wait = DomWait(self.driver, WaitType.WEB_DRIVER_WAIT.value)
+        self._db = None
         self.word_doc = None
         self.download_dir = None
 
+    @property
+    def db(self):
+        """Created on first use so page objects that never query the database skip it."""
+        if self._db is None:
+            self._db = DatabaseHelper(TestData.HOST, TestData.USER_NAME, TestData.PASSWORD, TestData.DB_NAME,
+                                      TestData.PORT)
+        return self._db
+
     def open_url(self, url):
         self.driver.get(url)
+        self.js_wait_for_page_load()
         logging.info(f"Navigating to {self.get_title()} application")
-        time.sleep(5)
 
     def get_element(self, locator):
         return self.driver.find_element(locator)
@@ -92,7 +138,7 @@ class BasePage:
         self.driver.quit()
 
     def enter_text(self, locator, text):
-        WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(locator)).send_keys(text)
+        TimedWait(self.driver, 10).until(EC.visibility_of_element_located(locator)).send_keys(text)
 
     def send_text(self, element_locator, text):
         element = self._wait.until(EC.presence_of_element_located(element_locator))
@@ -142,26 +188,26 @@ class BasePage:
 
     def is_element_displayed(self, element_locator):
         try:
-            return self._wait.until(EC.visibility_of_element_located(element_locator)).is_displayed()
+            return self._wait_for("visibility", element_locator) is not None
         except (TimeoutException, NoSuchElementException):
             return False
 
     def is_element_present(self, element_locator):
         try:
-            self._wait.until(EC.presence_of_element_located(element_locator))
+            self._wait_for("presence", element_locator)
             return True
         except (TimeoutException, NoSuchElementException):
             return False
 
     def is_element_visible(self, element_locator):
         try:
-            return self._wait.until(EC.visibility_of_element_located(element_locator)).is_displayed()
+            return self._wait_for("visibility", element_locator) is not None
         except (TimeoutException, NoSuchElementException):
             return False
 
     def is_element_clickable(self, element_locator):
         try:
-            return self._wait.until(EC.element_to_be_clickable(element_locator)).is_displayed()
+            return self._wait_for("clickable", element_locator) is not None
         except (TimeoutException, NoSuchElementException):
             return False
 
@@ -173,25 +219,39 @@ class BasePage:
         else:
             alert.dismiss()
 
+    def _wait_for(self, condition, locator=None, text=None, timeout=None):
+        """
+        Waits for a condition ("presence", "visibility", "invisibility", "clickable", "text", "ready" or
+        "interactive").
+        In "observer" wait mode the check runs inside the page and returns in one round trip,
+        in "poll" mode WebDriverWait polls over the wire. Either way the blocked time is recorded.
+        """
+        with timings.waiting(f"{condition} {locator or ''}".strip(), mode=self.wait_mode):
+            if self.wait_mode == "observer":
+                return self._dom_wait.until(condition, locator, text, timeout)
+            wait = TimedWait(self.driver, timeout) if timeout else self._wait
+            return wait.until(POLL_CONDITIONS[condition](locator, text))
+
     def wait_for_element(self, locator):
-        self._wait.until(EC.presence_of_element_located(locator))
+        self._wait_for("presence", locator)
 
     def wait_for_visibility_of_element(self, locator):
-        self._wait.until(EC.visibility_of_element_located(locator))
+        self._wait_for("visibility", locator)
 
     def wait_for_invisibility_of_element(self, locator):
-        self._wait.until(EC.invisibility_of_element_located(locator))
+        self._wait_for("invisibility", locator)
 
     def wait_for_text_in_element(self, locator, text):
-        self._wait.until(EC.text_to_be_present_in_element(locator, text))
+        self._wait_for("text", locator, text)
 
     def wait_for_page_load(self):
-        self._wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
+        self._wait_for("presence", (By.TAG_NAME, 'body'))
 
     def js_wait_for_page_load(self):
-        while True:
-            if self.driver.execute_script("return document.readState") == "complete":
-                break
+        """Waits as far as the page-load strategy: "complete" for normal, "interactive" for eager, none for none."""
+        condition = READY_CONDITIONS[TestData.PAGE_LOAD_STRATEGY]
+        if condition:
+            self._wait_for(condition)
 
     """
     The lambda driver is part of the expected conditions (EC) logic in WebDriverWait.
@@ -205,9 +265,7 @@ class BasePage:
     """
 
     def js_wait_for_page(self, time_unit_seconds):
-        WebDriverWait(self.driver, time_unit_seconds).until(
-            lambda driver: self.driver.execute_script("return document.readyState") == "complete"
-        )
+        self._wait_for("ready", timeout=time_unit_seconds)
 
     def fluent_wait(self, locator):
         try:
@@ -231,7 +289,10 @@ class BasePage:
                 EC.presence_of_element_located(locator))
         else:
             dropdown_element = locator
-        time.sleep(0.6)
+        # options are often filled in asynchronously; wait for them instead of a fixed pause
+        with timings.waiting(f"options of {locator}", mode="poll"):
+            self._wait.until(lambda driver: dropdown_element.is_enabled()
+                             and dropdown_element.find_elements(By.TAG_NAME, "option"))
         select = Select(dropdown_element)
         if select_by == 'text':
             select.select_by_visible_text(option)
@@ -294,6 +355,8 @@ class BasePage:
 
     def get_page_max_number(self, locator):
         """Get the max number from the web-table pagination"""
+        from bs4 import BeautifulSoup
+
         html = self.get_element(locator).get_attribute("outerHtml")
         soup = BeautifulSoup(html, 'lxml')
         max_number = soup.select_one('div.pagination > span').text.split(' ')[-1]  # Store result
@@ -328,6 +391,8 @@ class BasePage:
         :return:
         eg: self.get_page_source_usingJs("ByClassName", "<class-name>"))
         """
+        from bs4 import BeautifulSoup
+
         content = self.driver.execute_script(f"return document.getElements{loc_type}({locator}')[0].innerHTML")
         soup = BeautifulSoup(content, 'lxml')
         return soup.prettify()
@@ -375,6 +440,8 @@ class BasePage:
 
     @staticmethod
     def click_element_with_robot(element):
+        import pyautogui
+
         location = element.location_once_scrolled_into_view
         pyautogui.click(location['x'], location['y'])
 
@@ -417,11 +484,15 @@ class BasePage:
 
     @staticmethod
     def type_with_robot(element, text):
+        import pyautogui
+
         element.click()
         pyautogui.typewrite(text)
 
     @staticmethod
     def scroll_with_robot(direction, amount):
+        import pyautogui
+
         if direction == 'up':
             pyautogui.scroll(amount)
         elif direction == 'down':
@@ -464,63 +535,58 @@ class BasePage:
         assert expected_text in self.js_get_page_source_using(
             locator), f"Expected text '{expected_text}' not found in the page source"
 
+    def extract_table(self, grid_locator, as_dataframe=False):
+        """
+        Reads a whole table in a single execute_script call.
+
+        Returns:
+            dict | DataFrame: {"headers": [...], "rows": [[cell, ...], ...]} with the data rows only,
+            or a DataFrame with the header row as column names when as_dataframe is True.
+        """
+        grid = self._wait_for("presence", grid_locator)
+        table = self.driver.execute_script(TABLE_SCRIPT, grid)
+        return table_to_dataframe(table) if as_dataframe else table
+
     def validate_grid(self, grid_locator, expected_data):
-        grid = self._wait.until(EC.presence_of_element_located(grid_locator))
-        actual_data = [cell.text for cell in grid.find_elements(By.TAG_NAME, 'td')]
+        actual_data = [cell for row in self.extract_table(grid_locator)["rows"] for cell in row]
 
         assert actual_data == expected_data, f"Grid validation failed. Expected: {expected_data}, Actual: {actual_data}"
 
     def iterate_grid_rows(self, grid_locator):
-        grid = self._wait.until(EC.presence_of_element_located(grid_locator))
-        rows = grid.find_elements(By.TAG_NAME, 'tr')
-
-        for row in rows:
+        for row in self.extract_table(grid_locator)["rows"]:
             # Process each cell in the row
-            cells = row.find_elements(By.TAG_NAME, 'td')
-            for cell in cells:
-                print(cell.text)
+            for cell in row:
+                print(cell)
 
     def iterate_grid(self, grid_locator):
-        grid = self._wait.until(EC.presence_of_element_located(grid_locator))
-        rows = grid.find_elements(By.TAG_NAME, 'tr')
-
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, 'td')
-
-            for cell in cells:
-                print(f"Row: {rows.index(row) + 1}, Column: {cells.index(cell) + 1}, Text: {cell.text}")
+        for row_index, row in enumerate(self.extract_table(grid_locator)["rows"], start=1):
+            for col_index, cell in enumerate(row, start=1):
+                print(f"Row: {row_index}, Column: {col_index}, Text: {cell}")
 
     def validate_grid_data(self, grid_locator, expected_data):
-        grid = self._wait.until(EC.presence_of_element_located(grid_locator))
-        rows = grid.find_elements(By.TAG_NAME, 'tr')
-
-        for row_index, row in enumerate(rows):
-            cells = row.find_elements(By.TAG_NAME, 'td')
-
-            for col_index, cell in enumerate(cells):
-                actual_data = cell.text
-                expected_value = expected_data[row_index][col_index]
+        """
+        Compares every data row of the grid with expected_data (list of rows or DataFrame) and reports all
+        mismatching cells at once. A DataFrame with named columns is matched against the grid headers.
+        """
+        by_header = hasattr(expected_data, "columns")  # a DataFrame, without importing pandas here
+        actual_data = self.extract_table(grid_locator, as_dataframe=by_header)
+        mismatches = compare_grid(actual_data if by_header else actual_data["rows"], expected_data)
 
-                assert actual_data == expected_value, f"Grid validation failed at Row {row_index + 1}, Column {col_index + 1}. Expected: {expected_value}, Actual: {actual_data}"
+        assert not mismatches, f"Grid validation failed for {len(mismatches)} cell(s):\n" \
+                               f"{format_mismatches(mismatches)}"
 
     def upload_file(self, file_input_locator, file_path):
         file_input = self._wait.until(EC.presence_of_element_located(file_input_locator))
         file_input.send_keys(file_path)
 
-    def get_network_performance(self):
-        performance_logs = self.driver.get_log('performance')
-
-        # Read network logs
-        network_logs = [json.loads(log['message'])['message'] for log in performance_logs if
-                        'Network' in log['message']]
-
-        # Extract network information
-        network_info = [entry['params'] for entry in network_logs if 'params' in entry]
+    @property
+    def network(self):
+        """Requests captured for this browser; see utils/network_capture.py for query() and save_har()."""
+        return network_capture(self.driver)
 
-        # Extract status codes from network information
-        status_codes = [entry['response']['status'] for entry in network_info if 'response' in entry]
-
-        return status_codes
+    def get_network_performance(self, url=None, since=None):
+        """Status codes of the captured requests (matching the url pattern), oldest first."""
+        return [entry.status for entry in self.network.query(url=url, since=since) if entry.status is not None]
 
     def read_csv_from_downloads(self, file_name, locator, button):
 
@@ -540,9 +606,11 @@ class BasePage:
         print("Downloading CSV file...")
         # define the method in base page and call it here
         self.csv_download_file(locator, button)
+        self._wait_for_download(download_dir, file_name)
 
         if os.path.exists(file_path):
             try:
+                import pandas as pd
                 df = pd.read_csv(file_path)
                 return df
             except Exception as e:
@@ -568,11 +636,12 @@ class BasePage:
         print("Downloading word file...")
         # define the method in base page and call it here
         self.click(download_button)
-        time.sleep(6)
         WD.save_download_file(file_name, file_path)
+        self._wait_for_download(download_dir, file_name)
 
         if os.path.exists(file_path):
             try:
+                import pandas as pd
                 df = pd.read_csv(file_path)
                 return df
             except Exception as e:
@@ -584,17 +653,31 @@ class BasePage:
     def csv_download_file(self, locator, button):
         self.clear_text(locator)
         self.send_text(locator, "URL")
+        import pyautogui
+
         self.click_element(button)
-        time.sleep(5)
+        WD.wait_for_dialog('Save As')
         pyautogui.hotkey('enter')
-        time.sleep(5)
+        WD.wait_for_dialog_closed('Save As')
+
+    @staticmethod
+    def _wait_for_download(download_dir, file_name):
+        try:
+            wait_for_download(download_dir, file_name, WaitType.DOWNLOAD_WAIT_TIME.value)
+        except TimeoutException:
+            print(f"Download of '{file_name}' did not finish within {WaitType.DOWNLOAD_WAIT_TIME.value} seconds")
 
-    def connect_database(self, query):
-        return self.db.execute_query(query)
+    def connect_database(self, query, params=None):
+        return self.db.execute_query(query, params)
 
-    def get_all_rows_columns(self, query):
+    def get_all_rows_columns(self, query, params=None):
         logging.info("Validating records from database")
-        return self.db.fetch_rows_with_column_names(query)
+        return self.db.fetch_rows_with_column_names(query, params)
+
+    def stream_rows(self, query, params=None, batch_size=None):
+        """Generator over large results (row tuples) through a server-side cursor."""
+        logging.info("Streaming records from database")
+        return self.db.stream_query(query, params, batch_size)
 
     def get_column_value(row, column_name):
         """
@@ -620,9 +703,9 @@ class BasePage:
     # for column_name, value in row.items():
     #     print(column_name, value)
 
-    def del_records_from_table(self, query):
+    def del_records_from_table(self, query, params=None):
         logging.info("Deleting records from the table")
-        self.db.delete_query(query)
+        return self.db.delete_query(query, params)
 
     @staticmethod
     def current_date(formate, time_type):
@@ -640,6 +723,7 @@ class BasePage:
             date_format = "%m%d%Y"
         local_time = datetime.now()
         if time_type == "GMT":
+            import pytz
             get_timezone = pytz.timezone(time_type)
             get_time = local_time.astimezone(get_timezone)
             current_date = get_time.strftime(date_format)
@@ -662,10 +746,12 @@ class BasePage:
 
     @staticmethod
     def upload_file_window(file_path):
+        import pyautogui
+
+        WD.wait_for_dialog('Open')
         pyautogui.write(file_path)
-        time.sleep(1)
         pyautogui.press('enter')
-        time.sleep(1)
+        WD.wait_for_dialog_closed('Open')
         pyautogui.press('tab')
         pyautogui.press('enter')
 
@@ -0,0 +1,62 @@
+import threading
+
+import pytest
+
+from api.get_api_response import GetApiData
+from api.http_client import close_client
+from api.post_request import PostData
+from config.config import TestData
+from utils.stub_server import StubResponse, StubServer
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    close_client()
+    yield
+    close_client()
+
+
+def test_get_many_keeps_input_order():
+    """Slow and fast responses come back in the order the URLs were given"""
+    routes = {f"/api/users/{i}": StubResponse(body={"id": i}, delay=0.05 * (5 - i)) for i in range(5)}
+    with StubServer(routes) as server:
+        results = GetApiData.get_many([server.url(f"/api/users/{i}") for i in range(5)])
+
+    assert [result.value for result in results] == [{"id": i} for i in range(5)]
+    assert all(result.ok and result.elapsed > 0 for result in results)
+
+
+def test_get_many_captures_errors_per_request():
+    """A failing request is reported on its own result without stopping the rest"""
+    routes = {"/api/ok": StubResponse(body={"ok": True}), "/api/missing": StubResponse(404)}
+    with StubServer(routes) as server:
+        results = GetApiData.get_many([server.url("/api/ok"), server.url("/api/missing"), server.url("/api/ok")],
+                                      retries=1)
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, AssertionError)
+
+
+def test_post_many_respects_concurrency_limit(monkeypatch):
+    """No more than max_concurrency requests are in flight at once"""
+    in_flight = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def create_user(request):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        threading.Event().wait(0.05)
+        with lock:
+            in_flight["now"] -= 1
+        return StubResponse(201, body={"created": True})
+
+    with StubServer({"POST /api/users": create_user}) as server:
+        monkeypatch.setattr(TestData, "API_BASE_URL", server.url())
+        payloads = [{"name": f"user{i}"} for i in range(12)]
+        results = PostData.post_many("/api/users", payloads, max_concurrency=3)
+
+    assert all(result.ok for result in results)
+    assert [result.item for result in results] == payloads
+    assert len(server.requests) == 12
+    assert 1 < in_flight["peak"] <= 3
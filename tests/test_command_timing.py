@@ -0,0 +1,58 @@
+from config.config import TestData
+from utils.command_timing import SessionCommandStats, breakdown, instrument_driver, timed_helpers
+from utils.timing import timings
+
+
+class FakeDriver:
+    def __init__(self):
+        self.sent = []
+
+    def execute(self, driver_command, params=None):
+        self.sent.append(driver_command)
+        return {"value": None}
+
+
+@timed_helpers
+class FakePage:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def login(self):
+        self.driver.execute("findElement", {"using": "css selector", "value": "#email"})
+        self.driver.execute("clickElement", {"id": "1"})
+
+
+def test_commands_and_helpers_are_timed(monkeypatch):
+    """Find commands carry their locator and helpers are recorded around the commands they send"""
+    monkeypatch.setattr(TestData, "COMMAND_TIMING", True)
+    driver = instrument_driver(instrument_driver(FakeDriver()))  # wrapping twice is a no-op
+    timings.start_test("test_commands_and_helpers_are_timed")
+
+    FakePage(driver).login()
+    FakePage(driver).login()
+
+    rows = {(row["category"], row["name"]): row for row in breakdown(timings.records)}
+    assert driver.sent == ["findElement", "clickElement"] * 2
+    assert rows[("command", "findElement css selector=#email")]["count"] == 2
+    assert rows[("command", "clickElement")]["count"] == 2
+    assert rows[("helper", "FakePage.login")]["count"] == 2
+
+
+def test_helpers_are_not_timed_when_disabled(monkeypatch):
+    """Without the opt-in, page helpers run unwrapped"""
+    monkeypatch.setattr(TestData, "COMMAND_TIMING", False)
+    timings.start_test("test_helpers_are_not_timed_when_disabled")
+
+    FakePage(FakeDriver()).login()
+
+    assert timings.records == []
+
+
+def test_session_top_n_sums_tests():
+    """The session summary adds up every test's breakdown, slowest first"""
+    stats = SessionCommandStats()
+    stats.add("test_a", [{"category": "command", "name": "get", "count": 1, "seconds": 2.0, "max_seconds": 2.0}])
+    stats.add("test_b", [{"category": "command", "name": "get", "count": 2, "seconds": 1.0, "max_seconds": 0.6},
+                         {"category": "wait", "name": "visibility", "count": 1, "seconds": 9.0, "max_seconds": 9.0}])
+
+    assert stats.top(1) == [{"category": "command", "name": "get", "count": 3, "seconds": 3.0, "max_seconds": 2.0}]
@@ -0,0 +1,73 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from config.config import TestData
+from utils.data_compiler import BinaryDataCache
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def sources(tmp_path):
+    source_dir = tmp_path / "data"
+    source_dir.mkdir()
+    (source_dir / "users.csv").write_text("email,active\njane@reqres.in,yes\nmax@reqres.in,no\n", encoding="utf-8")
+    (source_dir / "plans.json").write_text('{"gold": [{"price": 10}], "silver": [{"price": 5}]}', encoding="utf-8")
+    return source_dir
+
+
+def test_compiled_tables_match_the_sources(sources, tmp_path):
+    """CSV rows and JSON record lists come back from the memory-mapped tables unchanged"""
+    cache = BinaryDataCache(str(sources), str(tmp_path / "cache"))
+    summary = cache.compile()
+
+    assert sorted(summary["compiled"]) == ["plans.json", "users.csv"]
+    assert cache.table(str(sources / "users.csv"), 0).to_pylist() == \
+        [{"email": "jane@reqres.in", "active": "yes"}, {"email": "max@reqres.in", "active": "no"}]
+    assert cache.table(str(sources / "plans.json"), "silver").to_pylist() == [{"price": 5}]
+
+
+def test_sources_are_recompiled_only_when_their_content_changes(sources, tmp_path):
+    """A touched but unchanged file is matched by hash; an edited one is compiled again"""
+    cache = BinaryDataCache(str(sources), str(tmp_path / "cache"))
+    cache.compile()
+    users = sources / "users.csv"
+    stat = os.stat(users)
+    os.utime(users, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert BinaryDataCache(str(sources), str(tmp_path / "cache")).compile()["compiled"] == []
+
+    users.write_text("email,active\nzoe@reqres.in,yes\n", encoding="utf-8")
+    assert cache.table(str(users), 0) is None  # stale until compiled again
+    cache.compile()
+    assert cache.table(str(users), 0).to_pylist() == [{"email": "zoe@reqres.in", "active": "yes"}]
+    assert len([name for name in os.listdir(tmp_path / "cache") if name.endswith(".arrow")]) == 3
+
+
+def test_non_uniform_records_come_back_as_parsed(sources, tmp_path):
+    """Keys missing from some records and columns mixing int, float and text survive compilation unchanged"""
+    from utils.data_reader import DataProvider
+
+    records = [{"id": 1, "price": 10}, {"id": 2, "price": 12.5, "promo": "X"},
+               {"id": 3, "price": "free", "promo": None, "tags": ["a", 1]}]
+    (sources / "offers.json").write_text(json.dumps(records), encoding="utf-8")
+    cache = BinaryDataCache(str(sources), str(tmp_path / "cache"))
+    cache.compile()
+
+    compiled = cache.records(str(sources / "offers.json"))
+    assert compiled == DataProvider._parse(str(sources / "offers.json"), 0, None) == records
+    assert [type(record["price"]) for record in compiled] == [int, float, str]
+
+
+def test_without_sources_pyarrow_is_not_imported(tmp_path):
+    """A tree with no data files pays nothing for the compiled cache at session start"""
+    probe = ("import sys; from utils.data_compiler import BinaryDataCache; "
+             f"summary = BinaryDataCache({str(tmp_path / 'data')!r}, {str(tmp_path / 'cache')!r}).compile(); "
+             "print(summary['compiled'], summary['skipped'], 'pyarrow' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", probe], cwd=TestData.ROOT_DIR, capture_output=True, text=True)
+
+    assert result.stdout.split() == ["[]", "{}", "False"], result.stderr
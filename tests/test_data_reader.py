@@ -0,0 +1,59 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from utils.data_reader import DataProvider, DataRow, load_data_rows, parametrize_from_marker, unload_data_rows
+from utils.json_parser import JsonParser
+
+
+@pytest.fixture
+def users_csv(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_text("email,active\njane@reqres.in,yes\nmax@reqres.in,no\nzoe@reqres.in,yes\n", encoding="utf-8")
+    return str(path)
+
+
+def test_files_are_parsed_once(users_csv):
+    """Repeated loads of an unchanged file are cache hits"""
+    provider = DataProvider()
+    first = provider.load(users_csv)
+    assert provider.load(users_csv) is first
+    assert provider.stats()["misses"] == 1
+    assert provider.stats()["hits"] == 1
+    assert [user["email"] for user in provider.rows(users_csv, where={"active": "yes"}, limit=1)] == \
+        ["jane@reqres.in"]
+
+
+def test_json_parser_reads_through_the_cache(tmp_path):
+    """JsonParser returns a private copy of the cached document"""
+    path = tmp_path / "login.json"
+    path.write_text(json.dumps({"users": [{"email": "jane@reqres.in"}]}), encoding="utf-8")
+
+    data = JsonParser(str(path)).read_from_json()
+    data["users"].clear()
+    assert JsonParser(str(path)).read_from_json() == {"users": [{"email": "jane@reqres.in"}]}
+
+
+def test_data_driven_marker_defers_records_to_setup(users_csv, monkeypatch):
+    """Collection only keeps row positions and ids; each test gets its own copy of the record at setup"""
+    provider = DataProvider()
+    monkeypatch.setattr("utils.data_reader.data_provider", provider)
+    calls = {}
+    metafunc = SimpleNamespace(parametrize=lambda argname, values, ids=None: calls.update(
+        argname=argname, values=values, ids=ids))
+    marker = pytest.mark.data_driven(users_csv, "user", where={"active": "yes"}, id_column="email").mark
+
+    parametrize_from_marker(metafunc, marker)
+
+    assert calls["argname"] == "user"
+    assert calls["ids"] == ["jane@reqres.in", "zoe@reqres.in"]
+    assert all(isinstance(row, DataRow) for row in calls["values"])
+    item = SimpleNamespace(callspec=SimpleNamespace(params={"user": calls["values"][1], "browser": "chrome"}))
+    rows = load_data_rows(item)
+    assert item.callspec.params == {"user": {"email": "zoe@reqres.in", "active": "yes"}, "browser": "chrome"}
+    item.callspec.params["user"]["email"] = "changed@reqres.in"
+    assert provider.load(users_csv)[2]["email"] == "zoe@reqres.in"
+
+    unload_data_rows(item, rows)
+    assert item.callspec.params["user"] is calls["values"][1]
@@ -0,0 +1,49 @@
+import json
+import sqlite3
+
+import pytest
+
+from utils.data_seeder import DataSeeder
+
+
+@pytest.fixture
+def sqlite_connection(tmp_path):
+    connection = sqlite3.connect(tmp_path / "stand_in.sqlite")
+    connection.execute("create table employee (employee_id integer primary key, name text, city text)")
+    connection.commit()
+    yield connection
+    connection.close()
+
+
+def count_employees(connection):
+    return connection.execute("select count(*) from employee").fetchone()[0]
+
+
+def test_seeded_rows_are_rolled_back(sqlite_connection):
+    """Rows seeded inside the savepoint are visible to the test and gone after rollback"""
+    seeder = DataSeeder(sqlite_connection).begin()
+    seeded = seeder.seed("employee", [{"employee_id": index, "name": f"user{index}", "city": "Pune"}
+                                      for index in range(500)])
+
+    assert seeded == 500
+    assert count_employees(sqlite_connection) == 500
+
+    seeder.rollback()
+
+    assert count_employees(sqlite_connection) == 0
+    assert seeder.stats()["rows_seeded"] == 500
+    assert seeder.stats()["cleanup_seconds"] >= 0
+
+
+def test_seed_from_json_file(sqlite_connection, tmp_path):
+    """Test data is bulk-loaded from a JSON file keyed by table name"""
+    data_file = tmp_path / "employees.json"
+    data_file.write_text(json.dumps({"employee": [{"employee_id": 1, "name": "Jane", "city": "Austin"},
+                                                  {"employee_id": 2, "name": "Ravi", "city": "Delhi"}]}))
+    seeder = DataSeeder(sqlite_connection).begin()
+
+    assert seeder.seed_from_file("employee", str(data_file)) == 2
+    assert sqlite_connection.execute("select name from employee where employee_id = 2").fetchone()[0] == "Ravi"
+
+    seeder.rollback()
+    assert count_employees(sqlite_connection) == 0
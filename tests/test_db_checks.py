@@ -0,0 +1,146 @@
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from config.config import TestData
+from utils.db_checks import DbCheckRunner
+from utils.db_connection import DatabaseHelper
+from utils.timing import timings
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        if query.startswith("sleep"):
+            self.connection.cancelled.wait(float(query.split()[1]))
+            if self.connection.cancelled.is_set():
+                raise RuntimeError("canceling statement due to user request")
+        self.description = [("value",)]
+        self.rows = [(params[0] if params else query,)]
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    closed = False
+
+    def __init__(self):
+        self.cancelled = threading.Event()
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+class FakeDb:
+    def __init__(self):
+        self.connections = []
+        self.borrowed = threading.Semaphore(0)
+
+    @contextmanager
+    def pooled_connection(self):
+        connection = FakeConnection()
+        self.connections.append(connection)
+        self.borrowed.release()
+        yield connection
+
+
+@pytest.fixture
+def runner():
+    runner = DbCheckRunner(FakeDb(), max_workers=2)
+    yield runner
+    runner.cancel_all()
+
+
+def test_gather_returns_results_in_submission_order(runner):
+    """Checks run in the background and come back in the order they were given"""
+    futures = [runner.submit("sleep 0.05 select %s", (number,)) for number in range(4)]
+
+    assert runner.gather(futures) == [[(number,)] for number in range(4)]
+    assert runner.result(runner.submit("select 1", with_column_names=True)) == [{"value": "select 1"}]
+
+
+def test_result_times_out_and_cancel_all_stops_every_check(runner):
+    """A slow check times out for the caller; cancel_all cancels queued checks and running queries"""
+    running = [runner.submit("sleep 30") for _ in range(2)]
+    queued = runner.submit("select 1")
+    with pytest.raises(TimeoutError):
+        runner.result(running[0], timeout=0.05)
+    assert runner.db.borrowed.acquire(timeout=1) and runner.db.borrowed.acquire(timeout=1)  # both are running
+
+    runner.cancel_all()
+
+    assert queued.cancelled()
+    assert all(connection.cancelled.is_set() for connection in runner.db.connections)
+    for future in running:
+        with pytest.raises(RuntimeError, match="canceling statement"):
+            future.result()
+    with pytest.raises(RuntimeError, match="shutdown"):
+        runner.submit("select 1")
+
+
+def test_a_check_is_timed_for_the_test_that_started_it(runner):
+    """A check that finishes after the next test started is recorded for the test that submitted it"""
+    timings.start_test("tests/test_orders.py::test_pay")
+    future = runner.submit("sleep 0.1")
+    first_test = timings.records
+    timings.start_test("tests/test_orders.py::test_refund")
+    future.result()
+
+    assert [record["category"] for record in first_test] == ["db"]
+    assert timings.records == []
+
+
+def test_borrowers_wait_for_a_free_connection(monkeypatch):
+    """With every pooled connection borrowed the next borrower waits for one instead of failing"""
+    class FakePool:
+        def getconn(self):
+            return FakeConnection()
+
+        def putconn(self, connection, close=False):
+            pass
+
+    monkeypatch.setattr(TestData, "DB_POOL_MAX_CONNECTIONS", 1)
+    monkeypatch.setattr(TestData, "DB_POOL_WAIT_TIMEOUT", 0.05)
+    db = DatabaseHelper("localhost", "tester", "secret", "orders", 5432)
+    monkeypatch.setitem(DatabaseHelper._pools, db._key(), FakePool())
+    monkeypatch.setitem(DatabaseHelper._slots, db._key(), threading.BoundedSemaphore(1))
+    borrowed, released = threading.Event(), threading.Event()
+
+    def hold():
+        with db.pooled_connection():
+            borrowed.set()
+            released.wait(1)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    borrowed.wait(1)
+    with pytest.raises(TimeoutError, match="No pooled connection"):
+        with db.pooled_connection():
+            pass
+
+    monkeypatch.setattr(TestData, "DB_POOL_WAIT_TIMEOUT", 1)
+    threading.Timer(0.05, released.set).start()
+    with db.pooled_connection() as connection:
+        assert isinstance(connection, FakeConnection)
+    holder.join()
@@ -0,0 +1,105 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from selenium.common import WebDriverException  # noqa: E402
+
+from utils.driver_pool import DriverPool  # noqa: E402
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class FakeDriver:
+    def __init__(self, fail_reset=False):
+        self.fail_reset = fail_reset
+        self.windows = {"main": "about:blank"}
+        self.current = "main"
+        self.switch_to = FakeSwitchTo(self)
+        self.cdp = []
+        self.quit_called = False
+
+    def execute(self, driver_command, params=None):
+        if driver_command == "get":
+            self.windows[self.current] = params["url"]
+        return {"value": None}
+
+    def get(self, url):
+        self.execute("get", {"url": url})
+
+    @property
+    def window_handles(self):
+        return list(self.windows)
+
+    @property
+    def current_url(self):
+        return self.windows[self.current]
+
+    def open_tab(self, url):
+        self.windows[f"tab{len(self.windows)}"] = url
+
+    def close(self):
+        del self.windows[self.current]
+
+    def execute_script(self, script, *args):
+        if self.fail_reset:
+            raise WebDriverException("session deleted")
+
+    def delete_all_cookies(self):
+        pass
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp.append((command, params))
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_released_drivers_are_reused_up_to_the_size_cap():
+    """A released driver serves the next checkout; beyond the cap it is quit instead of kept"""
+    pool = DriverPool(FakeDriver, size=1)
+    first, second = pool.acquire(), pool.acquire()
+
+    pool.release(first)
+    pool.release(second)
+    assert second.quit_called and not first.quit_called
+    assert pool.acquire() is first
+
+    stats = pool.stats()
+    assert (stats["launches"], stats["checkouts"], stats["launches_saved"], stats["resets"]) == (2, 3, 1, 1)
+
+
+def test_reset_clears_the_storage_of_every_visited_origin():
+    """Origins opened with get() and those of other tabs are cleared one by one, never with a wildcard"""
+    pool = DriverPool(FakeDriver)
+    driver = pool.acquire()
+    driver.get("https://app.example.com/login?next=/home")
+    driver.get("https://auth.example.com/sso")
+    driver.open_tab("https://docs.example.com/page")
+
+    pool.release(driver)
+
+    cleared = [params["origin"] for command, params in driver.cdp if command == "Storage.clearDataForOrigin"]
+    assert cleared == ["https://app.example.com", "https://auth.example.com", "https://docs.example.com"]
+    assert driver.window_handles == ["main"] and driver.current_url == "about:blank"
+
+    driver.cdp.clear()
+    pool.release(pool.acquire())
+    assert [command for command, _ in driver.cdp] == ["Network.clearBrowserCookies"]
+
+
+def test_a_driver_whose_reset_fails_is_discarded():
+    """A broken session is quit and the next checkout launches a new browser"""
+    pool = DriverPool(lambda: FakeDriver(fail_reset=True))
+    broken = pool.acquire()
+
+    pool.release(broken)
+
+    assert broken.quit_called
+    assert pool.acquire() is not broken
+    assert pool.stats()["launches"] == 2
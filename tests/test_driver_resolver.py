@@ -0,0 +1,85 @@
+import json
+import os
+import stat
+import sys
+import types
+
+import pytest
+
+from utils import driver_resolver
+from utils.driver_resolver import DriverResolver
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith("win"), reason="fake drivers are shell scripts")
+
+
+def fake_executable(path, version):
+    path.write_text(f"#!/bin/sh\necho 'Fake {version} (build)'\n", encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+@pytest.fixture
+def machine(tmp_path, monkeypatch):
+    """An offline resolver with drivers/ and a PATH holding a fake Chrome; nothing resolved yet."""
+    drivers, bin_dir = tmp_path / "drivers", tmp_path / "bin"
+    drivers.mkdir()
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    monkeypatch.setattr(DriverResolver, "_resolved", {})
+    monkeypatch.setattr(driver_resolver, "BROWSER_BINARIES", {**driver_resolver.BROWSER_BINARIES,
+                                                              "chrome": ("google-chrome",)})
+    return drivers, bin_dir
+
+
+def test_a_browser_update_resolves_the_driver_again(machine):
+    """A manifest entry recorded for Chrome 119 is not reused with Chrome 120; the new driver is recorded"""
+    drivers, bin_dir = machine
+    fake_executable(bin_dir / "google-chrome", "120.0.6099.109")
+    fake_executable(drivers / "chromedriver", "119.0.6045.105")
+    (drivers / "manifest.json").write_text(json.dumps({"chrome": {
+        "path": "chromedriver", "driver_version": "119.0.6045.105", "browser_version": "119.0.6045.159"}}))
+    resolver = DriverResolver(str(drivers), offline=True)
+
+    with pytest.raises(FileNotFoundError, match="120.0.6099.109"):
+        resolver.resolve("chrome")
+
+    fake_executable(drivers / "chromedriver", "120.0.6099.109")
+    assert resolver.resolve("chrome") == str(drivers / "chromedriver")
+    assert resolver.read_manifest()["chrome"] == {
+        "path": "chromedriver", "driver_version": "120.0.6099.109", "browser_version": "120.0.6099.109"}
+
+
+def test_overrides_and_system_drivers_are_not_recorded(machine, monkeypatch):
+    """A *_PATH override or a driver on the PATH is used but never written to the committed manifest"""
+    drivers, bin_dir = machine
+    fake_executable(bin_dir / "google-chrome", "120.0.6099.109")
+    override = fake_executable(drivers.parent / "my-chromedriver", "120.0.6099.109")
+    monkeypatch.setenv("CHROMEDRIVER_PATH", override)
+
+    assert DriverResolver(str(drivers), offline=True).resolve("chrome") == override
+
+    monkeypatch.delenv("CHROMEDRIVER_PATH")
+    monkeypatch.setattr(DriverResolver, "_resolved", {})
+    system_driver = fake_executable(bin_dir / "chromedriver", "120.0.6099.109")
+    assert DriverResolver(str(drivers), offline=True).resolve("chrome") == system_driver
+    assert not os.path.exists(drivers / "manifest.json")
+
+
+def test_a_download_replaces_the_driver_in_place_atomically(machine, monkeypatch):
+    """The downloaded driver is renamed over drivers/ (never copied onto a binary a worker may be running)"""
+    drivers, bin_dir = machine
+    fake_executable(bin_dir / "google-chrome", "120.0.6099.109")
+    fake_executable(drivers / "chromedriver", "119.0.6045.105")
+    running = (drivers / "chromedriver").stat().st_ino
+    downloaded = fake_executable(drivers.parent / "wdm-chromedriver", "120.0.6099.109")
+    chrome_module = types.ModuleType("webdriver_manager.chrome")
+    chrome_module.ChromeDriverManager = lambda: types.SimpleNamespace(install=lambda: downloaded)
+    monkeypatch.setitem(sys.modules, "webdriver_manager", types.ModuleType("webdriver_manager"))
+    monkeypatch.setitem(sys.modules, "webdriver_manager.chrome", chrome_module)
+
+    assert DriverResolver(str(drivers), offline=False).resolve("chrome") == str(drivers / "chromedriver")
+
+    assert (drivers / "chromedriver").stat().st_ino != running
+    assert sorted(path.name for path in drivers.iterdir()) == ["chromedriver", "manifest.json"]
+    assert DriverResolver(str(drivers)).read_manifest()["chrome"]["driver_version"] == "120.0.6099.109"
@@ -0,0 +1,88 @@
+import os
+import warnings
+
+import pytest
+
+from utils.excel_parser import Excel_Parser, _load_sheet
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    path = tmp_path / "users.xlsx"
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.title = "users"
+    sheet.append(["id", "name", "note", "active"])
+    sheet.append([1, "O'Brien", "said \"hi\"", True])
+    sheet.append([2, "Jane", 3.5, False])
+    book.save(path)
+    Excel_Parser.clear_cache()
+    return path
+
+
+def test_values_keep_their_type(workbook):
+    """Numbers stay numbers and quotes inside strings are not mangled"""
+    assert Excel_Parser().read_from_excel("users", str(workbook)) == \
+        [1, "O'Brien", "said \"hi\"", True, 2, "Jane", 3.5, False]
+    assert Excel_Parser.read_records(str(workbook), "users")[1] == {"id": 2, "name": "Jane", "note": 3.5,
+                                                                     "active": False}
+
+
+def test_column_range(workbook):
+    """Only the requested columns are read"""
+    assert Excel_Parser.read_rows(str(workbook), "users", columns="B:C") == [("O'Brien", "said \"hi\""), ("Jane", 3.5)]
+
+
+def test_cache_is_keyed_on_modification_time(workbook):
+    """An unchanged workbook is parsed once, an edited one again"""
+    Excel_Parser.read_rows(str(workbook), "users")
+    Excel_Parser.read_rows(str(workbook), "users")
+    assert _load_sheet.cache_info().misses == 1
+
+    book = pytest.importorskip("openpyxl").load_workbook(workbook)
+    book["users"].append([3, "Max", None, True])
+    book.save(workbook)
+    stat = os.stat(workbook)
+    os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert len(Excel_Parser.read_rows(str(workbook), "users")) == 3
+    assert _load_sheet.cache_info().misses == 2
+
+
+def test_lookup_filters_on_any_columns():
+    """Several filter columns, any output columns, original row order; a table answers the same"""
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"state": ["CA", "NY", "CA", "CA"], "plan": ["gold", "gold", "silver", "gold"],
+                       "name": ["a", "b", "c", "d"], "premium": [10, 20, 30, 40]})
+    table = Excel_Parser.lookup_table(df, ["state", "plan"])
+
+    for lookup in (lambda *args, **kwargs: Excel_Parser.lookup(df, *args, **kwargs), table.lookup):
+        assert lookup({"state": "CA", "plan": "gold"}, ["name", "premium"]) == {"name": ["a", "d"], "premium": [10, 40]}
+        assert lookup({"plan": "gold", "state": "CA"}, ["name"], sort_by="premium", ascending=False) == \
+            {"name": ["d", "a"]}
+        assert lookup({"state": "TX", "plan": "gold"}, ["name"]) == {"name": []}
+    assert table.indexed
+    assert Excel_Parser.get_csv_data(df, ["state", "plan"], ["NY", "gold"], ["name", "premium"]) == \
+        {"col1": ["b"], "col2": [20]}
+
+
+def test_lookups_see_edits_mixed_types_and_empty_keys():
+    """In-place edits are seen by lookup, unsortable keys fall back to a scan and NaN keys never match"""
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"code": ["x", 1, "y"], "state": ["CA", None, "NY"], "plan": ["gold", "gold", "gold"],
+                       "name": ["a", "b", "c"]})
+    assert Excel_Parser.lookup(df, {"state": "CA"}, ["name"]) == {"name": ["a"]}
+    df.loc[2, "state"] = "CA"
+    assert Excel_Parser.lookup(df, {"state": "CA"}, ["name"]) == {"name": ["a", "c"]}
+
+    mixed = Excel_Parser.lookup_table(df, ["code"])
+    assert not mixed.indexed
+    assert mixed.lookup({"code": 1}, ["name"]) == {"name": ["b"]}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # no PerformanceWarning from an unsorted MultiIndex
+        table = Excel_Parser.lookup_table(df, ["state", "plan"])
+        assert table.indexed
+        assert table.lookup({"state": "CA", "plan": "gold"}, ["name"]) == {"name": ["a", "c"]}
+        assert table.lookup({"state": float("nan"), "plan": "gold"}, ["name"]) == {"name": []}
@@ -0,0 +1,42 @@
+import pytest
+
+from utils.grid_helper import MISSING, compare_grid, format_mismatches, table_to_dataframe
+
+
+def test_columns_are_matched_by_header():
+    """Named expected columns find the actual column of the same header, whatever its position"""
+    pd = pytest.importorskip("pandas")
+    actual = table_to_dataframe({"headers": ["name", "age"], "rows": [["Ann", "31"], ["Bob", "40"]]})
+    expected = pd.DataFrame([{"age": "31", "name": "Ann"}, {"age": "41", "name": "Bob"}])
+
+    assert compare_grid(actual, expected) == [(2, "age", "41", "40")]
+
+
+def test_missing_rows_and_columns_are_reported_as_missing():
+    """Absent cells, rows and header columns compare as '<missing>'"""
+    pd = pytest.importorskip("pandas")
+    assert compare_grid([["a", "b"], ["c"]], [["a", "b"], ["c", "d"], ["e", "f"]]) == [
+        (2, 2, "d", MISSING), (3, 1, "e", MISSING), (3, 2, "f", MISSING)]
+
+    actual = table_to_dataframe({"headers": ["name"], "rows": [["Ann"]]})
+    expected = pd.DataFrame({"name": ["Ann"], "email": ["ann@reqres.in"]})
+    assert compare_grid(actual, expected) == [(1, "email", "ann@reqres.in", MISSING)]
+
+
+def test_numbers_compare_with_the_text_of_the_cells():
+    """Expected ints and floats match the page's text of the same value"""
+    pytest.importorskip("pandas")
+    assert compare_grid([["1", "2.5", "x"]], [[1, 2.5, "x"]]) == []
+    assert compare_grid([["4"]], [[3]]) == [(1, 1, "3", "4")]
+
+
+def test_format_mismatches_stops_at_the_limit():
+    """Only the first limit cells are listed, followed by a count of the rest"""
+    mismatches = [(row, 1, "expected", "actual") for row in range(1, 6)]
+
+    lines = format_mismatches(mismatches, limit=2).splitlines()
+
+    assert lines == ["Row 1, Column 1: Expected: expected, Actual: actual",
+                     "Row 2, Column 1: Expected: expected, Actual: actual",
+                     "... and 3 more mismatching cell(s)"]
+    assert len(format_mismatches(mismatches).splitlines()) == 5
@@ -0,0 +1,61 @@
+import pytest
+
+from api.http_client import CircuitOpenError, HttpClient
+from utils.stub_server import StubResponse, StubServer
+
+
+@pytest.fixture
+def client():
+    client = HttpClient(retries=3, backoff_base=0.01, backoff_max=0.05, failure_threshold=3, reset_timeout=60)
+    yield client
+    client.close()
+
+
+def test_retries_server_errors_with_backoff(client):
+    """A 503 followed by a 200 is retried and the recovered response is returned"""
+    with StubServer({"/api/users": [StubResponse(503), StubResponse(body={"data": [1]})]}) as server:
+        response = client.get(server.url("/api/users"))
+
+    assert response.status_code == 200
+    assert response.json() == {"data": [1]}
+    assert len(server.requests) == 2
+
+
+def test_post_is_not_retried_by_default(client):
+    """Non-idempotent requests are sent once unless retries are asked for"""
+    with StubServer({"POST /api/users": StubResponse(503)}) as server:
+        response = client.post(server.url("/api/users"), json={"name": "morpheus"})
+
+    assert response.status_code == 503
+    assert len(server.requests) == 1
+
+
+def test_circuit_opens_after_consecutive_failures(client):
+    """Once the failure threshold is reached, requests fail fast without reaching the server"""
+    with StubServer({"/api/users": StubResponse(500)}) as server:
+        client.get(server.url("/api/users"))  # three failing attempts open the circuit
+        with pytest.raises(CircuitOpenError):
+            client.get(server.url("/api/users"))
+
+    assert len(server.requests) == 3
+
+
+def test_retries_count_attempts_and_dropped_responses_are_closed(client, monkeypatch):
+    """Fewer than one attempt is refused; a streamed 503 that is retried gives its connection back"""
+    with pytest.raises(ValueError, match="at least 1"):
+        HttpClient(retries=0)
+    sent = []
+    send = client.session.request
+
+    def request(*args, **kwargs):
+        sent.append(send(*args, **kwargs))
+        return sent[-1]
+
+    monkeypatch.setattr(client.session, "request", request)
+    with StubServer({"/api/users": [StubResponse(503), StubResponse(body={"data": [1]})]}) as server:
+        with pytest.raises(ValueError, match="got 0"):
+            client.get(server.url("/api/users"), retries=0)
+        assert client.get(server.url("/api/users"), stream=True).json() == {"data": [1]}
+
+    assert [response.status_code for response in sent] == [503, 200]
+    assert sent[0].raw.closed
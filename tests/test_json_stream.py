@@ -0,0 +1,89 @@
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from api.get_api_response import GetApiData
+from api.http_client import close_client
+from api.json_stream import find_in_container, first_value, stream_values
+from config.config import TestData
+from utils.stub_server import StubResponse, StubServer
+
+USERS = {"page": 1, "meta": {"note": "brackets } ] and \"quotes\" in strings", "ratio": -12.5e3},
+         "data": [{"id": i, "email": f"user{i}@réqres.in"} for i in range(100)],
+         "support": {"url": "https://reqres.in"}}
+
+
+def chunked(text, size):
+    data = text.encode("utf-8")
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 1 << 20])
+def test_paths_match_json_loads_for_any_chunk_size(size):
+    """Chunk boundaries inside strings, numbers and multi-byte characters do not change the result"""
+    text = json.dumps(USERS)
+    assert list(stream_values(chunked(text, size), "data[*].email")) == [item["email"] for item in USERS["data"]]
+    assert first_value(chunked(text, size), "meta.ratio") == -12500.0
+    assert first_value(chunked(text, size), "data.7") == USERS["data"][7]
+    assert find_in_container(chunked(text, size), "support", "url") == "https://reqres.in"
+    assert first_value(chunked(text, size), "missing.key") is None
+
+
+NUMBERS = {"a": 1.5, "b": -2.25e-3, "c": [10, 1e21, -0.0, 3E+2, 7], "d": {"e": 123456.789, "f": 0}, "g": 2.5}
+
+
+@pytest.mark.parametrize("size", range(1, 13))
+def test_numbers_split_at_any_byte(size):
+    """A chunk boundary after ".", "e", "-" or a digit never truncates a number"""
+    text = json.dumps(NUMBERS)
+    assert first_value(chunked(text, size), "g") == 2.5
+    assert list(stream_values(chunked(text, size), "c[*]")) == NUMBERS["c"]
+    assert first_value(chunked(text, size), "d") == NUMBERS["d"]
+    assert first_value(chunked(text, size), "b") == NUMBERS["b"]
+    assert first_value(['{"a": 1.', '5, "b": 2}'], "b") == 2
+    assert first_value(['{"a": 1.5, "b": 2.', '5}'], "b") == 2.5
+
+
+def test_extraction_stops_at_the_first_match():
+    """Only the chunks up to the match are read from a large body"""
+    text = json.dumps({"data": [{"id": i, "email": "e"} for i in range(50000)]})
+    read = []
+
+    def chunks():
+        for chunk in chunked(text, 4096):
+            read.append(chunk)
+            yield chunk
+
+    assert find_in_container(chunks(), "data", "email") == "e"
+    assert len(read) == 1
+
+
+@pytest.fixture
+def users_server(monkeypatch):
+    close_client()
+
+    def page(request):
+        number = int(parse_qs(urlsplit(request["path"]).query)["page"][0])
+        items = [{"id": i, "email": f"user{i}@reqres.in"} for i in range(3 * (number - 1), 3 * number)]
+        return StubResponse(body={"page": number, "data": items if number <= 2 else []})
+
+    with StubServer({"/api/users": page}) as server:
+        monkeypatch.setattr(TestData, "BASE_URL", server.url())
+        yield server
+    close_client()
+
+
+def test_get_data_stream_matches_buffered(users_server):
+    """get_data gives the same answer with and without streaming"""
+    api = GetApiData()
+    assert api.get_data("/api/users?page=1", "data", "email", stream=True) == \
+        api.get_data("/api/users?page=1", "data", "email") == "user0@reqres.in"
+
+
+def test_paginate_follows_pages_until_empty(users_server):
+    """Values of every page are yielded in order and the empty page ends the iteration"""
+    ids = list(GetApiData.paginate(users_server.url("/api/users"), "data[*].id"))
+
+    assert ids == [0, 1, 2, 3, 4, 5]
+    assert len(users_server.requests) == 3
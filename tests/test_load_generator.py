@@ -0,0 +1,76 @@
+import json
+import sys
+
+import pytest
+
+from api.http_client import close_client, get_client
+from api.load_generator import LoadRunner, Scenario, _percentile
+from config.config import TestData
+from utils.stub_server import StubResponse, StubServer
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    close_client()
+    yield
+    close_client()
+
+
+def test_percentiles_use_nearest_rank():
+    """p50/p90/p99 pick the nearest-rank sample of the sorted latencies"""
+    ordered = [i / 1000 for i in range(1, 101)]
+    assert _percentile(ordered, 50) == 0.05
+    assert _percentile(ordered, 99) == 0.099
+    assert _percentile([], 99) == 0.0
+
+
+def test_concurrency_mode_reports_latency_and_errors(monkeypatch, tmp_path):
+    """GET and POST steps run against the stub server; failing steps count towards the error rate"""
+    routes = {"/api/users": StubResponse(body={"data": []}, delay=0.01),
+              "POST /api/users": StubResponse(400)}
+    with StubServer(routes) as server:
+        monkeypatch.setattr(TestData, "API_BASE_URL", server.url())
+        scenario = Scenario("users").get("list users", server.url("/api/users")) \
+                                    .post("create user", "/api/users", {"name": "morpheus"})
+        report = LoadRunner().run(scenario, duration=0.5, concurrency=4)
+
+    result = report.to_dict()
+    assert result["steps"]["list users"]["errors"] == 0
+    assert result["steps"]["create user"]["error_rate"] == 1.0
+    assert 0 < result["overall"]["p50_ms"] <= result["overall"]["p90_ms"] <= result["overall"]["p99_ms"] \
+        <= result["overall"]["max_ms"]
+    assert sum(result["overall"]["histogram"].values()) == result["overall"]["requests"]
+
+    exported = json.loads(open(report.save_json(str(tmp_path / "users.json"))).read())
+    assert exported["scenario"] == "users"
+
+
+def test_rate_mode_and_regression_threshold(tmp_path):
+    """A run at a fixed rate sends about rate * duration requests and fails a p99 below its latency"""
+    with StubServer({"/api/users": StubResponse(body={}, delay=0.02)}) as server:
+        report = LoadRunner().run(Scenario("slow").get("list users", server.url("/api/users")), duration=1, rate=20)
+
+    assert 15 <= report.to_dict()["overall"]["requests"] <= 21
+    report.assert_within(max_error_rate=0.0)
+    with pytest.raises(AssertionError, match="p99"):
+        report.assert_within(p99_ms=1)
+
+    baseline = report.to_dict()
+    baseline["overall"]["p99_ms"] = 1
+    assert any("regressed" in violation for violation in report.violations(baseline=baseline))
+
+
+def test_runs_use_their_own_client_without_a_circuit_breaker():
+    """Every failure is measured as sent; the tests' client keeps its closed circuit and stdout is left alone"""
+    stdout = sys.stdout
+    seen = []
+    with StubServer({"/api/users": StubResponse(503)}) as server:
+        scenario = Scenario("down").get("list users", server.url("/api/users")) \
+                                   .add("stdout", lambda: seen.append(sys.stdout))
+        report = LoadRunner().run(scenario, duration=0.3, concurrency=8)
+
+    result = report.to_dict()["steps"]["list users"]
+    assert result["requests"] > get_client().failure_threshold
+    assert result["error_rate"] == 1.0 and all("503" in sample for sample in result["error_samples"])
+    assert get_client().breaker_for(server.url()).state == "closed"
+    assert seen and all(stream is stdout for stream in seen)
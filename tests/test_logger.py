@@ -0,0 +1,49 @@
+import json
+import logging
+import queue
+
+from utils.logger import Logger, LogPipeline, _DroppingQueueHandler
+
+
+def pipeline_handlers():
+    return [handler for handler in logging.getLogger().handlers if isinstance(handler, _DroppingQueueHandler)]
+
+
+def test_records_are_json_lines_with_test_context(tmp_path):
+    """Every line names the test and worker it was logged for; starting twice attaches one handler"""
+    log_file = tmp_path / "test_log.jsonl"
+    pipeline = LogPipeline()
+    pipeline.start(log_file, worker_id="gw1", level=logging.INFO)
+    pipeline.start(log_file, worker_id="gw1", level=logging.INFO)
+    assert len(pipeline_handlers()) == 1
+
+    pipeline.set_test("tests/test_login.py::test_valid_login")
+    logging.getLogger("pages").info("Navigating to %s", "Credit Karma")
+    pipeline.stop()
+
+    assert pipeline_handlers() == []
+    entry = json.loads(log_file.read_text(encoding="utf-8").splitlines()[-1])
+    assert entry["message"] == "Navigating to Credit Karma"
+    assert entry["nodeid"] == "tests/test_login.py::test_valid_login"
+    assert entry["worker"] == "gw1"
+
+
+def test_full_queue_drops_instead_of_blocking():
+    """A full buffer costs the record, never the calling thread's time"""
+    pipeline = LogPipeline()
+    handler = _DroppingQueueHandler(queue.Queue(maxsize=1), pipeline)
+    for number in range(3):
+        handler.handle(logging.makeLogRecord({"msg": f"record {number}"}))
+
+    assert handler.queue.qsize() == 1
+    assert pipeline.dropped == 2
+
+
+def test_custom_logger_adds_no_handlers():
+    """Repeated customLogger calls reuse the pipeline instead of opening a file each time"""
+    first = Logger.customLogger(logging.INFO)
+    second = Logger.customLogger(logging.INFO)
+
+    assert first is second
+    assert first.name == "test_custom_logger_adds_no_handlers"
+    assert first.handlers == []
@@ -0,0 +1,65 @@
+import json
+
+from utils.network_capture import NetworkCapture
+
+
+def event(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}}), "level": "INFO"}
+
+
+def request_events(request_id, url, status, start, seconds, size=100, method="GET"):
+    return [
+        event("Network.requestWillBeSent", requestId=request_id, type="XHR", wallTime=1700000000 + start,
+              timestamp=start, request={"url": url, "method": method, "headers": {"Accept": "*/*"}}),
+        event("Network.responseReceived", requestId=request_id,
+              response={"status": status, "statusText": "", "protocol": "h2", "mimeType": "application/json",
+                        "headers": {"Content-Type": "application/json"},
+                        "timing": {"requestTime": start, "sendStart": 1, "sendEnd": 2, "receiveHeadersEnd": 40,
+                                   "dnsStart": -1, "dnsEnd": -1}}),
+        event("Network.loadingFinished", requestId=request_id, timestamp=start + seconds, encodedDataLength=size),
+    ]
+
+
+class FakeChrome:
+    def __init__(self):
+        self.pending = []
+
+    def get_log(self, log_type):
+        logs, self.pending = self.pending, []  # ChromeDriver empties its buffer on every read
+        return logs
+
+
+def test_query_by_url_status_and_timing():
+    """Finished requests can be filtered by URL pattern, status, duration and a per-test mark"""
+    driver = FakeChrome()
+    capture = NetworkCapture(driver, max_entries=10)
+    driver.pending = request_events("1", "https://app/api/users?page=2", 200, 10.0, 0.05)
+    mark = capture.mark()
+    driver.pending = (request_events("2", "https://app/api/orders", 500, 11.0, 0.8, method="POST")
+                      + request_events("3", "https://app/logo.png", 200, 12.0, 0.01)
+                      + [event("Network.dataReceived", requestId="3")])
+
+    assert [entry.request_id for entry in capture.query(url=r"/api/")] == ["1", "2"]
+    assert [entry.request_id for entry in capture.query(status=range(500, 600))] == ["2"]
+    assert [entry.request_id for entry in capture.query(min_duration_ms=500)] == ["2"]
+    assert [entry.request_id for entry in capture.query(since=mark)] == ["2", "3"]
+    assert capture.query(failed=True)[0].duration_ms == 800.0
+
+
+def test_buffer_is_bounded_and_exports_har():
+    """Only the newest max_entries requests are kept; they export as HAR 1.2"""
+    driver = FakeChrome()
+    capture = NetworkCapture(driver, max_entries=2)
+    for number in range(5):
+        driver.pending += request_events(str(number), f"https://app/api/{number}?q=x", 200, float(number), 0.1)
+    driver.pending.append(event("Network.loadingFailed", requestId="9", errorText="net::ERR_BLOCKED_BY_CLIENT"))
+
+    assert [entry.request_id for entry in capture.query()] == ["3", "4"]
+    assert capture.dropped == 3
+
+    har = capture.to_har()
+    entry = har["log"]["entries"][-1]
+    assert har["log"]["version"] == "1.2"
+    assert entry["request"]["queryString"] == [{"name": "q", "value": "x"}]
+    assert entry["response"]["httpVersion"] == "HTTP/2.0" and entry["response"]["content"]["size"] == 100
+    assert entry["timings"]["wait"] == 38 and entry["timings"]["dns"] == -1
@@ -0,0 +1,37 @@
+import pytest
+
+from config.config import TestData
+
+pytest.importorskip("selenium")
+
+from pages.base_page import BasePage  # noqa: E402
+
+
+class FakeDriver:
+    def __init__(self, states):
+        self.states = list(states)
+        self.checks = 0
+        self.title = "Home"
+
+    def get(self, url):
+        self.url = url
+
+    def execute_script(self, script, *args):
+        self.checks += 1
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+
+@pytest.mark.parametrize("strategy, states, checks", [
+    ("normal", ["loading", "interactive", "complete"], 3),
+    ("eager", ["interactive"], 1),
+    ("none", ["loading"], 0),
+])
+def test_open_url_waits_only_as_far_as_the_page_load_strategy(monkeypatch, strategy, states, checks):
+    """eager stops at DOMContentLoaded ("interactive"), none does not wait for the document at all"""
+    monkeypatch.setattr(TestData, "PAGE_LOAD_STRATEGY", strategy)
+    monkeypatch.setattr(TestData, "WAIT_MODE", "poll")
+    driver = FakeDriver(states)
+
+    BasePage(driver).open_url("https://app/")
+
+    assert driver.checks == checks
@@ -0,0 +1,60 @@
+import json
+import xml.etree.ElementTree as ElementTree
+
+from _pytest.reports import TestReport
+
+from utils.report_stream import StreamingReport
+
+
+def make_report(nodeid, when, outcome="passed", longrepr=None, start=1700000000.0, duration=0.5, **attributes):
+    report = TestReport(nodeid, ("tests/test_x.py", 1, nodeid), {}, outcome, longrepr, when,
+                        duration=duration, start=start, stop=start + duration)
+    report.__dict__.update(attributes)
+    return report
+
+
+def run_test(report, nodeid, call_outcome="passed", longrepr=None, start=1700000000.0, **attributes):
+    report.add(make_report(nodeid, "setup", start=start))
+    report.add(make_report(nodeid, "call", call_outcome, longrepr, start=start + 0.5, **attributes))
+    report.add(make_report(nodeid, "teardown", start=start + 1.0))
+
+
+def test_results_are_streamed_as_tests_finish(tmp_path):
+    """Each test lands in results.jsonl at teardown, with pytest's own start/stop times"""
+    report = StreamingReport(tmp_path, page_size=2, title="Run").open()
+    run_test(report, "tests/test_x.py::test_a", worker_id="gw1")
+    report.add(make_report("tests/test_x.py::test_b", "setup"))
+
+    lines = (tmp_path / "results.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    result = json.loads(lines[0])
+    assert result["outcome"] == "passed" and result["worker"] == "gw1"
+    assert result["duration"] == 1.5
+    assert result["start"].endswith(".000") and result["stop"].endswith(".500")
+    report.close()
+    assert len((tmp_path / "results.jsonl").read_text(encoding="utf-8").splitlines()) == 2  # test_b, no teardown
+
+
+def test_pages_and_junit(tmp_path):
+    """Failures go to JUnit with their text, pages hold page_size tests and the manifest lists failing pages"""
+    report = StreamingReport(tmp_path, page_size=2, title="Run").open()
+    run_test(report, "tests/test_x.py::test_a")
+    run_test(report, "tests/test_x.py::TestLogin::test_b", "failed", "AssertionError: \x1b[31mboom\x1b[0m",
+             screenshot="screenshots/test_b.jpg")
+    run_test(report, "tests/test_x.py::test_c", "skipped", ("tests/test_x.py", 3, "Skipped: no data"))
+    report.close()
+
+    assert sorted(path.name for path in (tmp_path / "pages").iterdir()) == [
+        "manifest.js", "page-00001.js", "page-00002.js"]
+    manifest = (tmp_path / "pages" / "manifest.js").read_text(encoding="utf-8")
+    assert '"failure_pages": [1]' in manifest and '"finished": true' in manifest
+    assert 'src="pages/manifest.js"' in (tmp_path / "index.html").read_text(encoding="utf-8")
+
+    suite = ElementTree.parse(tmp_path / "junit.xml").getroot().find("testsuite")
+    assert (suite.get("tests"), suite.get("failures"), suite.get("skipped")) == ("3", "1", "1")
+    failed = suite.findall("testcase")[1]
+    assert failed.get("classname") == "tests.test_x.TestLogin" and failed.get("name") == "test_b"
+    assert failed.find("failure").text == "AssertionError: boom"
+    assert failed.find("properties/property").get("value") == "screenshots/test_b.jpg"
+    assert suite.findall("testcase")[2].find("skipped").get("message") == "Skipped: no data"
+    assert not (tmp_path / "junit.xml.part").exists()
@@ -0,0 +1,79 @@
+import pytest
+
+from utils.network_capture import NetworkEntry
+from utils.resource_blocking import BlockingStats, ResourceBlocker, SizeBook, navigation_savings
+
+
+class FakeChrome:
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+        return {}
+
+
+def entry(request_id, url, loader_id, resource_type, size=0, blocked=False):
+    network_entry = NetworkEntry(request_id, url, "GET", {}, None, resource_type, 0.0, 0.0)
+    network_entry.loader_id = loader_id
+    network_entry.encoded_bytes = size
+    if blocked:
+        network_entry.error = "net::ERR_BLOCKED_BY_CLIENT"
+        network_entry.blocked_reason = "inspector"
+    return network_entry
+
+
+def test_profiles_are_applied_once():
+    """The profile's patterns go to Network.setBlockedURLs; re-applying the same profile sends nothing"""
+    driver = FakeChrome()
+    blocker = ResourceBlocker(driver)
+
+    blocker.apply("functional-minimal")
+    blocker.apply("functional-minimal")
+    blocker.apply("full-fidelity")
+
+    blocked_urls = [params["urls"] for command, params in driver.commands if command == "Network.setBlockedURLs"]
+    assert len(blocked_urls) == 2 and "*.woff2" in blocked_urls[0] and blocked_urls[1] == []
+    with pytest.raises(ValueError):
+        blocker.apply("no-such-profile")
+
+
+def test_savings_per_navigation():
+    """Blocked requests are counted per page load, sized from earlier loads of the same URL or type"""
+    sizes = SizeBook()
+    full = [entry("L1", "https://app/login", "L1", "Document", 5000),
+            entry("2", "https://app/hero.png", "L1", "Image", 40000),
+            entry("3", "https://app/logo.png", "L1", "Image", 20000)]
+    navigation_savings(full, sizes)
+
+    minimal = [entry("L2", "https://app/login", "L2", "Document", 5000),
+               entry("5", "https://app/hero.png", "L2", "Image", blocked=True),
+               entry("6", "https://app/other.png", "L2", "Image", blocked=True),
+               entry("7", "https://fonts.gstatic.com/a.woff2", "L2", "Font", blocked=True),
+               entry("L3", "https://app/home", "L3", "Document", 7000)]
+    rows = navigation_savings(minimal, sizes)
+
+    assert rows[0] == {"url": "https://app/login", "requests": 1, "bytes": 5000, "blocked": 3,
+                       "bytes_saved": 40000 + 30000, "unsized": 1}
+    assert rows[1]["url"] == "https://app/home" and rows[1]["blocked"] == 0
+
+    stats = BlockingStats()
+    stats.add("functional-minimal", rows)
+    assert stats.profiles["functional-minimal"]["navigations"] == 2
+    assert "3 blocked" in stats.describe()[0]
+
+
+def test_sizes_from_an_earlier_run_seed_the_estimate(tmp_path):
+    """With nothing loaded unblocked the saving is reported as unknown, not 0; saved sizes fill it in"""
+    blocked = [entry("L1", "https://app/login", "L1", "Document", 5000),
+               entry("2", "https://app/hero.png", "L1", "Image", blocked=True)]
+    stats = BlockingStats()
+    stats.add("functional-minimal", navigation_savings(blocked, SizeBook()))
+    assert "bytes saved unknown" in stats.describe()[0]
+
+    full_fidelity = SizeBook()
+    navigation_savings([entry("9", "https://app/hero.png", "L9", "Image", 40000)], full_fidelity)
+    full_fidelity.save(tmp_path / "sizes.json")
+
+    rows = navigation_savings(blocked, SizeBook().load(tmp_path / "sizes.json"))
+    assert rows[0]["bytes_saved"] == 40000 and rows[0]["unsized"] == 0
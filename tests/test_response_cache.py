@@ -0,0 +1,89 @@
+import pytest
+
+from api.http_client import HttpClient
+from api.response_cache import ResponseCache
+from utils.stub_server import StubResponse, StubServer
+
+USERS = {"data": [{"id": 1, "email": "george.bluth@reqres.in"}], "support": {"url": "https://reqres.in"}}
+
+
+@pytest.fixture
+def client():
+    client = HttpClient(retries=1)
+    yield client
+    client.close()
+
+
+def test_fresh_entries_are_served_without_a_request(client, tmp_path):
+    """Repeated lookups of the same container/key hit the server once"""
+    cache = ResponseCache(ttl=60, cache_dir=str(tmp_path))
+    with StubServer({"/api/users": StubResponse(body=USERS)}) as server:
+        for _ in range(50):
+            assert cache.lookup(client, server.url("/api/users"), "data", "email") == "george.bluth@reqres.in"
+        assert cache.lookup(client, server.url("/api/users"), "support", "url") == "https://reqres.in"
+
+    assert len(server.requests) == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 50
+
+
+def test_stale_entries_are_revalidated_with_etag(client):
+    """An expired entry sends If-None-Match and a 304 keeps the cached body"""
+    cache = ResponseCache(ttl=0)
+    responses = [StubResponse(body=USERS, headers={"ETag": '"v1"'}), StubResponse(304)]
+    with StubServer({"/api/users": responses}) as server:
+        first = cache.get_json(client, server.url("/api/users"))
+        second = cache.get_json(client, server.url("/api/users"))
+
+    assert first == second == USERS
+    assert server.requests[1]["headers"]["If-None-Match"] == '"v1"'
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_disk_store_survives_a_new_cache_and_invalidation_clears_it(client, tmp_path):
+    """Entries written to disk are reused by another cache until they are invalidated"""
+    with StubServer({"/api/users": StubResponse(body=USERS)}) as server:
+        ResponseCache(ttl=60, cache_dir=str(tmp_path)).get_json(client, server.url("/api/users"))
+        cache = ResponseCache(ttl=60, cache_dir=str(tmp_path))
+        cache.get_json(client, server.url("/api/users"))
+        assert len(server.requests) == 1
+        assert cache.stats()["disk_hits"] == 1
+
+        cache.invalidate_prefix(server.url("/api/"))
+        cache.get_json(client, server.url("/api/users"))
+
+    assert len(server.requests) == 2
+
+
+def test_responses_are_cached_per_credentials(client):
+    """A response fetched with one Authorization header is not served to a request with another"""
+    cache = ResponseCache(ttl=60)
+    with StubServer({"/api/me": StubResponse(body={"data": {"id": 1}})}) as server:
+        for token in ("alice", "bob", "alice"):
+            cache.get_json(client, server.url("/api/me"), headers={"Authorization": f"Bearer {token}"})
+
+    assert [request["headers"]["Authorization"] for request in server.requests] == ["Bearer alice", "Bearer bob"]
+
+
+def test_a_post_invalidates_the_gets_cached_by_get_data(client, tmp_path, monkeypatch):
+    """PostData drops what GetApiData(cache=True) cached for the endpoint, without reparsing the disk store"""
+    from api import response_cache
+    from api.get_api_response import GetApiData
+    from api.post_request import PostData
+    from config.config import TestData
+
+    cache = ResponseCache(ttl=60, cache_dir=str(tmp_path))
+    responses = [StubResponse(body=USERS), StubResponse(body={"data": [{"email": "janet.weaver@reqres.in"}]})]
+    with StubServer({"GET /auth/api/users": responses, "POST /api/users": StubResponse(201, {"id": 7})}) as server:
+        monkeypatch.setattr(TestData, "BASE_URL", server.url("/auth"))
+        monkeypatch.setattr(TestData, "API_BASE_URL", server.url())
+        monkeypatch.setattr(response_cache, "_cache", cache)
+        getter = GetApiData(cache=cache)
+        assert getter.get_data("/api/users", "data", "email") == "george.bluth@reqres.in"
+
+        with monkeypatch.context() as patch:
+            patch.setattr(ResponseCache, "_read_file", staticmethod(lambda path: pytest.fail(f"reparsed {path}")))
+            PostData.post_request("/api/users", {"name": "janet"})
+        assert list(tmp_path.iterdir()) == []
+
+        assert getter.get_data("/api/users", "data", "email") == "janet.weaver@reqres.in"
@@ -0,0 +1,45 @@
+import base64
+
+from utils.screenshots import ScreenshotWriter
+
+
+class FakeChrome:
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.params = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.params.append(params)
+        return {"data": base64.b64encode(self.frames.pop(0)).decode("ascii")}
+
+    def execute_script(self, script, *args):
+        return [0, 10, 200, 100]
+
+
+def test_frames_are_written_in_the_background_and_repeats_linked(tmp_path):
+    """JPEG via CDP, identical consecutive frames reuse the earlier file"""
+    writer = ScreenshotWriter(tmp_path, image_format="jpeg", quality=50, workers=1)
+    driver = FakeChrome([b"frame-1", b"frame-1", b"frame-2"])
+
+    first = writer.capture(driver, "test_a")
+    repeat = writer.capture(driver, "test_b")
+    second = writer.capture(driver, "test_c")
+    writer.close()
+
+    assert first == repeat == tmp_path / "test_a.jpg"
+    assert second.read_bytes() == b"frame-2"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["test_a.jpg", "test_c.jpg"]
+    assert driver.params[0] == {"format": "jpeg", "captureBeyondViewport": False, "quality": 50}
+
+
+def test_clip_and_size_cap(tmp_path):
+    """An element clip is passed to CDP and nothing is written past the size cap"""
+    writer = ScreenshotWriter(tmp_path, image_format="webp", max_total_mb=10 / 1024 ** 2, workers=1)
+    driver = FakeChrome([b"12345678", b"abcdefgh"])
+
+    assert writer.capture(driver, "test_a", clip_selector="main") == tmp_path / "test_a.webp"
+    assert writer.capture(driver, "test_b") is None
+    writer.close()
+
+    assert driver.params[0]["clip"] == {"x": 0, "y": 10, "width": 200, "height": 100, "scale": 1}
+    assert writer.skipped_over_cap == 1
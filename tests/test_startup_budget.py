@@ -0,0 +1,15 @@
+import pytest
+
+from config.config import TestData
+from utils.startup_benchmark import measure_import
+
+
+@pytest.mark.smoke
+@pytest.mark.parametrize("module", TestData.STARTUP_MODULES)
+def test_import_stays_lazy_and_within_budget(module):
+    """Importing framework modules must not load heavy optional dependencies or exceed the import budget"""
+    measurement = measure_import(module)
+    assert not measurement["eager_heavy_modules"], \
+        f"{module} imports {measurement['eager_heavy_modules']} at import time"
+    assert measurement["seconds"] <= TestData.IMPORT_BUDGET_SECONDS, \
+        f"{module} took {measurement['seconds']:.3f}s to import (budget {TestData.IMPORT_BUDGET_SECONDS}s)"
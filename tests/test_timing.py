@@ -0,0 +1,53 @@
+import os
+import threading
+import time
+
+from utils.timing import PROJECT_ROOT, TimingRecorder
+
+
+def sleep_from(file_name):
+    exec(compile("import time\ntime.sleep(0.01)", file_name, "exec"))
+
+
+def test_only_fixed_sleeps_of_project_code_are_counted():
+    """Library polling sleeps and sleeps inside a condition wait are not fixed sleeps"""
+    recorder = TimingRecorder()
+    real_sleep = time.sleep
+    recorder.track_sleeps()
+    try:
+        sleep_from(os.path.join(PROJECT_ROOT, "pages", "some_page.py"))
+        sleep_from(os.path.join(PROJECT_ROOT, ".venv", "lib", "site-packages", "selenium", "wait.py"))
+        sleep_from("/usr/lib/python3/dist-packages/selenium/webdriver/support/wait.py")
+        with recorder.waiting("presence_of_element_located"):
+            sleep_from(os.path.join(PROJECT_ROOT, "pages", "some_page.py"))
+    finally:
+        recorder.untrack_sleeps()
+
+    assert time.sleep is real_sleep
+    assert [record["name"] for record in recorder.records if record["category"] == "sleep"] == ["some_page.py:2"]
+    assert recorder.totals()["wait"]["count"] == 1
+
+
+def test_a_wait_on_another_thread_does_not_hide_a_fixed_sleep():
+    """A retry backoff or DB check waiting in the background leaves the test thread's sleeps counted"""
+    recorder = TimingRecorder()
+    entered, done = threading.Event(), threading.Event()
+
+    def background_wait():
+        with recorder.waiting("retry backoff"):
+            entered.set()
+            done.wait(1)
+
+    worker = threading.Thread(target=background_wait)
+    recorder.track_sleeps()
+    try:
+        worker.start()
+        entered.wait(1)
+        assert not recorder.in_wait
+        sleep_from(os.path.join(PROJECT_ROOT, "pages", "some_page.py"))
+    finally:
+        done.set()
+        worker.join()
+        recorder.untrack_sleeps()
+
+    assert [record["name"] for record in recorder.records if record["category"] == "sleep"] == ["some_page.py:2"]
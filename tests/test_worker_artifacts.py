@@ -0,0 +1,17 @@
+from utils.worker_artifacts import MASTER, WorkerArtifacts, clear_worker_folders, merge_worker_logs
+
+
+def test_a_reused_report_folder_merges_only_this_runs_workers(tmp_path):
+    """Logs left by an earlier run are emptied or removed, so no line is merged twice"""
+    for run in ("first", "second"):
+        clear_worker_folders(tmp_path)
+        controller = WorkerArtifacts(tmp_path, MASTER).create()
+        started = {"gw0", "gw1"} if run == "first" else {"gw0"}
+        for worker_id in sorted(started):
+            WorkerArtifacts(tmp_path, worker_id).create().log_file.write_text(
+                f'{{"run": "{run}", "worker": "{worker_id}"}}\n', encoding="utf-8")
+        if run == "second":
+            WorkerArtifacts(tmp_path, "gw1").create().log_file.write_text('{"run": "stale"}\n', encoding="utf-8")
+        merge_worker_logs(tmp_path, controller.log_file, started)
+
+    assert controller.log_file.read_text(encoding="utf-8").splitlines() == ['{"run": "second", "worker": "gw0"}']
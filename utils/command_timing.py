@@ -0,0 +1,126 @@
+"""
+Opt-in timing of every WebDriver command and BasePage helper call (TestData.COMMAND_TIMING or --command_timing).
+
+Commands are timed by wrapping the driver's execute(), through which every WebDriver and WebElement call
+goes, so find commands carry their locator. Helpers are timed by the timed_helpers class decorator.
+Both land in utils.timing.timings ("command" and "helper" records) next to the wait and sleep records.
+"""
+import functools
+import json
+import os
+import time
+
+from config.config import TestData
+from utils.timing import timings
+
+FIND_COMMANDS = ("findElement", "findElements", "findChildElement", "findChildElements")
+BREAKDOWN_CATEGORIES = ("command", "helper", "wait", "sleep")
+
+
+def instrument_driver(driver):
+    """Times every command sent through driver (once per driver, so pooled drivers are not wrapped twice)."""
+    if getattr(driver, "_timed_execute", False):
+        return driver
+    execute = driver.execute
+
+    def timed_execute(driver_command, params=None):
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            timings.record("command", command_name(driver_command, params), time.perf_counter() - start)
+
+    driver.execute = timed_execute
+    driver._timed_execute = True
+    return driver
+
+
+def command_name(driver_command, params):
+    """findElement css selector=#email, executeScript, get, ..."""
+    if driver_command in FIND_COMMANDS and params:
+        return f"{driver_command} {params.get('using')}={str(params.get('value'))[:80]}"
+    return driver_command
+
+
+def timed_helpers(cls):
+    """Class decorator: times the public methods of a page class as "helper" records while timing is on."""
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not callable(member) or isinstance(member, (staticmethod, classmethod)):
+            continue
+        setattr(cls, name, _timed_helper(member))
+    return cls
+
+
+def _timed_helper(method):
+    label = method.__qualname__
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if not TestData.COMMAND_TIMING:
+            return method(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            timings.record("helper", label, time.perf_counter() - start)
+
+    return wrapper
+
+
+def breakdown(records, categories=BREAKDOWN_CATEGORIES):
+    """
+    Aggregates timing records by category and name, slowest total first:
+    [{"category", "name", "count", "seconds", "max_seconds"}, ...]. Helpers include the commands and waits
+    they issue, so the categories overlap rather than add up.
+    """
+    rows = {}
+    for record in records:
+        if record["category"] not in categories:
+            continue
+        row = rows.setdefault((record["category"], record["name"]), {
+            "category": record["category"], "name": record["name"], "count": 0, "seconds": 0.0, "max_seconds": 0.0})
+        row["count"] += 1
+        row["seconds"] += record["seconds"]
+        row["max_seconds"] = max(row["max_seconds"], record["seconds"])
+    return sorted(rows.values(), key=lambda row: -row["seconds"])
+
+
+def breakdown_html(rows, limit=None):
+    """The breakdown as an HTML table for a pytest-html extra."""
+    body = "".join(
+        f"<tr><td>{row['category']}</td><td>{_escape(row['name'])}</td><td>{row['count']}</td>"
+        f"<td>{row['seconds']:.3f}</td><td>{row['max_seconds']:.3f}</td></tr>"
+        for row in rows[:limit])
+    return ("<table class=\"command-timings\"><tr><th>Category</th><th>Command / helper</th><th>Calls</th>"
+            f"<th>Total (s)</th><th>Max (s)</th></tr>{body}</table>")
+
+
+class SessionCommandStats:
+    """Session-wide totals of the per-test breakdowns, for the top-N summary and the JSON export."""
+
+    def __init__(self):
+        self.totals = {}
+        self.tests = {}
+
+    def add(self, nodeid, rows):
+        self.tests[nodeid] = rows
+        for row in rows:
+            total = self.totals.setdefault((row["category"], row["name"]), {
+                "category": row["category"], "name": row["name"], "count": 0, "seconds": 0.0, "max_seconds": 0.0})
+            total["count"] += row["count"]
+            total["seconds"] += row["seconds"]
+            total["max_seconds"] = max(total["max_seconds"], row["max_seconds"])
+
+    def top(self, n=None, categories=("command", "helper")):
+        rows = [row for row in self.totals.values() if row["category"] in categories]
+        return sorted(rows, key=lambda row: -row["seconds"])[:n or TestData.COMMAND_TIMING_TOP_N]
+
+    def save_json(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as json_file:
+            json.dump({"top": self.top(), "tests": self.tests}, json_file, indent=2)
+        return path
+
+
+def _escape(text):
+    return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
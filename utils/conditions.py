@@ -0,0 +1,58 @@
+"""Condition-based settling for things outside the DOM (downloads, native dialogs) instead of fixed sleeps."""
+import os
+import time
+
+from selenium.common import TimeoutException
+
+from config.config import TestData
+from utils.timing import timings
+
+PARTIAL_DOWNLOAD_SUFFIXES = (".crdownload", ".part", ".tmp", ".download")
+
+
+def wait_until(predicate, timeout, description, poll_frequency=0.2):
+    """
+    Calls predicate until it returns a truthy value and returns that value.
+    The time spent is recorded as a "wait"; TimeoutException is raised after timeout seconds.
+    """
+    deadline = time.monotonic() + timeout
+    with timings.waiting(description, mode="local"):
+        while True:
+            result = predicate()
+            if result:
+                return result
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"{description} not met within {timeout} seconds")
+            time.sleep(poll_frequency)
+
+
+def wait_for_download(directory, file_name=None, timeout=None, stable_for=0.5):
+    """
+    Waits until a download in directory has finished: the file (or, without file_name, any new file)
+    exists, no partial download is left and its size stopped changing. Returns the file path.
+    """
+    timeout = timeout or TestData.DOWNLOAD_WAIT_TIME
+    existing = set(os.listdir(directory)) if file_name is None and os.path.isdir(directory) else set()
+    last_size = {}
+
+    def finished():
+        if not os.path.isdir(directory):
+            return None
+        names = os.listdir(directory)
+        if any(name.endswith(PARTIAL_DOWNLOAD_SUFFIXES) for name in names):
+            return None
+        candidates = [file_name] if file_name else [name for name in names if name not in existing]
+        for name in candidates:
+            path = os.path.join(directory, name)
+            if not os.path.isfile(path):
+                continue
+            size, seen_at = os.path.getsize(path), time.monotonic()
+            previous = last_size.get(path)
+            if previous and previous[0] == size and seen_at - previous[1] >= stable_for:
+                return path
+            if not previous or previous[0] != size:
+                last_size[path] = (size, seen_at)
+        return None
+
+    return wait_until(finished, timeout, f"download of {file_name or 'a new file'} in {directory}")
+
@@ -0,0 +1,282 @@
+"""
+Compiles the test data files under TestData.DATA_FILES_PATH (CSV, Excel sheets, JSON lists of records)
+into uncompressed Arrow IPC files that later sessions and every xdist worker memory-map instead of
+parsing the spreadsheets again. A manifest records the SHA-256 of each source; a source whose content
+changed is compiled again, an unchanged one is never re-read.
+
+pyarrow is optional: without it nothing is compiled and the data provider parses the sources as before.
+
+Records do not need the same keys or one type per key: the schema is the union of all keys, a key a record
+does not have is remembered per row, and a column whose values mix types (int and float, number and text, ...)
+is stored as JSON text and decoded on read, so records() gives back exactly what parsing the source gives.
+The tables themselves are memory-mapped, but records() builds Python dicts from them (once per process, the
+data provider caches the result); read binary_cache.table() to work on the Arrow columns without converting.
+
+Usage:
+    (venv)$ python -m utils.data_compiler          # also run by conftest at session start
+"""
+import datetime
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+from config.config import TestData
+
+SOURCE_EXTENSIONS = (".csv", ".xlsx", ".xlsm", ".xls", ".json")
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 2  # entries compiled by an older layout are compiled again
+MISSING_KEYS_COLUMN = "__missing_keys__"
+NATIVE_TYPES = (str, int, float, bool, datetime.datetime, datetime.date, datetime.time)
+
+
+def arrow_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for block in iter(lambda: source.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BinaryDataCache:
+    """
+    The compiled tables of cache_dir and their manifest:
+    {source path relative to source_dir: {"sha256", "mtime_ns", "size", "tables": {table name: arrow file}}}.
+    Table names are sheet names for Excel, the top-level key for JSON objects of lists, "" otherwise.
+    """
+
+    def __init__(self, source_dir=None, cache_dir=None):
+        self.source_dir = os.path.abspath(source_dir or TestData.DATA_FILES_PATH)
+        self.cache_dir = os.path.abspath(cache_dir or TestData.DATA_CACHE_DIR)
+        self._manifest = None
+        self._lock = threading.Lock()
+
+    @property
+    def manifest(self):
+        if self._manifest is None:
+            try:
+                with open(os.path.join(self.cache_dir, MANIFEST), 'r') as manifest_file:
+                    self._manifest = json.load(manifest_file)
+            except (OSError, ValueError):
+                self._manifest = {}
+        return self._manifest
+
+    def compile(self):
+        """
+        Compiles every new or changed source and removes artifacts of sources that are gone.
+
+        Returns:
+            dict: {"compiled": [...], "unchanged": [...], "skipped": {source: reason}, "seconds": float}
+        """
+        start = time.perf_counter()
+        summary = {"compiled": [], "unchanged": [], "skipped": {}}
+        sources = self._sources()
+        if not sources:  # nothing to compile: pyarrow is not even imported
+            if self.manifest:
+                self._write_manifest({})
+                self._remove_stale_artifacts({})
+            summary["seconds"] = round(time.perf_counter() - start, 4)
+            return summary
+        if not arrow_available():
+            summary["skipped"]["*"] = "pyarrow is not installed"
+            summary["seconds"] = 0.0
+            return summary
+        os.makedirs(self.cache_dir, exist_ok=True)
+        manifest = {}
+        for path in sources:
+            source = os.path.relpath(path, self.source_dir)
+            entry = self.manifest.get(source)
+            if entry is not None and self._is_current(path, entry):
+                manifest[source] = entry
+                summary["unchanged"].append(source)
+                continue
+            try:
+                manifest[source] = self._compile_source(path)
+                summary["compiled"].append(source)
+            except Exception as e:  # mixed-type columns, non-tabular JSON, ...: parsed from source instead
+                summary["skipped"][source] = f"{type(e).__name__}: {e}"
+        self._write_manifest(manifest)
+        self._remove_stale_artifacts(manifest)
+        summary["seconds"] = round(time.perf_counter() - start, 4)
+        return summary
+
+    def table(self, path, table_name=""):
+        """
+        The compiled Arrow table of a source, memory-mapped (zero-copy), or None when the source has no
+        current compiled version.
+        """
+        source = os.path.relpath(os.path.abspath(path), self.source_dir)
+        entry = self.manifest.get(source)
+        if entry is None or source.startswith("..") or not arrow_available():
+            return None
+        with self._lock:
+            if not self._is_current(path, entry):
+                return None
+        tables = entry["tables"]  # in sheet order
+        if isinstance(table_name, int):
+            names = list(tables)
+            table_name = names[table_name] if table_name < len(names) else None
+        file_name = tables.get(table_name if table_name is not None else "")
+        if file_name is None:
+            return None
+        import pyarrow as pa
+
+        with pa.memory_map(os.path.join(self.cache_dir, file_name), 'r') as source_map:
+            return pa.ipc.open_file(source_map).read_all()
+
+    def records(self, path, table_name=""):
+        """The compiled records of a source, equal to the parsed ones, or None when it is not compiled."""
+        table = self.table(path, table_name)
+        return decode_records(table) if table is not None else None
+
+    def _sources(self):
+        if not os.path.isdir(self.source_dir):
+            return []
+        found = []
+        for folder, _, file_names in os.walk(self.source_dir):
+            found.extend(os.path.join(folder, name) for name in sorted(file_names)
+                         if name.lower().endswith(SOURCE_EXTENSIONS) and not name.startswith("~$"))
+        return found
+
+    @staticmethod
+    def _is_current(path, entry):
+        """Same size and mtime as when compiled, or else the same content hash (e.g. after a fresh checkout)."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if entry.get("format") != FORMAT_VERSION:
+            return False
+        if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        if stat.st_size != entry["size"] or file_hash(path) != entry["sha256"]:
+            return False
+        entry["mtime_ns"] = stat.st_mtime_ns
+        return True
+
+    def _compile_source(self, path):
+        import pyarrow as pa
+
+        sha256 = file_hash(path)
+        stat = os.stat(path)
+        tables = {}
+        for index, (table_name, records) in enumerate(self._read_tables(path)):
+            file_name = f"{sha256[:16]}-{index}.arrow"
+            self._write_table(encode_records(records), file_name)
+            tables[table_name] = file_name
+        return {"format": FORMAT_VERSION, "sha256": sha256, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                "tables": tables}
+
+    @staticmethod
+    def _read_tables(path):
+        from utils.data_reader import DataProvider
+
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".csv":
+            return [("", DataProvider._parse(path, 0, None))]
+        if extension == ".json":
+            with open(path, 'r', encoding='utf-8') as json_file:
+                data = json.load(json_file)
+            if isinstance(data, list):
+                return [("", data)]
+            if isinstance(data, dict) and all(isinstance(value, list) for value in data.values()):
+                return list(data.items())
+            raise ValueError("not a list of records")
+        from utils.excel_parser import Excel_Parser
+
+        return [(name, Excel_Parser.read_records(path, name)) for name in Excel_Parser.sheet_names(path)]
+
+    def _write_table(self, table, file_name):
+        import pyarrow as pa
+
+        path = os.path.join(self.cache_dir, file_name)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with pa.OSFile(temp_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)  # uncompressed IPC, so readers can memory-map it
+        os.replace(temp_path, path)
+
+    def _write_manifest(self, manifest):
+        path = os.path.join(self.cache_dir, MANIFEST)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        os.replace(temp_path, path)
+        self._manifest = manifest
+
+    def _remove_stale_artifacts(self, manifest):
+        current = {file_name for entry in manifest.values() for file_name in entry["tables"].values()}
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith(".arrow") and file_name not in current:
+                try:
+                    os.remove(os.path.join(self.cache_dir, file_name))
+                except OSError as e:
+                    logging.warning(f"Could not remove stale data cache file {file_name}: {e}")
+
+
+def encode_records(records):
+    """
+    Arrow table of records whose schema is the union of their keys (in first-seen order).
+
+    Raises:
+        TypeError: If a mixed-type column holds a value JSON cannot store (the source is then not compiled).
+    """
+    import pyarrow as pa
+
+    names = list(dict.fromkeys(key for record in records for key in record))
+    columns = {}
+    json_columns = []
+    for name in names:
+        values = [record.get(name) for record in records]
+        types = {type(value) for value in values if value is not None}
+        if len(types) > 1 or any(not issubclass(kind, NATIVE_TYPES) for kind in types):
+            # one Arrow type per column would turn 10 into 10.0 or fail outright: keep the exact values as JSON
+            values = [None if value is None else json.dumps(value) for value in values]
+            json_columns.append(name)
+        columns[name] = values
+    missing = [[name for name in names if name not in record] for record in records]
+    if any(missing):
+        columns[MISSING_KEYS_COLUMN] = [json.dumps(keys) if keys else None for keys in missing]
+    table = pa.Table.from_pydict(columns)
+    return table.replace_schema_metadata({"json_columns": json.dumps(json_columns)})
+
+
+def decode_records(table):
+    """The records encode_records() was given."""
+    metadata = table.schema.metadata or {}
+    json_columns = json.loads(metadata.get(b"json_columns", b"[]"))
+    records = table.to_pylist()
+    for record in records:
+        for name in json_columns:
+            if record[name] is not None:
+                record[name] = json.loads(record[name])
+        missing = record.pop(MISSING_KEYS_COLUMN, None)
+        for name in json.loads(missing) if missing else ():
+            del record[name]
+    return records
+
+
+binary_cache = BinaryDataCache()
+
+
+def main():
+    summary = binary_cache.compile()
+    print(f"compiled {len(summary['compiled'])}, unchanged {len(summary['unchanged'])} "
+          f"in {summary['seconds']}s -> {binary_cache.cache_dir}")
+    for source, reason in summary["skipped"].items():
+        print(f"skipped {source}: {reason}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""
+One place to read test data: JSON, CSV and Excel files are loaded once per session into a shared cache
+and handed out as records (dicts) to tests and to the data_driven marker.
+
+Example:
+    @pytest.mark.data_driven("users.csv", "user", where={"active": "yes"}, id_column="email")
+    def test_profile(login_page, user):
+        ...
+
+    for user in data_provider.rows("users.xlsx", sheet_name="active"):
+        ...
+"""
+import copy
+import csv
+import json
+import os
+import threading
+import time
+
+from config.config import TestData
+from utils.data_compiler import binary_cache
+
+
+class DataProvider:
+    """Session-wide cache of parsed data files, keyed on path, sheet / JSON key and modification time."""
+
+    def __init__(self):
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.loads = {}  # file -> seconds spent parsing it
+        self.hits = 0
+        self.misses = 0
+        self.compiled_loads = 0  # misses served from the precompiled Arrow cache (utils/data_compiler.py)
+
+    def load(self, file_path, sheet_name=0, key=None):
+        """
+        Returns the parsed content of a data file, parsing it only the first time (or after it changed).
+        JSON gives the decoded document (or document[key]), CSV and Excel a list of dicts keyed by the header row.
+        The result is shared between callers: treat it as read-only.
+        """
+        path = resolve_path(file_path)
+        cache_key = (path, os.stat(path).st_mtime_ns, sheet_name, key)
+        with self._lock:
+            if cache_key in self._cache:
+                self.hits += 1
+                return self._cache[cache_key]
+        start = time.perf_counter()
+        data = self._from_compiled(path, sheet_name, key)
+        compiled = data is not None
+        if not compiled:
+            data = self._parse(path, sheet_name, key)
+        seconds = time.perf_counter() - start
+        with self._lock:
+            self._cache[cache_key] = data
+            self.misses += 1
+            self.compiled_loads += compiled
+            self.loads[os.path.relpath(path, TestData.ROOT_DIR)] = seconds
+        return data
+
+    def rows(self, file_path, sheet_name=0, key=None, where=None, limit=None):
+        """
+        Yields the records of a data file one at a time, optionally only those matching every
+        column == value pair of where, and at most limit of them.
+        """
+        for _, record in self.indexed_rows(file_path, sheet_name, key, where, limit):
+            yield record
+
+    def indexed_rows(self, file_path, sheet_name=0, key=None, where=None, limit=None):
+        """Like rows(), with the position of each record in the file's records: (index, record) pairs."""
+        matched = 0
+        for index, record in enumerate(self.load(file_path, sheet_name, key)):
+            if limit is not None and matched >= limit:
+                return
+            if where and any(record.get(column) != value for column, value in where.items()):
+                continue
+            matched += 1
+            yield index, record
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self):
+        return {"files": len(self.loads), "hits": self.hits, "misses": self.misses,
+                "compiled_loads": self.compiled_loads, "load_seconds": round(sum(self.loads.values()), 4)}
+
+    def describe(self):
+        stats = self.stats()
+        return (f"{stats['files']} file(s) loaded in {stats['load_seconds']}s "
+                f"({stats['compiled_loads']} from the compiled cache), "
+                f"{stats['hits']} cache hit(s), {stats['misses']} miss(es)")
+
+    @staticmethod
+    def _from_compiled(path, sheet_name, key):
+        if not TestData.DATA_CACHE_ENABLED:
+            return None
+        is_json = path.lower().endswith(".json")
+        return binary_cache.records(path, key if is_json else sheet_name)
+
+    @staticmethod
+    def _parse(path, sheet_name, key):
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".json":
+            with open(path, 'r', encoding='utf-8') as json_file:
+                data = json.load(json_file)
+            return data[key] if key is not None else data
+        if extension == ".csv":
+            with open(path, 'r', newline='', encoding='utf-8-sig') as csv_file:
+                return list(csv.DictReader(csv_file))
+        if extension in (".xlsx", ".xlsm", ".xls"):
+            from utils.excel_parser import Excel_Parser
+
+            return Excel_Parser.read_records(path, sheet_name)
+        raise ValueError(f"Unsupported test data file: {path}")
+
+
+def resolve_path(file_path):
+    """Relative paths are resolved against TestData.DATA_FILES_PATH."""
+    return os.path.abspath(file_path if os.path.isabs(file_path) else os.path.join(TestData.DATA_FILES_PATH, file_path))
+
+
+class DataRow:
+    """
+    A record of a data file by position: what a data_driven test is parametrized with. load_data_rows() swaps
+    it for a private copy of the record when the test is set up, so collection keeps no copies of the data.
+    """
+    __slots__ = ("file_path", "sheet_name", "key", "index")
+
+    def __init__(self, file_path, sheet_name, key, index):
+        self.file_path = file_path
+        self.sheet_name = sheet_name
+        self.key = key
+        self.index = index
+
+    def load(self):
+        return copy.deepcopy(data_provider.load(self.file_path, self.sheet_name, self.key)[self.index])
+
+    def __repr__(self):
+        return f"<DataRow {self.file_path}[{self.index}]>"
+
+
+def parametrize_from_marker(metafunc, marker):
+    """
+    Parametrizes a test from its data_driven marker:
+    data_driven(file_path, argname="data", sheet_name=0, key=None, where=None, limit=None, id_column=None).
+
+    Runs from pytest_generate_tests, so the file is read when the test is collected (once per session,
+    whichever tests share it), never at import time. Every parameter set is only a DataRow and an id;
+    the record itself is copied out of the cache when the test is set up (see load_data_rows).
+    """
+    file_path = marker.args[0] if marker.args else marker.kwargs["file_path"]
+    argname = marker.args[1] if len(marker.args) > 1 else marker.kwargs.get("argname", "data")
+    sheet_name, key = marker.kwargs.get("sheet_name", 0), marker.kwargs.get("key")
+    id_column = marker.kwargs.get("id_column")
+    rows, ids = [], []
+    for index, record in data_provider.indexed_rows(file_path, sheet_name=sheet_name, key=key,
+                                                    where=marker.kwargs.get("where"),
+                                                    limit=marker.kwargs.get("limit")):
+        rows.append(DataRow(file_path, sheet_name, key, index))
+        if id_column:
+            ids.append(str(record.get(id_column)))
+    metafunc.parametrize(argname, rows, ids=ids or None)
+
+
+def load_data_rows(item):
+    """
+    Replaces the DataRows a collected test is parametrized with by copies of their records; call it before the
+    test's fixtures are set up. Returns the DataRows, for unload_data_rows() once the test is torn down.
+    """
+    params = item.callspec.params if hasattr(item, "callspec") else {}
+    rows = {name: value for name, value in params.items() if isinstance(value, DataRow)}
+    for name, row in rows.items():
+        params[name] = row.load()
+    return rows
+
+
+def unload_data_rows(item, rows):
+    """Puts the DataRows back, so the finished test no longer holds its records."""
+    if rows:
+        item.callspec.params.update(rows)
+
+
+data_provider = DataProvider()
@@ -0,0 +1,131 @@
+"""Seeds test data inside a savepoint and rolls it back at teardown instead of running DELETE queries."""
+import importlib
+import json
+import os
+import time
+
+from config.config import TestData
+
+SAVEPOINT = "test_data_seed"
+
+
+class DataSeeder:
+    """
+    Bulk-inserts rows on one DB-API connection (a pooled psycopg2 connection, or sqlite3 as a local stand-in)
+    inside a savepoint, so cleanup is a single rollback however many rows were seeded.
+
+    Example:
+        seeder = DataSeeder(connection).begin()
+        seeder.seed("employee", [{"employee_id": 1, "name": "Jane"}])
+        ...
+        seeder.rollback()
+    """
+
+    def __init__(self, connection, page_size=1000):
+        self.connection = connection
+        self.page_size = page_size
+        self.driver_module = type(connection).__module__.split(".")[0]
+        self.paramstyle = importlib.import_module(self.driver_module).paramstyle
+        self.rows_seeded = 0
+        self.seed_seconds = 0.0
+        self.cleanup_seconds = 0.0
+        self._active = False
+
+    def begin(self):
+        cursor = self.connection.cursor()
+        cursor.execute(f"SAVEPOINT {SAVEPOINT}")
+        cursor.close()
+        self._active = True
+        return self
+
+    def seed(self, table, rows, columns=None):
+        """
+        Inserts rows (dicts, or sequences in the order of columns) into table in batches.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        if columns is None:
+            if not isinstance(rows[0], dict):
+                raise ValueError("Pass columns when rows are not dictionaries")
+            columns = list(rows[0].keys())
+        values = [tuple(row[column] for column in columns) if isinstance(row, dict) else tuple(row) for row in rows]
+
+        start = time.perf_counter()
+        column_list = ", ".join(_quote(column) for column in columns)
+        cursor = self.connection.cursor()
+        try:
+            if self.driver_module == "psycopg2":
+                from psycopg2.extras import execute_values  # one round trip per page instead of per row
+
+                execute_values(cursor, f"INSERT INTO {_quote(table)} ({column_list}) VALUES %s", values,
+                               page_size=self.page_size)
+            else:
+                placeholders = ", ".join(self._placeholder(index) for index in range(len(columns)))
+                cursor.executemany(f"INSERT INTO {_quote(table)} ({column_list}) VALUES ({placeholders})", values)
+        finally:
+            cursor.close()
+        self.seed_seconds += time.perf_counter() - start
+        self.rows_seeded += len(values)
+        return len(values)
+
+    def seed_from_file(self, table, file_path, sheet_name=0):
+        """
+        Seeds rows from a JSON (list of objects, or {table: [...]}), CSV or Excel file.
+        Relative paths are resolved against TestData.DATA_FILES_PATH.
+        """
+        path = file_path if os.path.isabs(file_path) else os.path.join(TestData.DATA_FILES_PATH, file_path)
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".json":
+            with open(path, 'r') as json_file:
+                data = json.load(json_file)
+            rows = data.get(table, []) if isinstance(data, dict) else data
+            return self.seed(table, rows)
+
+        import pandas as pd
+
+        if extension == ".csv":
+            frame = pd.read_csv(path)
+        elif extension in (".xlsx", ".xls"):
+            frame = pd.read_excel(path, sheet_name=sheet_name)
+        else:
+            raise ValueError(f"Unsupported test data file: {path}")
+        frame = frame.astype(object).where(frame.notna(), None)  # NaN -> NULL
+        return self.seed(table, frame.itertuples(index=False, name=None), columns=list(frame.columns))
+
+    def rollback(self):
+        """Undoes everything seeded (and written) on this connection since begin()."""
+        if not self._active:
+            return
+        start = time.perf_counter()
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {SAVEPOINT}")
+            cursor.execute(f"RELEASE SAVEPOINT {SAVEPOINT}")
+        finally:
+            cursor.close()
+            self.connection.rollback()
+            self._active = False
+        self.cleanup_seconds += time.perf_counter() - start
+
+    def stats(self):
+        return {
+            "rows_seeded": self.rows_seeded,
+            "seed_seconds": round(self.seed_seconds, 4),
+            "cleanup_seconds": round(self.cleanup_seconds, 4),
+        }
+
+    def _placeholder(self, index):
+        return {
+            "qmark": "?",
+            "numeric": f":{index + 1}",
+            "format": "%s",
+            "pyformat": "%s",
+        }[self.paramstyle]
+
+
+def _quote(identifier):
+    return '"' + str(identifier).replace('"', '""') + '"'
@@ -0,0 +1,82 @@
+"""Database checks that run in the background while the test keeps driving the UI."""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.config import TestData
+from utils.timing import timings
+
+
+class DbCheckRunner:
+    """
+    Runs queries on a bounded thread pool over the pooled connections of a DatabaseHelper.
+
+    Example:
+        orders = db_checks.submit("select status from orders where id = %s", (order_id,))
+        page.open_invoice()                      # the query runs meanwhile
+        assert db_checks.result(orders) == [("PAID",)]
+    """
+
+    def __init__(self, db, max_workers=None):
+        self.db = db
+        # more workers than pooled connections would only queue for a connection (DatabaseHelper waits for one)
+        workers = min(max_workers or TestData.DB_CHECK_WORKERS, TestData.DB_POOL_MAX_CONNECTIONS)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-check")
+        self._lock = threading.Lock()
+        self._checks = {}
+
+    def submit(self, query, params=None, with_column_names=False):
+        """Starts a query and returns a Future with its rows (dicts when with_column_names is True)."""
+        state = {"connection": None}
+        record = timings.for_current_test()  # the check may finish after the test that started it
+        future = self._executor.submit(self._run, state, record, query, params, with_column_names)
+        with self._lock:
+            self._checks[future] = state
+        future.add_done_callback(self._forget)
+        return future
+
+    def result(self, future, timeout=None):
+        """Waits for a check started with submit(); raises TimeoutError or the query's own error."""
+        return future.result(timeout=timeout or TestData.DB_CHECK_TIMEOUT)
+
+    def gather(self, futures, timeout=None):
+        """Results of several checks in the order they were given, sharing one overall timeout."""
+        deadline = time.monotonic() + (timeout or TestData.DB_CHECK_TIMEOUT)
+        return [future.result(timeout=max(0.0, deadline - time.monotonic())) for future in futures]
+
+    def cancel_all(self):
+        """Cancels queued checks, asks the server to cancel running ones and shuts the pool down."""
+        with self._lock:
+            pending = list(self._checks.items())
+        for future, state in pending:
+            connection = state["connection"]
+            if not future.cancel() and connection is not None:
+                try:
+                    connection.cancel()
+                except Exception as e:
+                    logging.warning(f"Could not cancel running database check: {e}")
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run(self, state, record, query, params, with_column_names):
+        start = time.perf_counter()
+        try:
+            with self.db.pooled_connection() as connection:
+                state["connection"] = connection
+                try:
+                    with connection.cursor() as cursor:
+                        cursor.execute(query, params)
+                        rows = cursor.fetchall() if cursor.description else []
+                        if with_column_names:
+                            column_names = [desc[0] for desc in cursor.description]
+                            rows = [dict(zip(column_names, row)) for row in rows]
+                    connection.commit()
+                    return rows
+                finally:
+                    state["connection"] = None
+        finally:
+            record("db", f"check {' '.join(query.split())[:60]}", time.perf_counter() - start)
+
+    def _forget(self, future):
+        with self._lock:
+            self._checks.pop(future, None)
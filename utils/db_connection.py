@@ -1,9 +1,21 @@
-from datetime import datetime
+import threading
+import uuid
+from contextlib import contextmanager
 
-import psycopg2
+from config.config import TestData
 
 
 class DatabaseHelper:
+    """
+    Runs queries over a connection pool shared by every DatabaseHelper (and so every page object)
+    pointing at the same database. The pools live for the whole session; conftest closes them at the end.
+    When every connection is borrowed (by the test, db_seed, background checks, ...) the next borrower waits
+    up to TestData.DB_POOL_WAIT_TIMEOUT for one instead of failing on an exhausted pool.
+    Pass query parameters separately (%s placeholders) instead of building SQL strings.
+    """
+    _pools = {}
+    _slots = {}  # pool key -> semaphore counting the connections that are free
+    _pools_lock = threading.Lock()
 
     def __init__(self, host, username, password, dbname, port):
         self.host = host
@@ -14,62 +26,129 @@ class DatabaseHelper:
         self.connection = None
         self.cursor = None
 
-    def connect(self):
+    def _key(self):
+        return self.host, self.port, self.database, self.username
+
+    def _pool(self):
+        key = self._key()
+        with self._pools_lock:
+            if key not in self._pools:
+                from psycopg2.pool import ThreadedConnectionPool  # only loaded when a test really talks to the database
+
+                self._pools[key] = ThreadedConnectionPool(
+                    TestData.DB_POOL_MIN_CONNECTIONS,
+                    TestData.DB_POOL_MAX_CONNECTIONS,
+                    host=self.host,
+                    user=self.username,
+                    password=self.password,
+                    dbname=self.database,
+                    port=self.port,
+                )
+                self._slots[key] = threading.BoundedSemaphore(TestData.DB_POOL_MAX_CONNECTIONS)
+            return self._pools[key]
+
+    def _borrow(self):
+        pool = self._pool()
+        slots = self._slots[self._key()]
+        if not slots.acquire(timeout=TestData.DB_POOL_WAIT_TIMEOUT):
+            raise TimeoutError(f"No pooled connection to {self.database} was free after "
+                               f"{TestData.DB_POOL_WAIT_TIMEOUT}s ({TestData.DB_POOL_MAX_CONNECTIONS} in use)")
+        try:
+            return pool.getconn()
+        except Exception:
+            slots.release()
+            raise
+
+    def _give_back(self, connection):
         try:
-            self.connection = psycopg2.connect(
-                host=self.host,
-                username=self.username,
-                password=self.password,
-                database=self.database,
-            )
+            self._pool().putconn(connection, close=bool(connection.closed))
+        finally:
+            self._slots[self._key()].release()
+
+    @contextmanager
+    def pooled_connection(self):
+        """Borrows a connection from the pool and always hands it back without an open transaction."""
+        connection = self._borrow()
+        try:
+            yield connection
+        finally:
+            try:
+                if not connection.closed:
+                    connection.rollback()  # no-op after a commit, discards anything left open
+            finally:
+                self._give_back(connection)
 
+    def connect(self):
+        """Keeps a pooled connection and cursor on the helper until disconnect() is called."""
+        try:
+            self.connection = self._borrow()
             self.cursor = self.connection.cursor()
             print("Connected to the database.")
         except Exception as e:
             print(f"Error connecting to the database: {e}")
 
-    def execute_query(self, query):
-        self.connection()
+    def execute_query(self, query, params=None):
+        """Runs a query and commits it. Returns all rows for queries that return rows, None on error."""
         try:
-            self.cursor.execute(query)
-            self.connection.commit()
-            print("Query executed successfully.")
-            result = self.cursor.fetchall()
-            return result
+            with self.pooled_connection() as connection, connection.cursor() as cursor:
+                cursor.execute(query, params)
+                result = cursor.fetchall() if cursor.description else []
+                connection.commit()
+                print("Query executed successfully.")
+                return result
         except Exception as e:
             print(f"Error executing query: {e}")
             return None
-        finally:
-            self.connection.rollback()
-            self.disconnect()
-
-    def fetch_rows_with_column_names(self, query):
-        rows_with_column_names = []
-        rows = self.execute_query(query)
-        # Fetch column names
-        column_names = [desc[0] for desc in self.cursor.description]
-        # Fetch rows
-        for row in rows:
-            # Create a dictionary for each row with column names as keys
-            row_dict = dict(zip(column_names, rows))
-            rows_with_column_names.append(row_dict)
-        return rows_with_column_names
-
-    def delete_query(self, query):
-        self.connection()
+
+    def fetch_rows_with_column_names(self, query, params=None):
+        """Returns every row as a dict keyed by column name."""
+        try:
+            with self.pooled_connection() as connection, connection.cursor() as cursor:
+                cursor.execute(query, params)
+                column_names = [desc[0] for desc in cursor.description]
+                return [dict(zip(column_names, row)) for row in cursor.fetchall()]
+        except Exception as e:
+            print(f"Error executing query: {e}")
+            return []
+
+    def stream_query(self, query, params=None, batch_size=None):
+        """
+        Yields the rows of a large result as plain tuples through a server-side cursor,
+        fetching batch_size rows per round trip, so memory stays flat whatever the row count.
+        The connection goes back to the pool once the generator is exhausted or closed.
+        """
+        with self.pooled_connection() as connection:
+            with connection.cursor(name=f"stream_{uuid.uuid4().hex}") as cursor:
+                cursor.itersize = batch_size or TestData.DB_STREAM_BATCH_SIZE
+                cursor.execute(query, params)
+                for row in cursor:
+                    yield row
+
+    def delete_query(self, query, params=None):
+        """Runs a write statement, commits it and returns the number of affected rows."""
         try:
-            self.cursor.execute(query)
-            self.connection.commit()
-            print("Query executed successfully")
+            with self.pooled_connection() as connection, connection.cursor() as cursor:
+                cursor.execute(query, params)
+                connection.commit()
+                print("Query executed successfully")
+                return cursor.rowcount
         except Exception as e:
             print(f"Error fetching data: {e}")
             return None
-        finally:
-            self.connection.rollback()
-            self.disconnect()
 
     def disconnect(self):
         if self.connection:
-            self.connection.close()
+            self.cursor.close()
+            self._give_back(self.connection)
+            self.connection = None
+            self.cursor = None
             print("Disconnected from the database")
 
+    @classmethod
+    def close_all_pools(cls):
+        """Closes every pooled connection; called once at the end of the session."""
+        with cls._pools_lock:
+            for pool in cls._pools.values():
+                pool.closeall()
+            cls._pools.clear()
+            cls._slots.clear()
@@ -0,0 +1,132 @@
+"""
+Waits that run inside the page: a MutationObserver plus a readyState listener resolve an async script
+as soon as the condition holds, so a wait costs one WebDriver round trip instead of one per poll.
+"""
+import time
+
+from selenium.common import InvalidSelectorException, JavascriptException, TimeoutException, WebDriverException
+
+CONDITIONS = ("presence", "visibility", "invisibility", "clickable", "text", "ready", "interactive")
+
+OBSERVER_SCRIPT = """
+var by = arguments[0], value = arguments[1], condition = arguments[2], text = arguments[3],
+    timeoutMs = arguments[4], done = arguments[arguments.length - 1];
+
+function find() {
+    switch (by) {
+        case 'id': var el = document.getElementById(value); return el ? [el] : [];
+        case 'name': return Array.from(document.getElementsByName(value));
+        case 'class name': return Array.from(document.getElementsByClassName(value));
+        case 'tag name': return Array.from(document.getElementsByTagName(value));
+        case 'css selector': return Array.from(document.querySelectorAll(value));
+        case 'xpath':
+            var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+            return nodes;
+        case 'link text':
+        case 'partial link text':
+            return Array.from(document.getElementsByTagName('a')).filter(function (a) {
+                var linkText = (a.innerText || a.textContent).trim();
+                return by === 'link text' ? linkText === value : linkText.indexOf(value) !== -1;
+            });
+    }
+    return [];
+}
+
+function visible(el) {
+    if (!el.isConnected || !el.getClientRects().length) { return false; }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+}
+
+function check() {
+    if (condition === 'ready') { return document.readyState === 'complete' ? [true, true] : [false]; }
+    if (condition === 'interactive') { return document.readyState !== 'loading' ? [true, true] : [false]; }
+    var el = find()[0];
+    switch (condition) {
+        case 'presence': return el ? [true, el] : [false];
+        case 'visibility': return el && visible(el) ? [true, el] : [false];
+        case 'invisibility': return !el || !visible(el) ? [true, true] : [false];
+        case 'clickable': return el && visible(el) && !el.disabled ? [true, el] : [false];
+        case 'text': return el && (el.innerText || el.textContent).indexOf(text) !== -1 ? [true, el] : [false];
+    }
+    return [false];
+}
+
+var finished = false, observer = null, safetyTimer = null, timeoutTimer = null;
+
+function finish(met, result, error) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    document.removeEventListener('readystatechange', evaluate);
+    clearInterval(safetyTimer);
+    clearTimeout(timeoutTimer);
+    done({met: met, value: met ? result : null, error: error || null});
+}
+
+function evaluate() {
+    var state;
+    try { state = check(); } catch (e) { finish(false, null, String(e)); return; }
+    if (state[0]) { finish(true, state[1]); }
+}
+
+evaluate();
+if (!finished) {
+    observer = new MutationObserver(evaluate);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    document.addEventListener('readystatechange', evaluate);
+    // CSS-only changes (transitions, media queries) fire no mutation, so re-check in page now and then
+    safetyTimer = setInterval(evaluate, 250);
+    timeoutTimer = setTimeout(function () { finish(false); }, timeoutMs);
+}
+"""
+
+
+class DomWait:
+    """
+    Waits for a condition on a (By, value) locator through an in-page observer.
+    Returns the element (or True for invisibility/ready/interactive) like the WebDriverWait equivalents
+    and raises TimeoutException when the condition is not met in time.
+    """
+
+    def __init__(self, driver, timeout):
+        self.driver = driver
+        self.timeout = timeout
+        self._script_timeout = None
+
+    def until(self, condition, locator=None, text=None, timeout=None):
+        if condition not in CONDITIONS:
+            raise ValueError(f"Unsupported wait condition: {condition}")
+        timeout = timeout or self.timeout
+        by, value = locator if locator else (None, None)
+        self._ensure_script_timeout(timeout)
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                result = self.driver.execute_async_script(OBSERVER_SCRIPT, by, value, condition, text,
+                                                          int(remaining * 1000))
+            except JavascriptException:
+                # the document was replaced by a navigation while observing; observe the new one
+                continue
+            except TimeoutException:
+                break
+            if result and result.get("error"):
+                raise InvalidSelectorException(f"{locator}: {result['error']}")
+            if result and result.get("met"):
+                return result["value"]
+            break
+        raise TimeoutException(f"'{condition}' of {locator} not met within {timeout} seconds")
+
+    def _ensure_script_timeout(self, timeout):
+        # the in-page timer resolves first; the script timeout only guards against a hung page
+        if self._script_timeout is None or self._script_timeout < timeout + 5:
+            self._script_timeout = timeout + 5
+            try:
+                self.driver.set_script_timeout(self._script_timeout)
+            except WebDriverException as e:
+                print(f"Error setting script timeout: {e}")
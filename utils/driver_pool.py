@@ -0,0 +1,149 @@
+"""Session-wide pool of warm WebDriver sessions."""
+import logging
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from selenium.common import WebDriverException
+
+
+class DriverPool:
+    """
+    Keeps browser sessions alive for the whole test session and hands them out with a clean state.
+
+    Args:
+        factory (callable): Builds a new, fully configured driver.
+        size (int): Maximum number of idle sessions kept warm between users.
+    """
+
+    def __init__(self, factory, size=1):
+        self._factory = factory
+        self.size = max(1, size)
+        self._idle = deque()
+        self._drivers = []
+        self.launches = 0
+        self.checkouts = 0
+        self.reset_times = []
+
+    @property
+    def launches_saved(self):
+        return self.checkouts - self.launches
+
+    def acquire(self):
+        """Returns a warm driver if one is idle, otherwise launches a new browser."""
+        driver = self._idle.popleft() if self._idle else self._launch()
+        self.checkouts += 1
+        return driver
+
+    def release(self, driver):
+        """Resets the driver state and puts it back in the pool; broken sessions are discarded."""
+        if driver not in self._drivers:
+            return
+        if len(self._idle) >= self.size:
+            self._discard(driver)
+            return
+        try:
+            self.reset(driver)
+        except WebDriverException as e:
+            logging.warning(f"Discarding pooled driver after failed reset: {e}")
+            self._discard(driver)
+            return
+        self._idle.append(driver)
+
+    def reset(self, driver):
+        """Closes extra tabs and clears cookies and storage so the next user starts clean."""
+        start = time.perf_counter()
+        cdp = hasattr(driver, "execute_cdp_cmd")
+        origins = visited_origins(driver) if cdp else ()  # before the extra tabs are closed
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+        driver.delete_all_cookies()
+        if cdp:
+            # Chromium only: cookies of every domain, and the storage of every origin the session visited
+            # (CDP has no wildcard origin, each one is cleared by name)
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in sorted(origins):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        getattr(driver, "_visited_origins", set()).clear()
+        driver.get("about:blank")
+        self.reset_times.append(time.perf_counter() - start)
+
+    def close(self):
+        """Quits every browser owned by the pool."""
+        for driver in list(self._drivers):
+            self._discard(driver)
+        self._idle.clear()
+
+    def stats(self):
+        resets = len(self.reset_times)
+        return {
+            "launches": self.launches,
+            "checkouts": self.checkouts,
+            "launches_saved": self.launches_saved,
+            "resets": resets,
+            "avg_reset_seconds": round(sum(self.reset_times) / resets, 3) if resets else 0.0,
+            "max_reset_seconds": round(max(self.reset_times), 3) if resets else 0.0,
+        }
+
+    def describe(self):
+        stats = self.stats()
+        return (f"{stats['launches']} browser launch(es) for {stats['checkouts']} checkout(s), "
+                f"{stats['launches_saved']} launch(es) saved; {stats['resets']} reset(s), "
+                f"avg {stats['avg_reset_seconds']}s, max {stats['max_reset_seconds']}s")
+
+    def _launch(self):
+        driver = track_origins(self._factory())
+        self.launches += 1
+        self._drivers.append(driver)
+        return driver
+
+    def _discard(self, driver):
+        if driver in self._idle:
+            self._idle.remove(driver)
+        self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            print(f"Error closing browser: {e}")
+
+
+def track_origins(driver):
+    """Remembers the origin of every URL the driver is sent to with get(), so reset() can clear its storage."""
+    if hasattr(driver, "_visited_origins"):
+        return driver
+    driver._visited_origins = set()
+    execute = driver.execute
+
+    def tracking_execute(driver_command, params=None):
+        if driver_command == "get" and params:
+            _add_origin(driver._visited_origins, params.get("url"))
+        return execute(driver_command, params)
+
+    driver.execute = tracking_execute
+    return driver
+
+
+def visited_origins(driver):
+    """
+    Origins the session has used: those opened with get(), those of its open windows (reached by clicks and
+    redirects) and, when the network capture is on, every origin a document or request was loaded from.
+    """
+    origins = set(getattr(driver, "_visited_origins", ()))
+    for handle in driver.window_handles:
+        driver.switch_to.window(handle)
+        _add_origin(origins, driver.current_url)
+    capture = getattr(driver, "network_capture", None)
+    if capture is not None and capture.enabled:
+        for entry in capture.query():
+            _add_origin(origins, entry.url)
+    return origins
+
+
+def _add_origin(origins, url):
+    parts = urlsplit(url or "")
+    if parts.scheme in ("http", "https") and parts.netloc:
+        origins.add(f"{parts.scheme}://{parts.netloc}")
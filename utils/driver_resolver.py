@@ -0,0 +1,190 @@
+"""Resolves WebDriver binaries once per session from a local manifest, without touching the network."""
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+from config.config import TestData
+
+DRIVER_BINARIES = {
+    "chrome": "chromedriver",
+    "firefox": "geckodriver",
+    "IE": "IEDriverServer",
+}
+BROWSER_BINARIES = {  # asked for --version to notice a browser update; IE has no such command
+    "chrome": ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"),
+    "firefox": ("firefox",),
+    "IE": (),
+}
+VERSION = re.compile(r"\d+(?:\.\d+)+")
+
+
+class DriverResolver:
+    """
+    Looks up the driver binary for a browser in this order:
+    environment override (e.g. CHROMEDRIVER_PATH), drivers/manifest.json, a binary dropped in drivers/,
+    the system PATH and, only when offline mode is off, webdriver_manager (the download is copied into drivers/).
+
+    The manifest records a driver in drivers/ with its version and the browser version it was resolved for.
+    After a browser update the entry no longer matches and the driver is resolved again, skipping a
+    ChromeDriver whose major version differs from Chrome's. Environment overrides and binaries outside
+    drivers/ are used but never recorded: the manifest is committed and must not hold one machine's paths.
+    """
+    _resolved = {}
+
+    def __init__(self, driver_dir=TestData.DRIVER_PATH, offline=TestData.DRIVER_OFFLINE):
+        self.driver_dir = driver_dir
+        self.offline = offline
+        self.manifest_path = os.path.join(driver_dir, TestData.DRIVER_MANIFEST)
+
+    def resolve(self, browser_name):
+        if browser_name in self._resolved:
+            return self._resolved[browser_name]
+        if browser_name not in DRIVER_BINARIES:
+            raise ValueError(f"Unsupported browser: {browser_name}")
+
+        path = self._from_environment(browser_name) or self._from_installed(browser_name)
+        self._resolved[browser_name] = path
+        logging.info(f"Using {browser_name} driver at {path}")
+        return path
+
+    def _from_installed(self, browser_name):
+        browser_version = browser_version_of(browser_name)
+        path = self._from_manifest(browser_name, browser_version)
+        if path is not None:
+            return path
+        path = self._compatible(browser_name, browser_version, self._from_driver_dir(browser_name),
+                                self._from_system_path(browser_name))
+        if path is None:
+            if self.offline:
+                raise FileNotFoundError(
+                    f"No {DRIVER_BINARIES[browser_name]} for '{browser_name}' {browser_version or '(version unknown)'}"
+                    f" found. Add it to {self.manifest_path}, drop the binary in {self.driver_dir} or set "
+                    f"{self._env_name(browser_name)}.")
+            path = self._download(browser_name)
+        self._record(browser_name, path, browser_version)
+        return path
+
+    def read_manifest(self):
+        try:
+            with open(self.manifest_path, 'r') as manifest_file:
+                return json.load(manifest_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def _env_name(browser_name):
+        return f"{DRIVER_BINARIES[browser_name].upper()}_PATH"
+
+    @staticmethod
+    def _binary_name(browser_name):
+        name = DRIVER_BINARIES[browser_name]
+        return name + ".exe" if sys.platform.startswith("win") else name
+
+    @staticmethod
+    def _existing(path):
+        return path if path and os.path.isfile(path) else None
+
+    def _from_environment(self, browser_name):
+        return self._existing(os.getenv(self._env_name(browser_name)))
+
+    def _from_manifest(self, browser_name, browser_version):
+        entry = self.read_manifest().get(browser_name)
+        if not entry or (browser_version and entry.get("browser_version") != browser_version):
+            return None
+        path = self._existing(os.path.join(self.driver_dir, entry["path"]))
+        if path is None or version_of(path) != entry.get("driver_version"):
+            return None  # the binary was replaced since it was recorded
+        return path
+
+    @staticmethod
+    def _compatible(browser_name, browser_version, *paths):
+        """The first existing driver that can drive this browser version (ChromeDriver needs the same major)."""
+        for path in paths:
+            if path is None:
+                continue
+            if browser_name != "chrome" or not browser_version:
+                return path
+            driver_version = version_of(path)
+            if driver_version and _major(driver_version) == _major(browser_version):
+                return path
+            logging.info(f"Skipping {path}: ChromeDriver {driver_version} does not drive Chrome {browser_version}")
+        return None
+
+    def _from_driver_dir(self, browser_name):
+        return self._existing(os.path.join(self.driver_dir, self._binary_name(browser_name)))
+
+    def _from_system_path(self, browser_name):
+        return shutil.which(self._binary_name(browser_name))
+
+    def _download(self, browser_name):
+        # imported here so the offline path never loads webdriver_manager
+        if browser_name == "chrome":
+            from webdriver_manager.chrome import ChromeDriverManager
+            downloaded = ChromeDriverManager().install()
+        elif browser_name == "firefox":
+            from webdriver_manager.firefox import GeckoDriverManager
+            downloaded = GeckoDriverManager().install()
+        else:
+            from webdriver_manager.microsoft import IEDriverManager
+            downloaded = IEDriverManager().install()
+        # copied out of the webdriver_manager cache so the manifest can name it relative to drivers/
+        os.makedirs(self.driver_dir, exist_ok=True)
+        target = os.path.join(self.driver_dir, self._binary_name(browser_name))
+        temp_path = f"{target}.{os.getpid()}.tmp"
+        shutil.copy2(downloaded, temp_path)
+        try:
+            # atomic: another xdist worker may be running the old binary or replacing it at the same moment
+            os.replace(temp_path, target)
+        except PermissionError:  # Windows refuses to replace a running executable
+            os.remove(temp_path)
+            if version_of(target) != version_of(downloaded):
+                return downloaded  # used from the webdriver_manager cache, and so not recorded
+        return target
+
+    def _record(self, browser_name, path, browser_version):
+        try:
+            relative = os.path.relpath(path, self.driver_dir)
+        except ValueError:  # another drive on Windows
+            return
+        if relative.startswith(os.pardir):
+            return  # outside drivers/, e.g. on the system PATH: only valid on this machine
+        entry = {"path": relative.replace(os.sep, "/"), "driver_version": version_of(path),
+                 "browser_version": browser_version}
+        manifest = self.read_manifest()
+        if manifest.get(browser_name) == entry:
+            return
+        manifest[browser_name] = entry
+        os.makedirs(self.driver_dir, exist_ok=True)
+        temp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        # atomic, so parallel workers never read half a file; a worker's entry lost to another's concurrent
+        # write only means the next session resolves that browser again
+        os.replace(temp_path, self.manifest_path)
+
+
+def version_of(executable):
+    """The version an executable prints for --version, or None when it cannot be run or prints none."""
+    try:
+        result = subprocess.run([executable, "--version"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION.search(result.stdout or result.stderr or "")
+    return match.group(0) if match else None
+
+
+def browser_version_of(browser_name):
+    """The installed browser's version, or None when it is not found on the PATH."""
+    for binary in BROWSER_BINARIES[browser_name]:
+        executable = shutil.which(binary)
+        if executable:
+            return version_of(executable)
+    return None
+
+
+def _major(version):
+    return version.split(".")[0]
@@ -1,41 +1,232 @@
-import itertools
+import functools
 import os
-import pandas as pd
 
-import xlrd
+from config.config import TestData
 
 
 class Excel_Parser:
 
     def read_from_excel(self, sheet_name, excel_path):
-        rows_val = []
-        # read from file
-        work_book = xlrd.open_workbook(self, excel_path)
-        sheet = work_book.sheet_by_name(sheet_name)
-
-        # get all values, iterating through rows and columns
-        num_cols = sheet.ncols  # Number of columns
-        for row_idx, col_idx in itertools.product(
-                range(1, sheet.nrows), range(num_cols)
-        ):
-            cell_obj = sheet.cell(row_idx, col_idx)  # Get cell object by row, col
-            # Convert cell to string,split it according to "'" and take the second cell in the array created
-            # e.g.: cell_obj == "text:'something'" --> after convert and splitting == "something"
-            rows_val.append(str(cell_obj).split("'")[1])
-        return rows_val
+        """
+        Returns the values of every row below the header, row by row, as one flat list.
+        Values keep their type (str, int, float, bool, datetime, None for empty cells).
+        """
+        return [value for row in self.read_rows(excel_path, sheet_name) for value in row]
+
+    @staticmethod
+    def read_rows(excel_path, sheet_name=0, columns=None, skip_header=True):
+        """
+        Reads a whole sheet, or a range of its columns, in bulk.
+
+        Args:
+            excel_path (str): .xls (xlrd) or .xlsx/.xlsm (openpyxl, streamed in read-only mode).
+            sheet_name (str | int): Sheet name or 0-based index.
+            columns (str | tuple | None): "B:D", a (first, last) pair of 0-based indexes, or None for all columns.
+            skip_header (bool): Leave out the first row.
+
+        Returns:
+            list[tuple]: One tuple of typed values per row. Workbooks are parsed once per path and
+            modification time, so repeated reads of an unchanged file are a cache lookup.
+        """
+        rows = _load_sheet(*_cache_key(excel_path, sheet_name, columns))
+        return list(rows[1:] if skip_header else rows)
+
+    @staticmethod
+    def read_records(excel_path, sheet_name=0, columns=None):
+        """Rows below the header as dictionaries keyed by the header cells."""
+        rows = _load_sheet(*_cache_key(excel_path, sheet_name, columns))
+        if not rows:
+            return []
+        header = rows[0]
+        return [dict(zip(header, row)) for row in rows[1:]]
+
+    @staticmethod
+    def sheet_names(excel_path):
+        if excel_path.lower().endswith(".xls"):
+            import xlrd
+
+            work_book = xlrd.open_workbook(excel_path, on_demand=True)
+            try:
+                return work_book.sheet_names()
+            finally:
+                work_book.release_resources()
+        from openpyxl import load_workbook
+
+        work_book = load_workbook(excel_path, read_only=True)
+        try:
+            return work_book.sheetnames
+        finally:
+            work_book.close()
+
+    @staticmethod
+    def clear_cache():
+        _load_sheet.cache_clear()
+
+    @staticmethod
+    def lookup(df, filters, retrieve_columns, sort_by=None, ascending=True):
+        """
+        Returns the retrieve_columns of the rows matching every column == value pair of filters, with one
+        vectorized comparison per filter column. For many lookups on the same columns use lookup_table().
+
+        Example:
+            Excel_Parser.lookup(df, {"state": "CA", "plan": "gold"}, ["name", "premium"])
+            -> {"name": [...], "premium": [...]}
+
+        Returns:
+            dict: {column: [values]} in the frame's row order (or sorted by sort_by).
+        """
+        return _select(df, _matching_rows(df, filters), retrieve_columns, sort_by, ascending)
+
+    @staticmethod
+    def lookup_table(df, columns):
+        """A LookupTable of a copy of df indexed on columns, for repeated lookups on those columns."""
+        return LookupTable(df, columns)
 
     @staticmethod
     def get_csv_data(df, selected_columns, selected_values, retrieve_columns):
-        # Filter the dataFrame based on Selected columns and values
-        filtered_df = df[
-            (df[selected_columns[0]] == selected_values[0]) & (df[selected_columns[1]] == selected_values[1])]
-        filter_df = filtered_df.sort_values(by='column_name', ascending=True)
-        column1 = []
-        column2 = []
-        column3 = []
-        for index, row in filtered_df.iterrows():
-            column1.append(row[retrieve_columns[0]])
-            column2.append(row[retrieve_columns[1]])
-            column3.append(row[retrieve_columns[2]])
-
-        return {"col1": column1, "col2": column2, "col3": column3}
+        """
+        Lookup on any number of column == value pairs, returned as {"col1": [...], "col2": [...], ...}
+        in the order of retrieve_columns.
+        """
+        result = Excel_Parser.lookup(df, dict(zip(selected_columns, selected_values)), retrieve_columns)
+        return {f"col{number}": result[column] for number, column in enumerate(retrieve_columns, start=1)}
+
+
+class LookupTable:
+    """
+    A private copy of a DataFrame indexed on some of its columns (a sorted Index, or MultiIndex for several),
+    so every lookup on those columns is a binary search instead of a scan.
+
+    The copy makes the index safe to keep: edits to the original frame are not seen, build a new table after
+    them. Rows with an empty (NaN) key are left out of the index, as they never equal a filter value, and key
+    columns whose values cannot be sorted (e.g. str mixed with int) are searched with a boolean mask instead.
+
+    Example:
+        plans = Excel_Parser.lookup_table(df, ["state", "plan"])
+        for state in states:
+            premiums = plans.lookup({"state": state, "plan": "gold"}, ["premium"])["premium"]
+    """
+
+    def __init__(self, df, columns):
+        import numpy as np
+        import pandas as pd
+
+        self.columns = tuple(columns)
+        self.df = df.copy()
+        keys = self.df[list(self.columns)]
+        complete = keys.notna().all(axis=1).to_numpy()
+        keys = keys[complete]
+        labels = pd.MultiIndex.from_frame(keys) if len(self.columns) > 1 else pd.Index(keys[self.columns[0]])
+        try:
+            self._index, order = labels.sort_values(return_indexer=True)
+        except TypeError:
+            self._index = None
+        else:
+            self._positions = np.flatnonzero(complete)[order]
+
+    @property
+    def indexed(self):
+        return self._index is not None
+
+    def lookup(self, filters, retrieve_columns, sort_by=None, ascending=True):
+        """Excel_Parser.lookup on the table; filters must name exactly the table's columns."""
+        import numpy as np
+
+        if set(filters) != set(self.columns):
+            raise ValueError(f"This table is indexed on {list(self.columns)}, not {list(filters)}")
+        if not self.indexed:
+            return _select(self.df, _matching_rows(self.df, filters), retrieve_columns, sort_by, ascending)
+        key = tuple(filters[column] for column in self.columns) if len(self.columns) > 1 \
+            else filters[self.columns[0]]
+        try:
+            rows = np.sort(np.atleast_1d(self._positions[self._index.get_loc(key)]))
+        except (KeyError, TypeError):
+            rows = self._positions[:0]
+        return _select(self.df, rows, retrieve_columns, sort_by, ascending)
+
+
+def _matching_rows(df, filters):
+    import numpy as np
+
+    matches = np.ones(len(df), dtype=bool)
+    for column, value in filters.items():
+        matches &= (df[column] == value).to_numpy(dtype=bool)
+    return np.flatnonzero(matches)
+
+
+def _select(df, rows, retrieve_columns, sort_by, ascending):
+    selected = df.iloc[rows]
+    if sort_by is not None:
+        selected = selected.sort_values(by=sort_by, ascending=ascending, kind="stable")
+    return {column: selected[column].tolist() for column in retrieve_columns}
+
+
+def _cache_key(excel_path, sheet_name, columns):
+    path = os.path.abspath(excel_path)
+    return path, os.stat(path).st_mtime_ns, sheet_name, _column_range(columns)
+
+
+def _column_range(columns):
+    """ "B:D" -> (1, 3); (1, 3) -> (1, 3); None -> None (0-based, inclusive) """
+    if columns is None or isinstance(columns, tuple):
+        return columns
+    first, _, last = columns.partition(":")
+    return _column_index(first), _column_index(last or first)
+
+
+def _column_index(letters):
+    index = 0
+    for letter in letters.strip().upper():
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+@functools.lru_cache(maxsize=TestData.EXCEL_CACHE_SIZE)
+def _load_sheet(path, mtime_ns, sheet_name, columns):
+    # mtime_ns is only part of the cache key: an edited workbook is parsed again
+    if path.lower().endswith(".xls"):
+        return _load_xls(path, sheet_name, columns)
+    return _load_xlsx(path, sheet_name, columns)
+
+
+def _load_xls(path, sheet_name, columns):
+    import xlrd
+
+    work_book = xlrd.open_workbook(path, on_demand=True)  # only the requested sheet is parsed
+    try:
+        sheet = work_book.sheet_by_index(sheet_name) if isinstance(sheet_name, int) \
+            else work_book.sheet_by_name(sheet_name)
+        start, end = (columns[0], columns[1] + 1) if columns else (0, None)
+        return tuple(
+            tuple(_xls_value(value, cell_type, work_book.datemode)
+                  for value, cell_type in zip(sheet.row_values(row_idx, start, end),
+                                              sheet.row_types(row_idx, start, end)))
+            for row_idx in range(sheet.nrows))
+    finally:
+        work_book.release_resources()
+
+
+def _xls_value(value, cell_type, datemode):
+    import xlrd
+
+    if cell_type in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+        return None
+    if cell_type == xlrd.XL_CELL_BOOLEAN:
+        return bool(value)
+    if cell_type == xlrd.XL_CELL_DATE:
+        return xlrd.xldate.xldate_as_datetime(value, datemode)
+    if cell_type == xlrd.XL_CELL_NUMBER and value.is_integer():
+        return int(value)  # xlrd stores every number as a float
+    return value
+
+
+def _load_xlsx(path, sheet_name, columns):
+    from openpyxl import load_workbook
+
+    work_book = load_workbook(path, read_only=True, data_only=True)  # streamed, formulas as cached values
+    try:
+        sheet = work_book.worksheets[sheet_name] if isinstance(sheet_name, int) else work_book[sheet_name]
+        bounds = {"min_col": columns[0] + 1, "max_col": columns[1] + 1} if columns else {}
+        return tuple(tuple(row) for row in sheet.iter_rows(values_only=True, **bounds))
+    finally:
+        work_book.close()
@@ -0,0 +1,74 @@
+"""Reads whole HTML tables in one round trip and compares them against expected data cell by cell."""
+
+# one execute_script call for the whole table instead of find_elements per row and .text per cell
+TABLE_SCRIPT = """
+var table = arguments[0];
+function cellText(cell) { return (cell.innerText || cell.textContent || '').replace(/\\u00a0/g, ' ').trim(); }
+var headers = [], rows = [];
+Array.from(table.querySelectorAll('tr')).forEach(function (tr) {
+    var cells = Array.from(tr.children);
+    var data = cells.filter(function (cell) { return cell.tagName === 'TD'; });
+    if (data.length) {
+        rows.push(data.map(cellText));
+    } else if (!headers.length) {
+        headers = cells.filter(function (cell) { return cell.tagName === 'TH'; }).map(cellText);
+    }
+});
+return {headers: headers, rows: rows};
+"""
+
+MISSING = "<missing>"
+
+
+def table_to_dataframe(table):
+    """Builds a DataFrame from extracted table data, using the header row when it matches the column count."""
+    import pandas as pd
+
+    rows = table["rows"]
+    width = max((len(row) for row in rows), default=len(table["headers"]))
+    columns = table["headers"] if len(table["headers"]) == width else None
+    return pd.DataFrame(rows, columns=columns)
+
+
+def compare_grid(actual, expected):
+    """
+    Compares two grids (lists of rows or DataFrames) in one vectorized pass.
+    If both are DataFrames and the expected columns are named, actual columns are matched by header.
+
+    Returns:
+        list: One (row, column, expected, actual) tuple per mismatching cell, rows and columns 1-based
+        (columns by name when matched by header). Missing cells show up as '<missing>'.
+    """
+    import pandas as pd
+
+    actual_df = actual.copy() if isinstance(actual, pd.DataFrame) else pd.DataFrame(list(actual))
+    expected_df = expected.copy() if isinstance(expected, pd.DataFrame) else pd.DataFrame(list(expected))
+    by_header = isinstance(expected, pd.DataFrame) and not isinstance(expected.columns, pd.RangeIndex)
+    if by_header:
+        actual_df = actual_df.reindex(columns=expected_df.columns)
+    else:
+        actual_df.columns = range(actual_df.shape[1])
+        expected_df.columns = range(expected_df.shape[1])
+
+    rows = pd.RangeIndex(max(len(actual_df), len(expected_df)))
+    columns = expected_df.columns.union(actual_df.columns, sort=False)
+    actual_df = actual_df.reset_index(drop=True).reindex(index=rows, columns=columns)
+    expected_df = expected_df.reset_index(drop=True).reindex(index=rows, columns=columns)
+    actual_df = actual_df.astype(object).where(actual_df.notna(), MISSING).astype(str)
+    expected_df = expected_df.astype(object).where(expected_df.notna(), MISSING).astype(str)
+
+    mask = actual_df.ne(expected_df).to_numpy()
+    mismatches = []
+    for row_pos, col_pos in zip(*mask.nonzero()):
+        column = columns[col_pos]
+        mismatches.append((int(row_pos) + 1, column if by_header else int(col_pos) + 1,
+                           expected_df.iat[row_pos, col_pos], actual_df.iat[row_pos, col_pos]))
+    return mismatches
+
+
+def format_mismatches(mismatches, limit=50):
+    lines = [f"Row {row}, Column {column}: Expected: {expected}, Actual: {actual}"
+             for row, column, expected, actual in mismatches[:limit]]
+    if len(mismatches) > limit:
+        lines.append(f"... and {len(mismatches) - limit} more mismatching cell(s)")
+    return "\n".join(lines)
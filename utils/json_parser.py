@@ -1,15 +1,12 @@
-import json
-import os
+import copy
 
-from utils.config import TestData
+from utils.data_reader import data_provider, resolve_path
 
 
 class JsonParser:
     def __init__(self, json_path):
-        self.json_path = os.path.join(TestData.DATA_FILES_PATH, json_path)
+        self.json_path = resolve_path(json_path)  # relative to TestData.DATA_FILES_PATH
 
     def read_from_json(self):
-        # read from file
-        with open(self.json_path, 'r') as json_file:
-            json_reader = json.load(json_file)
-        return json_reader
+        # parsed once per session by the shared data provider; a copy, so callers may change it freely
+        return copy.deepcopy(data_provider.load(self.json_path))
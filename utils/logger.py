@@ -1,9 +1,20 @@
-import inspect
+"""
+One logging pipeline for the whole run: loggers put records on a bounded in-memory queue and a single
+QueueListener thread writes them to the log file as JSON lines, tagged with the running test and xdist worker.
+Test threads never wait on disk; when the queue is full, records are dropped and counted instead.
+"""
+import json
 import logging
+import logging.handlers
 import os
-import time
+import queue
+import sys
+import threading
+from datetime import datetime
 from enum import Enum
 
+from config.config import TestData
+
 
 class LogLevel(Enum):
     DEBUG = logging.DEBUG
@@ -21,49 +32,129 @@ class Singleton(type):
         return cls._instances[cls]
 
 
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message, test nodeid, worker, thread and call site."""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "nodeid": getattr(record, "nodeid", None),
+            "worker": getattr(record, "worker", None),
+            "thread": record.threadName,
+            "source": f"{record.filename}:{record.lineno}",
+        }
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _ContextFilter(logging.Filter):
+    """Stamps every record with the test that was running when it was logged."""
+
+    def __init__(self, pipeline):
+        super().__init__()
+        self.pipeline = pipeline
+
+    def filter(self, record):
+        record.nodeid = self.pipeline.nodeid
+        record.worker = self.pipeline.worker_id
+        return True
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Never blocks the logging thread: a record that does not fit in the bounded queue is dropped."""
+
+    def __init__(self, log_queue, pipeline):
+        super().__init__(log_queue)
+        self.pipeline = pipeline
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.pipeline.dropped += 1
+
+
+class LogPipeline:
+    """
+    Owns the queue, the root logger's queue handler and the listener writing the file.
+    start() is idempotent, so the handlers are attached exactly once per process.
+    """
+
+    def __init__(self):
+        self.log_file = None
+        self.worker_id = None
+        self.nodeid = None
+        self.dropped = 0
+        self._handler = None
+        self._listener = None
+        self._lock = threading.Lock()
+
+    @property
+    def started(self):
+        return self._listener is not None
+
+    def start(self, log_file=None, worker_id="master", level=None, queue_size=None):
+        with self._lock:
+            if self.started:
+                return self
+            self.log_file = str(log_file or os.path.join(TestData.LOG_FOLDER, "automation.jsonl"))
+            os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+            self.worker_id = worker_id
+            log_queue = queue.Queue(maxsize=queue_size or TestData.LOG_QUEUE_SIZE)
+
+            file_handler = logging.FileHandler(self.log_file, mode="a", encoding="utf-8", delay=True)
+            file_handler.setFormatter(JsonFormatter())
+            self._handler = _DroppingQueueHandler(log_queue, self)
+            self._handler.addFilter(_ContextFilter(self))
+            self._listener = logging.handlers.QueueListener(log_queue, file_handler)
+
+            root = logging.getLogger()
+            root.setLevel(level or TestData.LOG_LEVEL)
+            root.addHandler(self._handler)
+            self._listener.start()
+        return self
+
+    def set_test(self, nodeid):
+        """Records logged from now on (from any thread) belong to this test."""
+        self.nodeid = nodeid
+
+    def stop(self):
+        """Detaches the handler and writes out everything still queued."""
+        with self._lock:
+            if not self.started:
+                return
+            logging.getLogger().removeHandler(self._handler)
+            self._listener.stop()  # drains the queue before returning
+            file_handler = self._listener.handlers[0]
+            if self.dropped:
+                file_handler.handle(logging.makeLogRecord({
+                    "name": __name__, "levelno": logging.WARNING, "levelname": "WARNING",
+                    "msg": f"{self.dropped} log record(s) dropped: queue of {self._handler.queue.maxsize} was full",
+                    "nodeid": None, "worker": self.worker_id}))
+            file_handler.close()
+            self._handler = None
+            self._listener = None
+
+
+log_pipeline = LogPipeline()
+
+
 class Logger(metaclass=Singleton):
     def __init__(self, log_lvl=LogLevel.INFO):
         self._log = logging.getLogger("appium")
-        self._log.setLevel(LogLevel.DEBUG.value)
-
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        self.log_file = self._create_log_file()
-        self._configure_logging(log_lvl, formatter)
-
-    def _create_log_file(self):
-        current_time = time.strftime("%Y-%m-%d")
-        log_directory = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "tests", "logs"))
-
-        if not os.path.exists(log_directory):
-            os.makedirs(log_directory)
-
-        return os.path.join(log_directory, f"log_{current_time}.log")
-
-    def _configure_logging(self, log_lvl, formatter):
-        fh = logging.FileHandler(self.log_file, mode="w")
-        fh.setFormatter(formatter)
-        fh.setLevel(log_lvl.value)
-        self._log.addHandler(fh)
+        self._log.setLevel(log_lvl.value)
+        self.log_file = log_pipeline.start().log_file  # already running under pytest
 
     def get_instance(self):
         return self._log
 
-    def customLogger(logLevel=logging.DEBUG):
-        # Gets the name of the class / method from where this method is called
-        loggerName = inspect.stack()[1][3]
+    @staticmethod
+    def customLogger(logLevel=logging.DEBUG, name=None):
+        # Named after the calling function; records go through the shared pipeline, no handler per call
+        loggerName = name or sys._getframe(1).f_code.co_name
         logger = logging.getLogger(loggerName)
-        # By default, log all messages
-        logger.setLevel(logging.DEBUG)
-
-        fileHandler = logging.FileHandler("automation.log", mode='a')
-        fileHandler.setLevel(logLevel)
-
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s: %(message)s',
-                                      datefmt='%m/%d/%Y %I:%M:%S %p')
-
-        fileHandler.setFormatter(formatter)
-        logger.addHandler(fileHandler)
-
-        return logger
\ No newline at end of file
+        logger.setLevel(logLevel)
+        log_pipeline.start()
+        return logger
@@ -0,0 +1,279 @@
+"""
+Network capture for Chromium sessions: ChromeDriver records the CDP Network.* events of the page in its
+performance log (enabled in conftest.create_driver), and NetworkCapture drains that log into a bounded ring
+buffer of finished requests. Draining empties ChromeDriver's side too, so neither grows over a long session.
+
+Example:
+    capture = network_capture(driver)
+    mark = capture.mark()
+    ...
+    slow_api_calls = capture.query(url=r"/api/", min_duration_ms=500, since=mark)
+    capture.save_har("failure.har", since=mark)
+"""
+import itertools
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlsplit
+
+from config.config import TestData
+
+EVENTS = ("Network.requestWillBeSent", "Network.responseReceived", "Network.loadingFinished",
+          "Network.loadingFailed")
+_sequence = itertools.count(1)  # shared by every capture, so a mark stays valid when the driver changes
+
+
+class NetworkEntry:
+    """One request: what was sent, what came back and when, in CDP terms."""
+
+    def __init__(self, request_id, url, method, request_headers, post_data, resource_type, wall_time, timestamp):
+        self.request_id = request_id
+        self.url = url
+        self.method = method
+        self.request_headers = request_headers
+        self.post_data = post_data
+        self.resource_type = resource_type
+        self.wall_time = wall_time  # epoch seconds
+        self.timestamp = timestamp  # CDP monotonic seconds
+        self.status = None
+        self.status_text = ""
+        self.protocol = None
+        self.mime_type = None
+        self.response_headers = {}
+        self.resource_timing = None
+        self.from_cache = False
+        self.encoded_bytes = 0
+        self.end_timestamp = None
+        self.error = None
+        self.blocked_reason = None
+        self.redirect_url = ""
+        self.loader_id = None  # the document the request belongs to; a navigation has request_id == loader_id
+        self.seq = 0
+
+    @property
+    def duration_ms(self):
+        if self.end_timestamp is None:
+            return None
+        return round((self.end_timestamp - self.timestamp) * 1000, 3)
+
+    @property
+    def failed(self):
+        return self.error is not None or (self.status or 0) >= 400
+
+    def __repr__(self):
+        return f"<NetworkEntry {self.method} {self.url} {self.status or self.error} {self.duration_ms}ms>"
+
+
+class NetworkCapture:
+    """
+    Ring buffer of the finished requests of one driver; the oldest are dropped beyond max_entries.
+
+    Args:
+        driver: A Chromium WebDriver started with performance logging (goog:loggingPrefs performance).
+        max_entries (int): Finished requests kept (and requests in flight tracked) at most.
+    """
+
+    def __init__(self, driver, max_entries=None):
+        self.driver = driver
+        self.max_entries = max_entries or TestData.NETWORK_CAPTURE_MAX_ENTRIES
+        self.entries = deque(maxlen=self.max_entries)
+        self.dropped = 0
+        self.enabled = True
+        self._in_flight = OrderedDict()
+        self._lock = threading.Lock()
+
+    def drain(self):
+        """Moves the events ChromeDriver collected since the last drain into the buffer."""
+        if not self.enabled:
+            return 0
+        try:
+            logs = self.driver.get_log('performance')
+        except Exception as e:  # not Chromium, or performance logging was not enabled for this session
+            logging.warning(f"Network capture disabled for this driver: {e}")
+            self.enabled = False
+            return 0
+        with self._lock:
+            for log in logs:
+                message = log['message']
+                if not any(event in message for event in EVENTS):  # skip the JSON parse for other events
+                    continue
+                event = json.loads(message)['message']
+                self._handle(event['method'], event.get('params', {}))
+        return len(logs)
+
+    def mark(self):
+        """A position in the capture: query(since=mark) returns only the requests that finished after it."""
+        self.drain()
+        return next(_sequence)
+
+    def clear(self):
+        self.drain()
+        with self._lock:
+            self.entries.clear()
+            self._in_flight.clear()
+
+    def query(self, url=None, status=None, method=None, resource_type=None, min_duration_ms=None,
+              max_duration_ms=None, failed=None, since=None):
+        """
+        Finished requests matching every given filter, oldest first.
+
+        Args:
+            url (str): Regular expression searched in the URL.
+            status (int | iterable): One status code or several, e.g. range(500, 600).
+            method (str): HTTP method, e.g. "POST".
+            resource_type (str): CDP resource type, e.g. "XHR", "Fetch", "Document", "Image".
+            min_duration_ms / max_duration_ms (float): Bounds on the time from request to last byte.
+            failed (bool): Only failed (status >= 400 or network error) or only successful requests.
+            since (int): A mark(); only requests that finished after it.
+        """
+        self.drain()
+        pattern = re.compile(url) if url else None
+        statuses = {status} if isinstance(status, int) else set(status) if status is not None else None
+        with self._lock:
+            entries = list(self.entries)
+        return [entry for entry in entries
+                if (since is None or entry.seq > since)
+                and (pattern is None or pattern.search(entry.url))
+                and (statuses is None or entry.status in statuses)
+                and (method is None or entry.method == method.upper())
+                and (resource_type is None or entry.resource_type == resource_type)
+                and (min_duration_ms is None or (entry.duration_ms or 0) >= min_duration_ms)
+                and (max_duration_ms is None or (entry.duration_ms or 0) <= max_duration_ms)
+                and (failed is None or entry.failed == failed)]
+
+    def to_har(self, entries=None, since=None):
+        """HAR 1.2 document of entries (default: the whole buffer, or everything after since)."""
+        if entries is None:
+            entries = self.query(since=since)
+        return {"log": {"version": "1.2", "creator": {"name": "python_selenium_framework", "version": "1.0"},
+                        "pages": [], "entries": [har_entry(entry) for entry in entries]}}
+
+    def save_har(self, path, since=None):
+        entries = self.query(since=since)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as har_file:
+            json.dump(self.to_har(entries), har_file)
+        return path
+
+    def describe(self):
+        return f"{len(self.entries)} request(s) buffered (max {self.max_entries}), {self.dropped} dropped"
+
+    def _handle(self, method, params):
+        request_id = params.get('requestId')
+        if method == "Network.requestWillBeSent":
+            if params.get('redirectResponse') and request_id in self._in_flight:
+                # same requestId for every hop: the previous hop ends with the redirect response
+                previous = self._in_flight.pop(request_id)
+                self._set_response(previous, params['redirectResponse'])
+                previous.redirect_url = params['request']['url']
+                previous.end_timestamp = params.get('timestamp')
+                self._finish(previous)
+            request = params['request']
+            self._in_flight[request_id] = NetworkEntry(
+                request_id, request['url'], request.get('method', "GET"), request.get('headers', {}),
+                request.get('postData'), params.get('type'), params.get('wallTime'), params.get('timestamp'))
+            self._in_flight[request_id].loader_id = params.get('loaderId')
+            if len(self._in_flight) > self.max_entries:  # requests that never finish must not pile up either
+                self._in_flight.popitem(last=False)
+                self.dropped += 1
+        elif method == "Network.responseReceived":
+            entry = self._in_flight.get(request_id)
+            if entry is not None:
+                self._set_response(entry, params['response'])
+        elif method == "Network.loadingFinished":
+            entry = self._in_flight.pop(request_id, None)
+            if entry is not None:
+                entry.encoded_bytes = params.get('encodedDataLength', 0)
+                entry.end_timestamp = params.get('timestamp')
+                self._finish(entry)
+        elif method == "Network.loadingFailed":
+            entry = self._in_flight.pop(request_id, None)
+            if entry is not None:
+                entry.error = params.get('errorText') or "failed"
+                entry.blocked_reason = params.get('blockedReason')
+                entry.end_timestamp = params.get('timestamp')
+                self._finish(entry)
+
+    @staticmethod
+    def _set_response(entry, response):
+        entry.status = response.get('status')
+        entry.status_text = response.get('statusText', "")
+        entry.protocol = response.get('protocol')
+        entry.mime_type = response.get('mimeType')
+        entry.response_headers = response.get('headers', {})
+        entry.resource_timing = response.get('timing')
+        entry.from_cache = bool(response.get('fromDiskCache') or response.get('fromServiceWorker'))
+
+    def _finish(self, entry):
+        if len(self.entries) == self.max_entries:
+            self.dropped += 1
+        entry.seq = next(_sequence)
+        self.entries.append(entry)
+
+
+def network_capture(driver):
+    """The capture attached to driver, created on first use."""
+    capture = getattr(driver, "network_capture", None)
+    if capture is None:
+        capture = NetworkCapture(driver)
+        driver.network_capture = capture
+    return capture
+
+
+def har_entry(entry):
+    duration = entry.duration_ms or 0
+    return {
+        "startedDateTime": datetime.fromtimestamp(entry.wall_time or 0, timezone.utc).isoformat(),
+        "time": duration,
+        "request": {
+            "method": entry.method, "url": entry.url, "httpVersion": _http_version(entry.protocol),
+            "headers": _har_headers(entry.request_headers), "cookies": [],
+            "queryString": [{"name": name, "value": value}
+                            for name, value in parse_qsl(urlsplit(entry.url).query, keep_blank_values=True)],
+            **({"postData": {"mimeType": entry.request_headers.get("Content-Type", ""), "text": entry.post_data}}
+               if entry.post_data else {}),
+            "headersSize": -1, "bodySize": len(entry.post_data or ""),
+        },
+        "response": {
+            "status": entry.status or 0, "statusText": entry.status_text or (entry.error or ""),
+            "httpVersion": _http_version(entry.protocol), "headers": _har_headers(entry.response_headers),
+            "cookies": [], "content": {"size": entry.encoded_bytes, "mimeType": entry.mime_type or ""},
+            "redirectURL": entry.redirect_url, "headersSize": -1, "bodySize": entry.encoded_bytes,
+            **({"_error": entry.error} if entry.error else {}),
+        },
+        "cache": {},
+        "timings": _har_timings(entry.resource_timing, duration),
+        "_resourceType": entry.resource_type,
+    }
+
+
+def _har_timings(timing, total_ms):
+    """HAR phases from a CDP ResourceTiming (milliseconds relative to its requestTime)."""
+    if not timing:
+        return {"send": 0, "wait": total_ms, "receive": 0}
+
+    def phase(start, end):
+        return round(timing[end] - timing[start], 3) if timing.get(start, -1) >= 0 else -1
+
+    headers_received = timing.get('receiveHeadersEnd', 0)
+    return {
+        "blocked": -1,
+        "dns": phase('dnsStart', 'dnsEnd'),
+        "connect": phase('connectStart', 'connectEnd'),
+        "ssl": phase('sslStart', 'sslEnd'),
+        "send": max(phase('sendStart', 'sendEnd'), 0),
+        "wait": round(max(headers_received - timing.get('sendEnd', 0), 0), 3),
+        "receive": round(max(total_ms - headers_received, 0), 3),
+    }
+
+
+def _har_headers(headers):
+    return [{"name": name, "value": str(value)} for name, value in headers.items()]
+
+
+def _http_version(protocol):
+    return {"h2": "HTTP/2.0", "h3": "HTTP/3.0", "http/1.0": "HTTP/1.0"}.get(protocol or "", "HTTP/1.1")
@@ -0,0 +1,313 @@
+"""
+Streaming report for large runs (TestData.REPORT_MODE = "stream" or --report_mode stream).
+
+Each test is written out on the controller as soon as its teardown report arrives, so memory stays flat
+however many tests run and a crashed session still leaves every finished result on disk:
+
+    results.jsonl       one JSON object per test: outcome, real start/stop/duration, worker, failure text, links
+    junit.xml           JUnit XML for CI; test cases are streamed to junit.xml.part and the header is added at the end
+    index.html          a small viewer that loads pages/page-NNNNN.js on demand (REPORT_PAGE_SIZE tests per page)
+                        and links screenshots and other artifacts instead of embedding them
+"""
+import json
+import os
+import re
+import shutil
+from datetime import datetime
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+from config.config import TestData
+
+MAX_FAILURE_CHARS = 20000  # longer tracebacks are cut, the full text is in the log
+OUTCOMES = ("passed", "failed", "error", "skipped", "xfailed", "xpassed")
+_XML_ILLEGAL = re.compile("\x1b\\[[0-9;]*m|[\x00-\x08\x0b\x0c\x0e-\x1f]")  # ANSI colours, then XML-illegal bytes
+
+
+class StreamingReport:
+    """
+    Args:
+        folder (Path | str): The report folder; the viewer links artifacts relative to it.
+        page_size (int): Tests per page file of the HTML viewer.
+        title (str): Title of the HTML viewer and name of the JUnit test suite.
+    """
+
+    def __init__(self, folder, page_size=None, title=None):
+        self.folder = Path(folder)
+        self.page_size = page_size or TestData.REPORT_PAGE_SIZE
+        self.title = title or TestData.REPORT_TITLE
+        self.counts = dict.fromkeys(OUTCOMES, 0)
+        self.total_seconds = 0.0
+        self.pages = 0
+        self.failure_pages = []
+        self.started = datetime.now()
+        self._phases = {}  # nodeid -> reports of the phases seen so far
+        self._page = []
+        self._results = None
+        self._junit = None
+
+    @property
+    def written(self):
+        return sum(self.counts.values())
+
+    def open(self):
+        (self.folder / "pages").mkdir(parents=True, exist_ok=True)
+        self._results = open(self.folder / "results.jsonl", 'w', encoding='utf-8', buffering=1)  # line-buffered
+        self._junit = open(self.folder / "junit.xml.part", 'w', encoding='utf-8')
+        (self.folder / "index.html").write_text(VIEWER_HTML.replace("{title}", escape(self.title)), encoding='utf-8')
+        self._write_manifest()
+        return self
+
+    def add(self, report):
+        """Takes every setup/call/teardown report; the test is written once its teardown arrives."""
+        phases = self._phases.setdefault(report.nodeid, [])
+        phases.append(report)
+        if report.when == 'teardown':
+            self._write(self._phases.pop(report.nodeid))
+
+    def close(self):
+        """Writes tests still missing a teardown (e.g. a crashed worker), the last page and the JUnit file."""
+        if self._results is None:
+            return
+        for phases in list(self._phases.values()):
+            self._write(phases)
+        self._phases.clear()
+        self._flush_page()
+        self._write_manifest(finished=True)
+        self._results.close()
+        self._junit.close()
+        self._finish_junit()
+        self._results = None
+        self._junit = None
+
+    def describe(self):
+        counts = ", ".join(f"{count} {outcome}" for outcome, count in self.counts.items() if count)
+        return f"{self.written} test(s) ({counts or 'none'}) in {self.pages} page(s) -> {self.folder / 'index.html'}"
+
+    def _write(self, phases):
+        record = result_record(phases)
+        self.counts[record["outcome"]] += 1
+        self.total_seconds += record["duration"]
+        self._results.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._junit.write(junit_testcase(record))
+        self._page.append(record)
+        if len(self._page) >= self.page_size:
+            self._flush_page()
+
+    def _flush_page(self):
+        if not self._page:
+            return
+        self.pages += 1
+        if any(record["outcome"] in ("failed", "error") for record in self._page):
+            self.failure_pages.append(self.pages)
+        page_file = self.folder / "pages" / f"page-{self.pages:05d}.js"
+        page_file.write_text(f"reportPage({self.pages}, {json.dumps(self._page, default=str)});\n", encoding='utf-8')
+        self._page = []
+        self._junit.flush()
+        self._write_manifest()
+
+    def _write_manifest(self, finished=False):
+        manifest = {"title": self.title, "started": self.started.isoformat(timespec="seconds"),
+                    "finished": finished, "pages": self.pages, "page_size": self.page_size,
+                    "counts": self.counts, "failure_pages": self.failure_pages,
+                    "seconds": round(self.total_seconds, 3)}
+        path = self.folder / "pages" / "manifest.js"
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(f"reportManifest({json.dumps(manifest)});\n", encoding='utf-8')
+        os.replace(temp_path, path)  # the viewer may be open while the run goes on
+
+    def _finish_junit(self):
+        part = self.folder / "junit.xml.part"
+        suite = (f'<testsuite name={quoteattr(self.title)} tests="{self.written}" '
+                 f'failures="{self.counts["failed"]}" errors="{self.counts["error"]}" '
+                 f'skipped="{self.counts["skipped"] + self.counts["xfailed"]}" '
+                 f'time="{self.total_seconds:.3f}" timestamp="{self.started.isoformat(timespec="seconds")}">\n')
+        with open(self.folder / "junit.xml", 'w', encoding='utf-8') as junit_file:
+            junit_file.write('<?xml version="1.0" encoding="utf-8"?>\n<testsuites>\n' + suite)
+            with open(part, 'r', encoding='utf-8') as test_cases:
+                shutil.copyfileobj(test_cases, junit_file)
+            junit_file.write("</testsuite>\n</testsuites>\n")
+        part.unlink()
+
+
+def result_record(phases):
+    """One result from the setup/call/teardown reports of a test, with the times pytest measured."""
+    failed = next((report for report in phases if report.failed), None)
+    skipped = next((report for report in phases if report.skipped), None)
+    call = next((report for report in phases if report.when == 'call'), None)
+    if failed is not None:
+        outcome = "failed" if failed.when == 'call' else "error"
+    elif skipped is not None:
+        outcome = "xfailed" if hasattr(skipped, 'wasxfail') else "skipped"
+    elif call is not None and hasattr(call, 'wasxfail'):
+        outcome = "xpassed"
+    else:
+        outcome = "passed"
+    detail = failed or skipped
+    last = phases[-1]
+    start = min(getattr(report, 'start', 0.0) for report in phases)
+    stop = max(getattr(report, 'stop', 0.0) for report in phases)
+    totals = getattr(last, 'timings', {})
+    return {
+        "nodeid": last.nodeid,
+        "outcome": outcome,
+        "when": detail.when if detail is not None else None,
+        "start": datetime.fromtimestamp(start).isoformat(timespec="milliseconds") if start else None,
+        "stop": datetime.fromtimestamp(stop).isoformat(timespec="milliseconds") if stop else None,
+        "duration": round(sum(report.duration for report in phases), 3),
+        "worker": _first(phases, 'worker_id'),
+        "description": getattr(last, 'description', None),
+        "message": _message(detail),
+        "failure": _failure_text(detail) if failed is not None else None,
+        "screenshot": _first(phases, 'screenshot'),
+        "har": _first(phases, 'har'),
+        "resource_profile": _first(phases, 'resource_profile'),
+        "resource_savings": _first(phases, 'resource_savings'),
+        "sleep_seconds": round(totals.get('sleep', {}).get('seconds', 0.0), 3),
+        "wait_seconds": round(totals.get('wait', {}).get('seconds', 0.0), 3),
+    }
+
+
+def junit_testcase(record):
+    module, _, name = record["nodeid"].partition("::")
+    classname = module.replace("/", ".").removesuffix(".py")
+    if "::" in name:
+        class_name, name = name.rsplit("::", 1)
+        classname = f"{classname}.{class_name.replace('::', '.')}"
+    attributes = (f'classname={quoteattr(classname)} name={quoteattr(name)} time="{record["duration"]:.3f}"'
+                  + (f' timestamp="{record["start"]}"' if record["start"] else ""))
+    message = quoteattr(_xml_text(record["message"] or ""))
+    if record["outcome"] in ("failed", "error"):
+        tag = "failure" if record["outcome"] == "failed" else "error"
+        body = f'<{tag} message={message}>{escape(_xml_text(record["failure"] or ""))}</{tag}>'
+    elif record["outcome"] in ("skipped", "xfailed"):
+        body = f"<skipped message={message}/>"
+    else:
+        body = ""
+    properties = "".join(f'<property name="{name}" value={quoteattr(record[name])}/>'
+                         for name in ("screenshot", "har") if record[name])
+    if properties:
+        body += f"<properties>{properties}</properties>"
+    return f"<testcase {attributes}>{body}</testcase>\n" if body else f"<testcase {attributes}/>\n"
+
+
+def _first(phases, name):
+    return next((getattr(report, name) for report in phases if getattr(report, name, None)), None)
+
+
+def _message(report):
+    if report is None:
+        return None
+    if report.skipped and isinstance(report.longrepr, tuple):
+        return str(report.longrepr[2])  # (file, line, reason)
+    crash = getattr(getattr(report.longrepr, 'reprcrash', None), 'message', None)
+    if crash:
+        return crash
+    lines = report.longreprtext.strip().splitlines()
+    return lines[-1] if lines else None
+
+
+def _failure_text(report):
+    text = report.longreprtext
+    return text if len(text) <= MAX_FAILURE_CHARS else text[:MAX_FAILURE_CHARS] + "\n... (cut)"
+
+
+def _xml_text(text):
+    return _XML_ILLEGAL.sub("", text)
+
+
+VIEWER_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body { font-family: Helvetica, Arial, sans-serif; font-size: 13px; margin: 16px; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #e6e6e6; padding: 4px 6px; text-align: left; vertical-align: top; }
+th { background: #f4f4f4; }
+pre { white-space: pre-wrap; margin: 4px 0; max-height: 400px; overflow: auto; }
+.passed { color: #2e7d32; } .failed, .error { color: #c62828; } .skipped, .xfailed, .xpassed { color: #ef6c00; }
+#controls { margin: 12px 0; }
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<p id="summary">No results yet.</p>
+<div id="controls">
+  <button id="previous">&lt;</button> <span id="position"></span> <button id="next">&gt;</button>
+  show <select id="outcome"><option value="">all</option><option>failed</option><option>error</option>
+  <option>skipped</option><option>xfailed</option><option>xpassed</option><option>passed</option></select>
+  <span id="failure-pages"></span>
+</div>
+<table>
+  <thead><tr><th>Result</th><th>Test</th><th>Description</th><th>Start</th><th>Duration (s)</th>
+  <th>Sleep / Wait (s)</th><th>Worker</th><th>Links</th></tr></thead>
+  <tbody id="results"></tbody>
+</table>
+<script>
+var manifest = null, current = 1, pages = {};
+function reportManifest(data) { manifest = data; }
+function reportPage(number, rows) { pages[number] = rows; if (number === current) { render(); } }
+function cell(row, content) {
+  var td = document.createElement("td"); td.textContent = content; row.appendChild(td); return td;
+}
+function show(number) {
+  if (!manifest || number < 1 || number > manifest.pages) { return; }
+  current = number;
+  document.getElementById("position").textContent = "page " + number + " of " + manifest.pages;
+  if (pages[number]) { render(); return; }
+  var script = document.createElement("script");
+  script.src = "pages/page-" + String(number).padStart(5, "0") + ".js";
+  document.head.appendChild(script);
+}
+function render() {
+  var filter = document.getElementById("outcome").value, body = document.getElementById("results");
+  body.textContent = "";
+  if (!pages[current]) { return; }
+  pages[current].forEach(function (result) {
+    if (filter && result.outcome !== filter) { return; }
+    var row = document.createElement("tr");
+    cell(row, result.outcome).className = result.outcome;
+    var test = cell(row, result.nodeid);
+    if (result.failure || result.message) {
+      var details = document.createElement("details"), summary = document.createElement("summary"),
+          text = document.createElement("pre");
+      summary.textContent = result.message || result.when;
+      text.textContent = result.failure || "";
+      details.appendChild(summary); details.appendChild(text); test.appendChild(details);
+    }
+    cell(row, result.description || "");
+    cell(row, result.start || "");
+    cell(row, result.duration.toFixed(3));
+    cell(row, result.sleep_seconds.toFixed(2) + " / " + result.wait_seconds.toFixed(2));
+    cell(row, result.worker || "");
+    var links = cell(row, "");
+    [["screenshot", result.screenshot], ["network (HAR)", result.har]].forEach(function (artifact) {
+      if (!artifact[1]) { return; }
+      var link = document.createElement("a"); link.href = artifact[1]; link.textContent = artifact[0];
+      link.target = "_blank"; links.appendChild(link); links.appendChild(document.createTextNode(" "));
+    });
+    body.appendChild(row);
+  });
+}
+</script>
+<script src="pages/manifest.js"></script>
+<script>
+if (manifest) {
+  var counts = Object.keys(manifest.counts).filter(function (name) { return manifest.counts[name]; })
+      .map(function (name) { return manifest.counts[name] + " " + name; });
+  document.getElementById("summary").textContent = (counts.join(", ") || "No results yet.") + " in "
+      + manifest.seconds.toFixed(1) + "s, started " + manifest.started + (manifest.finished ? "" : " (still running)");
+  if (manifest.failure_pages.length) {
+    document.getElementById("failure-pages").textContent = "failures on page(s): " + manifest.failure_pages.join(", ");
+  }
+}
+document.getElementById("previous").onclick = function () { show(current - 1); };
+document.getElementById("next").onclick = function () { show(current + 1); };
+document.getElementById("outcome").onchange = render;
+show(1);
+</script>
+</body>
+</html>
+"""
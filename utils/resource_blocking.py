@@ -0,0 +1,197 @@
+"""
+Resource-blocking profiles: named lists of URL patterns (TestData.RESOURCE_PROFILES) that Chromium is told
+not to load through CDP Network.setBlockedURLs, so tests skip the analytics, ads, fonts and images they
+never look at. Pick one per test with @pytest.mark.resource_profile("functional-minimal") or for the run
+with --resource_profile.
+
+Blocked requests show up in the network capture as failed with blockedReason "inspector"; navigation_savings()
+counts them per page load and estimates the bytes saved from what the same URLs (or resource types) weighed
+when they were loaded unblocked. A blocked URL is never downloaded, so those sizes come from full-fidelity
+loads: earlier in the session, or in an earlier run (the sizes are kept in TestData.RESOURCE_SIZES_FILE).
+Without any, the report says the saving is unknown rather than showing 0.
+"""
+import json
+import logging
+import os
+from collections import OrderedDict
+
+from config.config import TestData
+
+BLOCKED_BY_PROFILE = "inspector"  # CDP blockedReason of a URL matched by Network.setBlockedURLs
+
+
+class ResourceBlocker:
+    """Applies profiles to one driver; re-applying the active profile costs nothing."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.profile = None
+        self.supported = hasattr(driver, "execute_cdp_cmd")
+
+    def apply(self, profile):
+        if profile not in TestData.RESOURCE_PROFILES:
+            raise ValueError(f"Unknown resource profile {profile!r}, expected one of "
+                             f"{', '.join(TestData.RESOURCE_PROFILES)}")
+        if profile == self.profile:
+            return profile
+        patterns = TestData.RESOURCE_PROFILES[profile]
+        if self.supported:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        elif patterns:
+            logging.warning(f"Resource profile {profile!r} needs a Chromium browser; nothing is blocked")
+        self.profile = profile
+        return profile
+
+
+def resource_blocker(driver):
+    """The blocker attached to driver, created on first use."""
+    blocker = getattr(driver, "resource_blocker", None)
+    if blocker is None:
+        blocker = ResourceBlocker(driver)
+        driver.resource_blocker = blocker
+    return blocker
+
+
+class SizeBook:
+    """Transfer sizes of the requests loaded so far: by URL (the most recent max_urls) and averaged by type."""
+
+    def __init__(self, max_urls=5000):
+        self.max_urls = max_urls
+        self._by_url = OrderedDict()
+        self._by_type = {}  # resource type -> [total bytes, requests]
+        self.learned = 0
+
+    def learn(self, entry):
+        if entry.error is not None or entry.from_cache or not entry.encoded_bytes:
+            return
+        self._by_url[entry.url] = entry.encoded_bytes
+        self._by_url.move_to_end(entry.url)
+        if len(self._by_url) > self.max_urls:
+            self._by_url.popitem(last=False)
+        totals = self._by_type.setdefault(entry.resource_type, [0, 0])
+        totals[0] += entry.encoded_bytes
+        totals[1] += 1
+        self.learned += 1
+
+    def estimate(self, entry):
+        """Bytes the request would have transferred, or None when nothing like it was loaded yet."""
+        if entry.url in self._by_url:
+            return self._by_url[entry.url]
+        totals = self._by_type.get(entry.resource_type)
+        return totals[0] // totals[1] if totals else None
+
+    def load(self, path):
+        """Seeds the book with the sizes saved by an earlier run; a missing or unreadable file is ignored."""
+        try:
+            with open(path, 'r', encoding='utf-8') as sizes_file:
+                saved = json.load(sizes_file)
+        except (OSError, ValueError):
+            return self
+        for url, size in saved.get("urls", {}).items():
+            self._by_url.setdefault(url, size)
+        for resource_type, totals in saved.get("types", {}).items():
+            self._by_type.setdefault(resource_type, totals)
+        return self
+
+    def save(self, path):
+        """Merges what this process learned into the file (xdist workers each add their own loads)."""
+        saved = SizeBook(self.max_urls).load(path)
+        for url, size in self._by_url.items():
+            saved._by_url[url] = size
+            saved._by_url.move_to_end(url)
+        while len(saved._by_url) > self.max_urls:
+            saved._by_url.popitem(last=False)
+        saved._by_type.update(self._by_type)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as sizes_file:
+            json.dump({"urls": dict(saved._by_url), "types": saved._by_type}, sizes_file)
+        os.replace(temp_path, path)
+        return path
+
+
+size_book = SizeBook()
+
+
+def navigation_savings(entries, sizes=None):
+    """
+    Groups captured requests by the page load they belong to:
+    [{"url", "requests", "bytes", "blocked", "bytes_saved", "unsized"}, ...] in load order, where blocked
+    requests with no size estimate are counted in "unsized" instead of "bytes_saved".
+    """
+    sizes = sizes or size_book
+    for entry in entries:
+        sizes.learn(entry)
+    navigations = OrderedDict()
+    for entry in entries:
+        navigation = navigations.setdefault(entry.loader_id, {
+            "url": None, "requests": 0, "bytes": 0, "blocked": 0, "bytes_saved": 0, "unsized": 0})
+        if entry.request_id == entry.loader_id:
+            navigation["url"] = entry.url
+        if entry.blocked_reason == BLOCKED_BY_PROFILE:
+            navigation["blocked"] += 1
+            size = sizes.estimate(entry)
+            if size is None:
+                navigation["unsized"] += 1
+            else:
+                navigation["bytes_saved"] += size
+        else:
+            navigation["requests"] += 1
+            navigation["bytes"] += entry.encoded_bytes
+    for navigation in navigations.values():
+        navigation["url"] = navigation["url"] or "(page loaded before the test)"
+    return list(navigations.values())
+
+
+def savings_html(navigations):
+    """The per-navigation savings as an HTML table for a pytest-html extra."""
+    body = "".join(
+        f"<tr><td>{_escape(row['url'])}</td><td>{row['requests']}</td><td>{row['bytes'] / 1024:.1f}</td>"
+        f"<td>{row['blocked']}</td><td>{_saved_kb(row)}</td></tr>"
+        for row in navigations)
+    return ("<table class=\"resource-savings\"><tr><th>Navigation</th><th>Requests</th><th>KB loaded</th>"
+            f"<th>Requests blocked</th><th>KB saved (est.)</th></tr>{body}</table>")
+
+
+class BlockingStats:
+    """Session totals per profile, from the per-test savings."""
+
+    def __init__(self):
+        self.profiles = {}
+
+    def add(self, profile, navigations):
+        totals = self.profiles.setdefault(profile, {"tests": 0, "navigations": 0, "requests": 0, "bytes": 0,
+                                                    "blocked": 0, "bytes_saved": 0, "unsized": 0})
+        totals["tests"] += 1
+        totals["navigations"] += sum(1 for row in navigations if row["requests"] or row["blocked"])
+        for name in ("requests", "bytes", "blocked", "bytes_saved", "unsized"):
+            totals[name] += sum(row[name] for row in navigations)
+
+    def describe(self):
+        return [f"{profile}: {totals['tests']} test(s), {totals['navigations']} navigation(s), "
+                f"{totals['requests']} request(s) / {totals['bytes'] / 1024 ** 2:.1f} MB loaded, "
+                f"{totals['blocked']} blocked / {_saved_mb(totals)}"
+                for profile, totals in self.profiles.items()]
+
+
+def _saved_mb(totals):
+    if totals["unsized"] and not totals["bytes_saved"]:
+        return ("bytes saved unknown (the blocked resources were never loaded unblocked; "
+                "run once with --resource_profile full-fidelity to learn their sizes)")
+    return (f"~{totals['bytes_saved'] / 1024 ** 2:.1f} MB saved"
+            + (f" ({totals['unsized']} of unknown size)" if totals["unsized"] else ""))
+
+
+def _unsized(row):
+    return f" (+{row['unsized']} of unknown size)" if row["unsized"] else ""
+
+
+def _saved_kb(row):
+    if row["unsized"] and not row["bytes_saved"]:
+        return "unknown"
+    return f"{row['bytes_saved'] / 1024:.1f}{_unsized(row)}"
+
+
+def _escape(text):
+    return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
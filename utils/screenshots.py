@@ -0,0 +1,114 @@
+"""
+Failure screenshots that do not stall the run: captured through CDP as JPEG/WebP (optionally clipped to one
+element), then decoded and written by a background thread pool. A frame identical to the previous one links
+the earlier file instead of writing a copy, and a per-process size cap stops runaway report folders.
+"""
+import base64
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+from config.config import TestData
+
+EXTENSIONS = {"jpeg": ".jpg", "webp": ".webp", "png": ".png"}
+
+ELEMENT_RECT_SCRIPT = """
+const element = document.querySelector(arguments[0]);
+if (!element) { return null; }
+const rect = element.getBoundingClientRect();
+return [rect.left + window.scrollX, rect.top + window.scrollY, rect.width, rect.height];
+"""
+
+
+class ScreenshotWriter:
+    """
+    Args:
+        folder (Path | str): Where the files go (the worker's screenshot folder).
+        image_format (str): "jpeg", "webp" or "png"; browsers without CDP always give PNG.
+        quality (int): JPEG/WebP quality, 0-100.
+        max_total_mb (float): Screenshots stop once this many MB were written by this process.
+    """
+
+    def __init__(self, folder, image_format=None, quality=None, max_total_mb=None, workers=None):
+        self.folder = Path(folder)
+        self.image_format = image_format or TestData.SCREENSHOT_FORMAT
+        self.quality = quality if quality is not None else TestData.SCREENSHOT_QUALITY
+        self.max_bytes = (max_total_mb if max_total_mb is not None else TestData.SCREENSHOT_MAX_TOTAL_MB) * 1024 ** 2
+        self.bytes_written = 0
+        self.saved = 0
+        self.duplicates = 0
+        self.skipped_over_cap = 0
+        self._last = None  # (digest, path) of the previous frame
+        self._lock = threading.Lock()
+        self._pending = []
+        self._executor = ThreadPoolExecutor(max_workers=workers or TestData.SCREENSHOT_WORKERS,
+                                            thread_name_prefix="screenshot")
+
+    def capture(self, driver, name, clip_selector=None):
+        """
+        Grabs the current page (or the element matching clip_selector) and queues it for writing.
+
+        Returns:
+            Path | None: Where the screenshot will be once written (the previous file for a repeated frame),
+            or None when capturing failed or the size cap was reached.
+        """
+        try:
+            data, image_format = self._grab(driver, clip_selector or TestData.SCREENSHOT_CLIP_SELECTOR)
+        except Exception as e:
+            print(f"Error capturing screenshot: {e}")
+            return None
+
+        digest = hashlib.sha1(data.encode("ascii")).hexdigest()
+        size = len(data) * 3 // 4  # decoded size of the base64 payload
+        with self._lock:
+            if self._last is not None and self._last[0] == digest:
+                self.duplicates += 1
+                return self._last[1]
+            if self.bytes_written + size > self.max_bytes:
+                if not self.skipped_over_cap:
+                    logging.warning(f"Screenshot size cap of {self.max_bytes // 1024 ** 2} MB reached; "
+                                    f"no more screenshots this run")
+                self.skipped_over_cap += 1
+                return None
+            path = self.folder / f"{name}{EXTENSIONS[image_format]}"
+            self.bytes_written += size
+            self.saved += 1
+            self._last = (digest, path)
+            self._pending.append(self._executor.submit(self._write, path, data))
+        return path
+
+    def flush(self, timeout=None):
+        """Waits until every queued screenshot is on disk."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        wait(pending, timeout=timeout)
+
+    def close(self):
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def describe(self):
+        return (f"{self.saved} saved ({self.bytes_written / 1024 ** 2:.1f} MB, {self.image_format}), "
+                f"{self.duplicates} duplicate frame(s) linked, {self.skipped_over_cap} skipped over the size cap")
+
+    def _grab(self, driver, clip_selector):
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return driver.get_screenshot_as_base64(), "png"
+        params = {"format": self.image_format, "captureBeyondViewport": bool(clip_selector)}
+        if self.image_format != "png":
+            params["quality"] = self.quality
+        if clip_selector:
+            rect = driver.execute_script(ELEMENT_RECT_SCRIPT, clip_selector)
+            if rect:
+                params["clip"] = {"x": rect[0], "y": rect[1], "width": rect[2], "height": rect[3], "scale": 1}
+        return driver.execute_cdp_cmd("Page.captureScreenshot", params)["data"], self.image_format
+
+    @staticmethod
+    def _write(path, data):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(base64.b64decode(data))
+        except Exception as e:
+            logging.error(f"Could not write screenshot {path}: {e}")
@@ -0,0 +1,78 @@
+"""
+Measures import and collection time in fresh interpreters and fails when they go over budget.
+
+    python -m utils.startup_benchmark
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+from config.config import TestData
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+lazy = [name for name in {lazy!r} if name in sys.modules]
+print(json.dumps({{"seconds": elapsed, "eager_heavy_modules": lazy}}))
+"""
+
+
+def measure_import(module, lazy_modules=None):
+    """
+    Imports module in a new interpreter.
+
+    Returns:
+        dict: {"seconds": import time, "eager_heavy_modules": heavy modules it pulled in at import}
+    """
+    lazy_modules = TestData.LAZY_MODULES if lazy_modules is None else lazy_modules
+    probe = IMPORT_PROBE.format(module=module, lazy=list(lazy_modules))
+    result = subprocess.run([sys.executable, "-c", probe], cwd=TestData.ROOT_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure_collection(args=()):
+    """Wall time of `pytest --collect-only` in a new interpreter."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-m", "pytest", "--collect-only", "-q", *args],
+                            cwd=TestData.ROOT_DIR, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode not in (0, 5):  # 5: no tests collected
+        raise RuntimeError(f"Collection failed:\n{result.stdout}\n{result.stderr}")
+    return elapsed
+
+
+def run(modules=None, collect=True):
+    """Returns (report lines, list of budget violations)."""
+    lines, violations = [], []
+    for module in modules or TestData.STARTUP_MODULES:
+        measurement = measure_import(module)
+        lines.append(f"import {module}: {measurement['seconds']:.3f}s")
+        if measurement["seconds"] > TestData.IMPORT_BUDGET_SECONDS:
+            violations.append(f"import {module} took {measurement['seconds']:.3f}s "
+                              f"(budget {TestData.IMPORT_BUDGET_SECONDS}s)")
+        if measurement["eager_heavy_modules"]:
+            violations.append(f"import {module} eagerly loaded {', '.join(measurement['eager_heavy_modules'])}")
+    if collect:
+        seconds = measure_collection()
+        lines.append(f"pytest --collect-only: {seconds:.3f}s")
+        if seconds > TestData.COLLECT_BUDGET_SECONDS:
+            violations.append(f"collection took {seconds:.3f}s (budget {TestData.COLLECT_BUDGET_SECONDS}s)")
+    return lines, violations
+
+
+def main():
+    lines, violations = run(collect=os.getenv("STARTUP_SKIP_COLLECT") is None)
+    print("\n".join(lines))
+    for violation in violations:
+        print(f"OVER BUDGET: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
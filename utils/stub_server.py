@@ -0,0 +1,111 @@
+"""Local stand-in HTTP server for exercising the api helpers without a real backend."""
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubResponse:
+    def __init__(self, status=200, body=None, headers=None, delay=0.0):
+        self.status = status
+        self.body = body if body is not None else {}
+        self.headers = headers or {}
+        self.delay = delay
+
+    def encoded_body(self):
+        if isinstance(self.body, bytes):
+            return self.body
+        if isinstance(self.body, str):
+            return self.body.encode("utf-8")
+        return json.dumps(self.body).encode("utf-8")
+
+
+class StubServer:
+    """
+    Serves canned responses on 127.0.0.1 from a background thread.
+
+    Routes map "METHOD /path" (or "/path" for any method) to a StubResponse, a list of StubResponses
+    served in turn (the last one repeats), or a callable(request) returning a StubResponse.
+    Every request is recorded in .requests as {"method", "path", "headers", "body"}.
+
+    Example:
+        with StubServer({"/api/users": StubResponse(body={"data": []})}) as server:
+            GetApiData.execute_get_request(server.url("/api/users"))
+    """
+
+    def __init__(self, routes=None):
+        self.routes = {}
+        self.requests = []
+        self._lock = threading.Lock()
+        for route, response in (routes or {}).items():
+            self.add_route(route, response)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def add_route(self, route, response):
+        self.routes[route] = deque(response) if isinstance(response, list) else response
+
+    def url(self, path=""):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}{path}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _resolve(self, request):
+        path = request["path"].split("?", 1)[0]
+        route = self.routes.get(f"{request['method']} {path}", self.routes.get(path))
+        if route is None:
+            return StubResponse(404, {"error": f"no stub for {request['method']} {path}"})
+        if callable(route):
+            return route(request)
+        if isinstance(route, deque):
+            with self._lock:
+                return route.popleft() if len(route) > 1 else route[0]
+        return route
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like a real backend
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                request = {"method": self.command, "path": self.path, "headers": dict(self.headers),
+                           "body": self.rfile.read(length) if length else b""}
+                with stub._lock:
+                    stub.requests.append(request)
+                response = stub._resolve(request)
+                if response.delay:
+                    time.sleep(response.delay)
+                body = response.encoded_body()
+                self.send_response(response.status)
+                headers = {"Content-Type": "application/json", **response.headers}
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _serve
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,118 @@
+"""Per-test timing records shared by the page helpers and the conftest hooks."""
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TimingRecorder:
+    """
+    Collects what the current test spent its time on: "wait" for condition waits, "sleep" for fixed sleeps.
+    conftest starts a new test with start_test() and reads the records back for the report.
+    """
+
+    def __init__(self):
+        self.nodeid = None
+        self.records = []
+        self._local = threading.local()  # wait depth per thread: a background wait must not hide the test's sleeps
+        self._real_sleep = None
+
+    def start_test(self, nodeid):
+        self.nodeid = nodeid
+        self.records = []
+
+    def record(self, category, name, seconds, **details):
+        self.records.append({"category": category, "name": name, "seconds": seconds, **details})
+
+    def for_current_test(self):
+        """record() bound to the current test, for work that may finish on another thread after start_test()."""
+        records = self.records
+
+        def record(category, name, seconds, **details):
+            records.append({"category": category, "name": name, "seconds": seconds, **details})
+        return record
+
+    @contextmanager
+    def measure(self, category, name, **details):
+        start = time.perf_counter()
+        try:
+            yield details
+        finally:
+            self.record(category, name, time.perf_counter() - start, **details)
+
+    @contextmanager
+    def waiting(self, name, **details):
+        """Times a condition wait. Sleeps inside it are polling, not fixed sleeps, so they are not counted."""
+        details.setdefault("outcome", "met")
+        self._local.wait_depth = self._wait_depth + 1
+        start = time.perf_counter()
+        try:
+            yield details
+        except Exception as e:
+            details["outcome"] = type(e).__name__
+            raise
+        finally:
+            self._local.wait_depth -= 1
+            self.record("wait", name, time.perf_counter() - start, **details)
+
+    @property
+    def in_wait(self):
+        """Whether the calling thread is inside waiting()."""
+        return self._wait_depth > 0
+
+    @property
+    def _wait_depth(self):
+        return getattr(self._local, "wait_depth", 0)
+
+    def track_sleeps(self, project_root=PROJECT_ROOT):
+        """
+        Wraps time.sleep so every fixed sleep the test thread makes from project code is recorded with its call
+        site. Sleeps of libraries (WebDriverWait polling, retries, ...) are not fixed sleeps of ours and are left
+        alone. untrack_sleeps() puts the original back.
+        """
+        if self._real_sleep is not None:
+            return
+        real_sleep = self._real_sleep = time.sleep
+        project_root = os.path.join(os.path.abspath(project_root), "")
+
+        def sleep(seconds):
+            if self._wait_depth or threading.current_thread() is not threading.main_thread():
+                return real_sleep(seconds)
+            caller = sys._getframe(1)
+            if not _is_project_file(caller.f_code.co_filename, project_root):
+                return real_sleep(seconds)
+            start = time.perf_counter()
+            try:
+                return real_sleep(seconds)
+            finally:
+                self.record("sleep", f"{os.path.basename(caller.f_code.co_filename)}:{caller.f_lineno}",
+                            time.perf_counter() - start)
+
+        sleep.tracked = True
+        time.sleep = sleep
+
+    def untrack_sleeps(self):
+        if self._real_sleep is not None:
+            time.sleep = self._real_sleep
+            self._real_sleep = None
+
+    def totals(self):
+        """Returns {category: {"count": n, "seconds": total}} for the current test."""
+        totals = {}
+        for record in self.records:
+            total = totals.setdefault(record["category"], {"count": 0, "seconds": 0.0})
+            total["count"] += 1
+            total["seconds"] += record["seconds"]
+        return totals
+
+
+def _is_project_file(file_name, project_root):
+    path = os.path.abspath(file_name)
+    return path.startswith(project_root) and not any(
+        part in ("site-packages", "dist-packages") for part in path[len(project_root):].split(os.sep))
+
+
+timings = TimingRecorder()
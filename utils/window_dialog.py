@@ -1,16 +1,37 @@
-import time
-
-from pywinauto import Application
+from config.config import TestData
+from utils.timing import timings
 
 
 class window:
+    @staticmethod
+    def wait_for_dialog(title, timeout=TestData.DOWNLOAD_WAIT_TIME):
+        """Waits until the native dialog (e.g. 'Save As', 'Open') is visible and returns it."""
+        from pywinauto import Desktop  # Windows-only, so imported when a dialog is actually handled
+
+        dialog = Desktop(backend="win32").window(title=title, class_name="#32770")
+        with timings.waiting(f"dialog '{title}' visible", mode="local"):
+            dialog.wait("visible", timeout=timeout)
+        return dialog
+
+    @staticmethod
+    def wait_for_dialog_closed(title, timeout=TestData.DOWNLOAD_WAIT_TIME):
+        """Waits until the native dialog has been closed."""
+        from pywinauto import Desktop
+
+        dialog = Desktop(backend="win32").window(title=title, class_name="#32770")
+        with timings.waiting(f"dialog '{title}' closed", mode="local"):
+            dialog.wait_not("visible", timeout=timeout)
+
     @staticmethod
     def save_download_file(file_name,directory_url):
-        # Connect to the application (replace 'app_name' with your application)
+        from pywinauto import Application
+
+        # Wait for the dialog instead of sleeping, then connect to it
+        window.wait_for_dialog('Save As')
         app = Application().connect(title='Save As', class_name="#32770")
 
         # Get the Save As dialog
-        save_as_dialog = app.window(titlee='Save As', class_name="#32770")
+        save_as_dialog = app.window(title='Save As', class_name="#32770")
 
         # Uncomment the following lines to inspect dialog controls - here you can get the complete attribute tree
         # save_as_dialog.print_control_identifiers()
@@ -29,5 +50,5 @@ class window:
         save_button = save_as_dialog.child_window(title="&Save", class_name="Button")
         save_button.click()
 
-        # Optionally, add a small delay to observe the action
-        time.sleep(5)
\ No newline at end of file
+        # Saving is done once the dialog has closed
+        window.wait_for_dialog_closed('Save As')
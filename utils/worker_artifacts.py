@@ -0,0 +1,63 @@
+"""Per-process artifact folders so pytest-xdist workers never write to the same files."""
+import os
+import shutil
+from pathlib import Path
+
+MASTER = "master"
+
+
+def get_worker_id(config=None):
+    """Returns the xdist worker id (gw0, gw1, ...) or 'master' for the controller and serial runs."""
+    if config is not None and hasattr(config, "workerinput"):
+        return config.workerinput["workerid"]
+    return os.getenv("PYTEST_XDIST_WORKER", MASTER)
+
+
+class WorkerArtifacts:
+    """
+    Report, log, screenshot and download folders of one process.
+    Serial runs and the xdist controller use the report folder itself, workers get reports/workers/<id>.
+    """
+
+    def __init__(self, reports_dir, worker_id=MASTER, download_root=None):
+        self.worker_id = worker_id
+        self.reports_dir = Path(reports_dir)
+        self.root = self.reports_dir if worker_id == MASTER else self.reports_dir / "workers" / worker_id
+        self.log_file = self.root / "logs" / "test_log.jsonl"
+        self.screenshot_dir = self.root / "screenshots"
+        download_root = Path(download_root) if download_root else self.root / "downloads"
+        self.download_dir = download_root if worker_id == MASTER else download_root / worker_id
+
+    def create(self):
+        """Creates the folders and empties the log, which a reused report folder still holds from the last run."""
+        for folder in (self.log_file.parent, self.screenshot_dir, self.download_dir):
+            folder.mkdir(parents=True, exist_ok=True)
+        self.log_file.write_text("", encoding='utf-8')
+        return self
+
+    def relative_to_report(self, path):
+        """Path of an artifact as the HTML report in reports_dir has to link it."""
+        return Path(os.path.relpath(path, self.reports_dir)).as_posix()
+
+
+def clear_worker_folders(reports_dir):
+    """Removes the worker folders of earlier runs; the controller calls it before xdist starts this run's workers."""
+    shutil.rmtree(Path(reports_dir) / "workers", ignore_errors=True)
+
+
+def merge_worker_logs(reports_dir, merged_log, worker_ids=None):
+    """
+    Appends the worker logs to the controller log; each JSON line already names its worker.
+    With worker_ids only the logs of those workers (the ones this run started) are merged.
+    """
+    worker_logs = sorted(Path(reports_dir).glob("workers/*/logs/test_log.jsonl"))
+    if worker_ids is not None:
+        worker_logs = [log for log in worker_logs if log.parent.parent.name in worker_ids]
+    if not worker_logs:
+        return None
+    with open(merged_log, 'a', encoding='utf-8') as merged:
+        for worker_log in worker_logs:
+            content = worker_log.read_text(encoding='utf-8')
+            if content:
+                merged.write(content if content.endswith("\n") else content + "\n")
+    return merged_log